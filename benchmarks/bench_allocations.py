@@ -0,0 +1,101 @@
+"""
+measure the memory allocated and the garbage collections triggered while objects
+with many attributes are saved and loaded. One meta data object and one data
+field are created for each attribute of each object that is written or read
+
+run with: PYTHONPATH=src python benchmarks/bench_allocations.py
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from bench_utils import empty_like, make_wide_saveable, run_in_tmp_dir
+
+from saveables.backends import get_file_class
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.saveable.saveable import Saveable
+
+extensions = {"hdf5": ".h5", "sqlite3": ".sqlite3", "xml": ".xml", "binary": ".svb"}
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, float, int]:
+    """
+    run func once and measure its run time, the peak of memory allocated by
+    python while it runs and the number of garbage collections it triggers
+
+    Args:
+        func (Callable): function to be measured
+
+    Returns:
+        tuple[float, float, int]: run time in seconds, peak of allocated memory
+                                  in MiB and number of collections
+    """
+    gc.collect()
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func()
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+    return duration, peak / 2**20, collections
+
+
+def report_allocations(title: str, rows: list[tuple[str, float, float, int]]) -> None:
+    print(f"\n{title}")
+    for label, duration, peak, collections in rows:
+        print(
+            f"  {label:<40} {duration * 1e3:10.2f} ms {peak:8.2f} MiB "
+            f"{collections:6d} collections"
+        )
+
+
+def bench_fields(n_objects: int = 10_000, n_fields: int = 10) -> None:
+    """
+    create and hold the data fields of many objects of the same class
+    """
+    objects = [make_wide_saveable(n_fields, [1, 2, 3])]
+    objects += [empty_like(objects[0]) for _ in range(n_objects - 1)]
+    rows = [
+        (
+            f"iter_fields ({n_objects} objects, {n_fields} fields)",
+            *measure(lambda: [list(obj.iter_fields()) for obj in objects]),
+        )
+    ]
+    report_allocations("create data fields", rows)
+
+
+def bench_save_load(tmp: Path, n_fields: int = 2_000) -> None:
+    """
+    save and load objects with many small attributes with each format
+    """
+    rows: list[tuple[str, float, float, int]] = []
+    saveable = make_wide_saveable(n_fields, [1, 2, 3, 4])
+    for format, extension in extensions.items():
+        file_class = get_file_class(format)
+        path = tmp / f"allocations{extension}"
+
+        def save(saveable: Saveable = saveable) -> None:
+            with file_class(path, write_mode) as f:
+                f.save(saveable)
+
+        def load(loaded: Saveable = empty_like(saveable)) -> None:
+            with file_class(path, read_mode) as f:
+                f.load(loaded)
+
+        rows.append((f"{format} save ({n_fields} fields)", *measure(save)))
+        rows.append((f"{format} load ({n_fields} fields)", *measure(load)))
+    report_allocations("save and load objects with many small attributes", rows)
+
+
+if __name__ == "__main__":
+    bench_fields()
+    run_in_tmp_dir(bench_save_load)
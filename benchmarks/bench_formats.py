@@ -0,0 +1,125 @@
+"""
+compare save and load times of all file formats, and of saving into and loading
+from bytes instead of files
+
+run with: PYTHONPATH=src python benchmarks/bench_formats.py
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from bench_utils import report, run_in_tmp_dir, timeit
+
+from saveables.backends import get_file_class
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.saveable.saveable import Saveable
+
+extensions = {"xml": ".xml", "hdf5": ".h5", "sqlite3": ".sqlite3", "binary": ".svb"}
+
+
+@dataclass
+class Sensor(Saveable):  # type: ignore[misc]
+    name: str = ""
+    gain: float = 0.0
+    enabled: bool = False
+    samples: list[float] = field(default_factory=list)
+
+
+@dataclass
+class Checkpoint(Saveable):  # type: ignore[misc]
+    step: int = 0
+    loss: float = 0.0
+    tag: str = ""
+    labels: list[str] = field(default_factory=list)
+    counts: dict[str, int] = field(default_factory=dict)
+    sensor: Sensor = field(default_factory=Sensor)
+
+
+def make_checkpoint(n_elements: int) -> Checkpoint:
+    """
+    create checkpoint whose iterables have n_elements elements
+    """
+    return Checkpoint(
+        step=42,
+        loss=0.125,
+        tag="run-1",
+        labels=[f"label_{i}" for i in range(n_elements)],
+        counts={f"key_{i}": i for i in range(n_elements)},
+        sensor=Sensor("probe", 1.5, True, [i * 0.5 for i in range(n_elements)]),
+    )
+
+
+def bench_formats(tmp: Path, n_elements: int = 1_000) -> None:
+    """
+    save and load a checkpoint with every format
+    """
+    checkpoint = make_checkpoint(n_elements)
+    rows: list[tuple[str, float]] = []
+    sizes: list[tuple[str, float]] = []
+    for format, extension in extensions.items():
+        file_class = get_file_class(format)
+        path = tmp / f"checkpoint{extension}"
+
+        def save() -> None:
+            if path.exists():
+                path.unlink()
+            with file_class(path, write_mode) as f:
+                f.save(checkpoint)
+
+        def load() -> None:
+            loaded = Checkpoint()
+            with file_class(path, read_mode) as f:
+                f.load(loaded)
+            if loaded != checkpoint:
+                raise RuntimeError(f"{format} did not restore the checkpoint")
+
+        rows.append((f"{format} save", timeit(save)))
+        rows.append((f"{format} load", timeit(load)))
+        sizes.append((format, path.stat().st_size))
+    report(f"checkpoint with {n_elements} elements per iterable", rows)
+    report("file size", sizes, unit="kB", scale=1e-3)
+
+
+def bench_bytes(tmp: Path, n_elements: int = 1_000) -> None:
+    """
+    serialize a checkpoint into bytes, as for sending it to another process,
+    through a temporary file that is read back and deleted and with to_bytes,
+    and deserialize it the same ways
+    """
+    checkpoint = make_checkpoint(n_elements)
+    rows: list[tuple[str, float]] = []
+    for format, extension in extensions.items():
+        file_class = get_file_class(format)
+        path = tmp / f"message{extension}"
+
+        def through_file() -> bytes:
+            with file_class(path, write_mode) as f:
+                f.save(checkpoint)
+            data = path.read_bytes()
+            path.unlink()
+            return data
+
+        def from_file(data: bytes) -> None:
+            path.write_bytes(data)
+            with file_class(path, read_mode) as f:
+                f.load(Checkpoint())
+            path.unlink()
+
+        def to_bytes() -> bytes:
+            return file_class.to_bytes(checkpoint)
+
+        def from_bytes(data: bytes) -> None:
+            file_class.from_bytes(data, Checkpoint())
+
+        data = to_bytes()
+        rows.append((f"{format} save through file", timeit(through_file)))
+        rows.append((f"{format} to_bytes", timeit(to_bytes)))
+        rows.append((f"{format} load through file", timeit(lambda: from_file(data))))
+        rows.append((f"{format} from_bytes", timeit(lambda: from_bytes(data))))
+    report(f"bytes of checkpoint with {n_elements} elements per iterable", rows)
+
+
+if __name__ == "__main__":
+    run_in_tmp_dir(bench_formats, bench_bytes)
@@ -0,0 +1,139 @@
+"""
+benchmarks for the hdf5 format
+
+run with: PYTHONPATH=src python benchmarks/bench_hdf5.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from bench_utils import (empty_like, make_wide_saveable, report,
+                         run_in_tmp_dir, timeit)
+
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.hdf5_format.h5_file import H5File
+from saveables.hdf5_format.h5_filenode import H5FileNode
+from saveables.hdf5_format.h5_profile import paged_profile
+from saveables.saveable.saveable import Saveable
+
+
+def bench_meta_data_layout(tmp: Path, n_fields: int = 10_000) -> None:
+    """
+    compare one attribute per meta data field with packed meta data
+    on an object with many small datasets
+    """
+    saveable = make_wide_saveable(n_fields)
+    rows: list[tuple[str, float]] = []
+    for pack_meta_data in (False, True):
+        path = tmp / f"meta_{pack_meta_data}.h5"
+
+        def save() -> None:
+            with H5File(path, write_mode, pack_meta_data=pack_meta_data) as f:
+                f.save(saveable)
+
+        def load() -> None:
+            loaded: Saveable = empty_like(saveable)
+            with H5File(path, read_mode) as f:
+                f.load(loaded)
+
+        label = "packed" if pack_meta_data else "per field"
+        rows.append((f"save ({label})", timeit(save)))
+        rows.append((f"load ({label})", timeit(load)))
+    report(f"meta data layout, {n_fields} fields", rows)
+
+
+def bench_wide_group(tmp: Path, n_members: int = 10_000) -> None:
+    """
+    iterate a group with many members and list its children
+    """
+    saveable = make_wide_saveable(n_members)
+    path = tmp / "wide.h5"
+    with H5File(path, write_mode) as f:
+        f.save(saveable)
+
+    def iterate() -> None:
+        with H5File(path, read_mode) as f:
+            if not isinstance(f.root, H5FileNode):
+                raise TypeError("unexpected root node")
+            for _ in f.root:
+                pass
+            f.root.list_children()
+
+    def load() -> None:
+        loaded: Saveable = empty_like(saveable)
+        with H5File(path, read_mode) as f:
+            f.load(loaded)
+
+    rows = [("iterate + list_children", timeit(iterate)), ("load", timeit(load))]
+    report(f"wide group, {n_members} members", rows)
+
+
+def make_tree(n_objects: int, n_fields: int) -> Saveable:
+    """
+    create a saveable that holds n_objects distinct saveables with n_fields
+    float attributes each
+    """
+    child = make_wide_saveable(n_fields, 1.5)
+    tree = make_wide_saveable(n_objects)
+    for i in range(n_objects):
+        setattr(tree, f"field_{i}", empty_like(child))
+    return tree
+
+
+def bench_many_fields(
+    tmp: Path, n_fields: int = 10_000, n_objects: int = 200, n_tree_fields: int = 50
+) -> None:
+    """
+    compare the page buffered profile and packed scalars on an object with many
+    int attributes and on many objects with many float attributes, which are
+    loaded as dictionaries
+    """
+    cases: dict[str, dict[str, Any]] = {
+        "default": {},
+        "paged_profile": {"profile": paged_profile},
+        "pack_scalars": {"pack_scalars": True},
+        "paged_profile + pack_scalars": {
+            "profile": paged_profile,
+            "pack_scalars": True,
+        },
+    }
+    wide = make_wide_saveable(n_fields)
+    tree = make_tree(n_objects, n_tree_fields)
+    rows: list[tuple[str, float]] = []
+    sizes: list[tuple[str, float]] = []
+    for label, kwargs in cases.items():
+        path = tmp / "many_fields.h5"
+        tree_path = tmp / "tree.h5"
+
+        def save() -> None:
+            with H5File(path, write_mode, **kwargs) as f:
+                f.save(wide)
+
+        def load() -> None:
+            loaded: Saveable = empty_like(wide)
+            with H5File(path, read_mode, **kwargs) as f:
+                f.load(loaded)
+
+        def save_tree() -> None:
+            with H5File(tree_path, write_mode, **kwargs) as f:
+                f.save(tree)
+
+        def load_tree() -> None:
+            with H5File(tree_path, read_mode, **kwargs) as f:
+                f.load_as_dict()
+
+        rows.append((f"save {n_fields} fields ({label})", timeit(save)))
+        rows.append((f"load {n_fields} fields ({label})", timeit(load)))
+        tree_label = f"{n_objects} x {n_tree_fields} fields ({label})"
+        rows.append((f"save {tree_label}", timeit(save_tree)))
+        rows.append((f"load {tree_label}", timeit(load_tree)))
+        sizes.append((f"{n_fields} fields ({label})", path.stat().st_size))
+        sizes.append((tree_label, tree_path.stat().st_size))
+    report("page buffering and packed scalars", rows)
+    report("file size", sizes, unit="KiB", scale=2**-10)
+
+
+if __name__ == "__main__":
+    run_in_tmp_dir(bench_meta_data_layout, bench_wide_group, bench_many_fields)
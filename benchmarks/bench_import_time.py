@@ -0,0 +1,70 @@
+"""
+measure the import time of saveables and its format backends with
+python -X importtime
+
+run with: PYTHONPATH=src python benchmarks/bench_import_time.py
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+from bench_utils import report
+
+# import statements to measure and whether h5py may be imported by them
+cases = [
+    ("import saveables", False),
+    ("import saveables; saveables.get_file_class('xml')", False),
+    ("import saveables; saveables.get_file_class('sqlite3')", False),
+    ("import saveables; saveables.get_file_class('hdf5')", True),
+]
+
+
+def measure(statement: str) -> tuple[float, set[str]]:
+    """
+    run statement in a fresh interpreter with -X importtime
+
+    Args:
+        statement (str): python statement that imports modules
+
+    Returns:
+        tuple[float, set[str]]: cumulative import time in seconds of all top
+                                level imports after interpreter startup and
+                                names of the imported top level packages
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules: set[str] = set()
+    startup_done = False
+    pattern = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+    for line in result.stderr.splitlines():
+        match = pattern.match(line)
+        if match is None:
+            continue
+        cumulative, indent, module = match.groups()
+        if not startup_done:
+            # imports of the interpreter startup finish with module site
+            startup_done = module == "site" and len(indent) == 1
+            continue
+        modules.add(module.split(".")[0])
+        if len(indent) == 1:
+            # only count top level imports, nested ones are part of the cumulative
+            total_us += int(cumulative)
+    return total_us * 1e-6, modules
+
+
+if __name__ == "__main__":
+    rows: list[tuple[str, float]] = []
+    for statement, h5py_allowed in cases:
+        seconds, modules = measure(statement)
+        rows.append((statement, seconds))
+        if "h5py" in modules and not h5py_allowed:
+            raise RuntimeError(f"'{statement}' imports h5py")
+    report("import time", rows)
@@ -0,0 +1,91 @@
+"""
+helpers shared by the benchmark scripts in this folder
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from dataclasses import field, make_dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from saveables.saveable.saveable import Saveable
+
+
+def timeit(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    run func several times and return the fastest run time in seconds
+
+    Args:
+        func (Callable): function to be timed
+        repeat (int, optional): number of runs. Defaults to 3.
+
+    Returns:
+        float: fastest run time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_wide_saveable(n_fields: int, value: Any = 1) -> Saveable:
+    """
+    create a saveable instance with n_fields attributes that all hold the same value
+
+    Args:
+        n_fields (int): number of attributes
+        value (Any, optional): value of each attribute. Defaults to 1.
+
+    Returns:
+        Saveable: saveable instance
+    """
+    fields_ = [
+        (f"field_{i}", Any, field(default_factory=lambda: value))  # type: ignore[misc]
+        for i in range(n_fields)
+    ]
+    cls_ = make_dataclass(f"Wide{n_fields}", fields_, bases=(Saveable,))
+    return cls_()  # type: ignore[no-any-return]
+
+
+def empty_like(saveable: Saveable) -> Saveable:
+    """
+    create an instance of the saveable's class with default values
+    """
+    return type(saveable)()
+
+
+def run_in_tmp_dir(*benchmarks: Callable[[Path], None]) -> None:
+    """
+    run benchmark functions with a temporary directory that is removed afterwards
+
+    Args:
+        benchmarks (Callable[[Path], None]): benchmark functions that take the
+                                             directory for their files
+    """
+    with tempfile.TemporaryDirectory(prefix="saveables_bench_") as tmp:
+        for benchmark in benchmarks:
+            benchmark(Path(tmp))
+
+
+def report(
+    title: str, rows: list[tuple[str, float]], unit: str = "ms", scale: float = 1e3
+) -> None:
+    """
+    print benchmark results as a table
+
+    Args:
+        title (str): title of table
+        rows (list[tuple[str, float]]): pairs of case name and measured value,
+                                        by default a time in seconds
+        unit (str, optional): unit that is printed. Defaults to "ms".
+        scale (float, optional): factor to convert values into unit.
+                                 Defaults to 1e3.
+    """
+    print(title)
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        print(f"  {name:<{width}}  {value * scale:10.2f} {unit}")
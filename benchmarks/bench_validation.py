@@ -0,0 +1,93 @@
+"""
+compare saving and loading with and without validation. Without validation,
+the types of values and of the elements of lists, tuples, sets and
+dictionaries are not checked, which saves a scan over all elements. Writing
+into a node that discards the data shows the cost of the checks alone. The
+checks are a minor part of the save and load times of most formats, whose
+conversion and I/O cost more
+
+run with: PYTHONPATH=src python benchmarks/bench_validation.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from bench_utils import (empty_like, make_wide_saveable, report,
+                         run_in_tmp_dir, timeit)
+from bench_write_dispatch import NullNode
+
+from saveables import validate
+from saveables.backends import get_file_class
+from saveables.contracts.constants import read_mode, root, write_mode
+from saveables.saveable.saveable import Saveable
+
+extensions = {"hdf5": ".h5", "sqlite3": ".sqlite3", "xml": ".xml", "binary": ".svb"}
+
+
+def make_cases(n_fields: int = 20, n_elements: int = 1_000) -> dict[str, Saveable]:
+    """
+    objects with many attributes that hold lists of strings or dictionaries
+    """
+    return {
+        "lists": make_wide_saveable(n_fields, [str(i) for i in range(n_elements)]),
+        "dicts": make_wide_saveable(
+            n_fields, {str(i): i for i in range(n_elements)}
+        ),
+    }
+
+
+def write_fields(saveable: Saveable, validate_: bool) -> None:
+    node = NullNode(root, None)
+    node.validate = validate_
+    for data_field in saveable.iter_fields(validate_):
+        node.write_data(data_field)
+
+
+def bench_checks() -> None:
+    """
+    write objects with many large attributes into a node that discards the
+    data with and without validation, and validate them without writing
+    """
+    rows: list[tuple[str, float]] = []
+    for case, saveable in make_cases().items():
+        rows.append((f"validate {case}", timeit(lambda: validate(saveable))))
+        for validate_ in (True, False):
+            suffix = "" if validate_ else " (validate=False)"
+            time = timeit(lambda: write_fields(saveable, validate_))
+            rows.append((f"write {case}{suffix}", time))
+    report("checks of data that are written", rows)
+
+
+def bench_validation(tmp: Path) -> None:
+    """
+    save and load objects with many large attributes with and without
+    validation
+    """
+    rows: list[tuple[str, float]] = []
+    cases = make_cases()
+    for format, extension in extensions.items():
+        file_class = get_file_class(format)
+        path = tmp / f"validation{extension}"
+        for case, saveable in cases.items():
+            for validate_ in (True, False):
+
+                def save() -> None:
+                    if path.exists():
+                        path.unlink()
+                    with file_class(path, write_mode) as f:
+                        f.save(saveable, validate=validate_)
+
+                def load() -> None:
+                    with file_class(path, read_mode) as f:
+                        f.load(empty_like(saveable), validate=validate_)
+
+                suffix = "" if validate_ else " (validate=False)"
+                rows.append((f"{format} save {case}{suffix}", timeit(save)))
+                rows.append((f"{format} load {case}{suffix}", timeit(load)))
+    report("save and load with and without validation", rows)
+
+
+if __name__ == "__main__":
+    bench_checks()
+    run_in_tmp_dir(bench_validation)
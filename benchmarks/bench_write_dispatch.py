@@ -0,0 +1,109 @@
+"""
+measure the overhead of dispatching the attributes of a saveable to the write
+methods of a file node. Objects with thousands of small lists and dictionaries
+are written into a node that discards the data, so that only the type checks
+and the dispatch are timed, and into files of each format
+
+run with: PYTHONPATH=src python benchmarks/bench_write_dispatch.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Generator
+
+from bench_utils import make_wide_saveable, report, run_in_tmp_dir, timeit
+
+from saveables.backends import get_file_class
+from saveables.base.base_file_node import BaseFileNode
+from saveables.contracts.constants import root, write_mode
+from saveables.saveable.data_field import DataField
+from saveables.saveable.meta_data import MetaData
+from saveables.saveable.saveable import Saveable
+
+extensions = {"hdf5": ".h5", "sqlite3": ".sqlite3", "xml": ".xml", "binary": ".svb"}
+
+# value of every attribute of the written objects by case name
+values: dict[str, Any] = {
+    "int": 1,
+    "list": [1, 2, 3, 4, 5, 6, 7, 8],
+    "dict": {"a": 1, "b": 2, "c": 3, "d": 4},
+}
+
+
+class NullNode(BaseFileNode[None]):
+    """
+    node that discards all data written into it
+    """
+
+    def __iter__(self) -> Generator[tuple[None, type], None, None]:
+        yield from []
+
+    def list_children(self) -> list[BaseFileNode]:  # type: ignore[type-arg]
+        return []
+
+    def create_child_node(self, meta: MetaData) -> BaseFileNode:  # type: ignore[type-arg] # noqa: E501
+        return NullNode(meta.name, self)
+
+    def write_primitive_data(self, data_field: DataField) -> None:
+        pass
+
+    def write_simple_iterable(self, data_field: DataField) -> None:
+        pass
+
+    def write_none(self, data_field: DataField) -> None:
+        pass
+
+    def read_primitive_data(self, filedata: None) -> DataField:
+        raise NotImplementedError
+
+    def read_simple_iterable(self, filedata: None) -> DataField | None:
+        raise NotImplementedError
+
+    def read_simple_dictionary(self, filedata: None) -> DataField | None:
+        raise NotImplementedError
+
+
+def write_fields(saveable: Saveable) -> None:
+    node = NullNode(root, None)
+    for data_field in saveable.iter_fields():
+        node.write_data(data_field)
+
+
+def bench_dispatch(n_fields: int = 5_000) -> None:
+    """
+    write objects with many attributes of the same type into a node that
+    discards the data
+    """
+    rows: list[tuple[str, float]] = []
+    for case, value in values.items():
+        saveable = make_wide_saveable(n_fields, value)
+        time = timeit(lambda: write_fields(saveable))
+        rows.append((f"{case} ({n_fields} fields)", time))
+    report("dispatch of attributes to write methods", rows)
+
+
+def bench_formats(tmp: Path, n_fields: int = 2_000) -> None:
+    """
+    save objects with many small lists and dictionaries with each format
+    """
+    rows: list[tuple[str, float]] = []
+    for format, extension in extensions.items():
+        file_class = get_file_class(format)
+        path = tmp / f"wide{extension}"
+        for case in ("list", "dict"):
+            saveable = make_wide_saveable(n_fields, values[case])
+
+            def save() -> None:
+                if path.exists():
+                    path.unlink()
+                with file_class(path, write_mode) as f:
+                    f.save(saveable)
+
+            rows.append((f"{format} {case} ({n_fields} fields)", timeit(save)))
+    report("save objects with many small attributes", rows)
+
+
+if __name__ == "__main__":
+    bench_dispatch()
+    run_in_tmp_dir(bench_formats)
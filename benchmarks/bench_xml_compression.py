@@ -0,0 +1,60 @@
+"""
+trade-off between compression level and throughput for compressed xml files
+
+run with: PYTHONPATH=src python benchmarks/bench_xml_compression.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from bench_formats import Checkpoint, make_checkpoint
+from bench_utils import run_in_tmp_dir, timeit
+
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.xml_format.xml_file import XmlFile
+
+# codec suffixes and the compression levels to measure
+levels = {"": [None], ".gz": [1, 6, 9], ".bz2": [1, 9], ".xz": [0, 6]}
+
+
+def bench_xml_compression(tmp: Path, n_elements: int = 10_000) -> None:
+    """
+    save and load a checkpoint with every codec and level and report file size
+    and throughput in megabytes of uncompressed xml per second
+    """
+    checkpoint = make_checkpoint(n_elements)
+
+    # size of uncompressed xml, used to compute throughput
+    plain = tmp / "plain.xml"
+    with XmlFile(plain, write_mode) as f:
+        f.save(checkpoint)
+    xml_mb = plain.stat().st_size * 1e-6
+
+    print(f"checkpoint with {n_elements} elements, {xml_mb:.2f} MB uncompressed xml")
+    header = ("codec", "level", "size MB", "save MB/s", "load MB/s")
+    print("  {:<6} {:>5} {:>8} {:>10} {:>10}".format(*header))
+    for suffix, levels_ in levels.items():
+        for level in levels_:
+            path = tmp / f"checkpoint_{level}.xml{suffix}"
+
+            def save() -> None:
+                with XmlFile(path, write_mode, compression_level=level) as f:
+                    f.save(checkpoint)
+
+            def load() -> None:
+                with XmlFile(path, read_mode) as f:
+                    f.load(Checkpoint())
+
+            save_time = timeit(save)
+            load_time = timeit(load)
+            size_mb = path.stat().st_size * 1e-6
+            print(
+                f"  {suffix or 'none':<6} {'-' if level is None else level:>5} "
+                f"{size_mb:8.2f} "
+                f"{xml_mb / save_time:10.2f} {xml_mb / load_time:10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run_in_tmp_dir(bench_xml_compression)
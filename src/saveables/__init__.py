@@ -0,0 +1,171 @@
+"""
+serialize arbitrary Python objects into structured files
+
+open() returns the file object that fits a path, e.g.
+
+    with saveables.open("data.h5", "r") as f:
+        f.load(obj)
+
+load_as_dict() reads a file into nested dictionaries without the classes of
+the saved objects, convert() and convert_many() convert files into another
+format, see also "python -m saveables convert --help". validate() checks that
+an object can be saved, so that trusted data can be saved with validate=False.
+to_bytes() and from_bytes() save and load objects without accessing the file
+system, e.g. to send them to another process.
+
+File format backends are resolved lazily, e.g. get_file_class("xml") or
+get_file_class_for_path("data.h5"). Heavy dependencies of a backend, like h5py
+and numpy for HDF5, are imported only when the backend is used. The file classes
+are also available as attributes, e.g. saveables.H5File, and are imported on
+first access. Further backends can be added with register_backend.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from saveables.backends import (Backend, detect_format,
+                                detect_format_of_bytes, get_file_class,
+                                get_file_class_for_path,
+                                get_format_from_extension, list_formats,
+                                register_backend)
+from saveables.contracts.constants import read_mode, update_mode
+from saveables.convert import convert, convert_many
+from saveables.saveable.saveable import Saveable, validate
+from saveables.saveable.stream import Stream
+
+if TYPE_CHECKING:
+    from saveables.base.base_file import BaseFile
+    from saveables.contracts.data_type import tFileMode
+
+_lazy_file_classes = {
+    "XmlFile": "xml",
+    "H5File": "hdf5",
+    "Sqlite3File": "sqlite3",
+    "BinaryFile": "binary",
+}
+
+__all__ = [
+    "Backend",
+    "Saveable",
+    "Stream",
+    "convert",
+    "convert_many",
+    "detect_format",
+    "detect_format_of_bytes",
+    "from_bytes",
+    "get_file_class",
+    "get_file_class_for_path",
+    "get_format_from_extension",
+    "list_formats",
+    "load_as_dict",
+    "open",
+    "register_backend",
+    "to_bytes",
+    "validate",
+    *_lazy_file_classes,
+]
+
+
+def open(
+    path: str | Path, mode: tFileMode, format: str | None = None, **kwargs: Any
+) -> BaseFile:
+    """
+    create file object for given path. The file is opened when the returned
+    object is used as a context manager
+
+    Args:
+        path (str | Path): path of file
+        mode (tFileMode): file mode
+        format (str | None, optional): name of format. If None, the format of a
+                                       file to be read or updated is detected
+                                       from its first bytes, the format of a file
+                                       to be written from its extension.
+                                       Defaults to None.
+        kwargs (Any): further keyword arguments passed to the file class
+
+    Returns:
+        BaseFile: file object of the format's file class
+    """
+    if format is None:
+        if mode in (read_mode, update_mode):
+            format = detect_format(path)
+        else:
+            format = get_format_from_extension(path)
+    file_class = get_file_class(format)
+    return file_class(path, mode, **kwargs)
+
+
+def load_as_dict(
+    path: str | Path,
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    format: str | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    read a file into nested dictionaries, see BaseFile.load_as_dict
+
+    Args:
+        path (str | Path): path of file
+        fields (Iterable[str] | None, optional): paths of attributes to be loaded.
+                                                 None loads all attributes.
+                                                 Defaults to None.
+        exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                  not loaded. Defaults to None.
+        format (str | None, optional): name of format. If None, the format is
+                                       detected from the first bytes of the file.
+                                       Defaults to None.
+        kwargs (Any): further keyword arguments passed to the file class
+
+    Returns:
+        dict[str, Any]: data of file by attribute name
+    """
+    with open(path, read_mode, format, **kwargs) as f:
+        data: dict[str, Any] = f.load_as_dict(fields, exclude)
+    return data
+
+
+def to_bytes(saveable: Saveable, format: str, **kwargs: Any) -> bytes:
+    """
+    save object into the content of a file of given format without accessing
+    the file system, see BaseFile.to_bytes
+
+    Args:
+        saveable (Saveable): object whose data are to be written
+        format (str): name of format
+        kwargs (Any): further keyword arguments passed to BaseFile.to_bytes, e.g.
+                      validate, or to the file class
+
+    Returns:
+        bytes: content of file
+    """
+    return get_file_class(format).to_bytes(saveable, **kwargs)
+
+
+def from_bytes(
+    data: bytes, saveable: Saveable, format: str | None = None, **kwargs: Any
+) -> None:
+    """
+    load data from the content of a file into given object without accessing
+    the file system, see BaseFile.from_bytes
+
+    Args:
+        data (bytes): content of file
+        saveable (Saveable): object that is supposed to hold the data
+        format (str | None, optional): name of format. If None, the format is
+                                       detected from the first bytes of data.
+                                       Defaults to None.
+        kwargs (Any): further keyword arguments passed to BaseFile.from_bytes,
+                      e.g. fields, or to the file class
+    """
+    if format is None:
+        format = detect_format_of_bytes(data)
+    get_file_class(format).from_bytes(data, saveable, **kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_file_classes:
+        return get_file_class(_lazy_file_classes[name])
+    raise AttributeError(f"module {__name__} has no attribute {name}")
@@ -0,0 +1,81 @@
+"""
+command line interface, e.g.
+
+    python -m saveables convert data.xml --output data.h5
+    python -m saveables convert archive/*.xml --format sqlite3 --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Sequence
+
+from saveables.backends import list_formats
+from saveables.convert import convert, convert_many, target_path
+from saveables.saveable.stream import stream_chunk_size
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="saveables")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert_parser = commands.add_parser(
+        "convert", help="convert files into another format"
+    )
+    convert_parser.add_argument("sources", nargs="+", type=Path, help="files to read")
+    convert_parser.add_argument(
+        "-o", "--output", type=Path, help="file to write if a single file is converted"
+    )
+    convert_parser.add_argument(
+        "-f", "--format", choices=list_formats(), help="target format"
+    )
+    convert_parser.add_argument(
+        "-d", "--directory", type=Path, help="directory of converted files"
+    )
+    convert_parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of parallel processes"
+    )
+    convert_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=stream_chunk_size,
+        help="number of list elements held in memory at once",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    run command line interface
+
+    Args:
+        argv (Sequence[str] | None, optional): command line arguments. If None,
+                                               the arguments of the process are
+                                               used. Defaults to None.
+
+    Returns:
+        int: exit code
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    sources: list[Path] = args.sources
+    if args.output is not None:
+        if len(sources) != 1 or args.directory is not None:
+            parser.error("an output path can only be given for a single file")
+        convert(sources[0], args.output, args.format, args.chunk_size)
+        return 0
+    if args.format is None:
+        parser.error("either an output path or a target format is required")
+
+    targets = [target_path(source, args.format, args.directory) for source in sources]
+    if len(sources) == 1 or args.jobs == 1:
+        for source, target in zip(sources, targets):
+            convert(source, target, args.format, args.chunk_size)
+    else:
+        convert_many(sources, targets, args.format, args.chunk_size, args.jobs)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
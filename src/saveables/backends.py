@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from saveables.base.base_file import BaseFile
+
+
+# number of bytes read from the beginning of a file to detect its format
+n_header_bytes = 16
+
+
+@dataclass
+class Backend:
+    """
+    describes a file format backend. The module that implements the backend
+    is imported not before the backend's file class is requested, so that
+    heavy dependencies like h5py and numpy are only imported if they are used
+    """
+
+    name: str  # name of the format, e.g. "xml"
+    module: str  # module that holds the file class
+    class_name: str  # name of the file class in module
+    extensions: tuple[str, ...]  # file name extensions including the leading dot
+    signatures: tuple[bytes, ...] = field(default=())  # possible first bytes of file
+
+    def __post_init__(self) -> None:
+        for signature in self.signatures:
+            if len(signature) > n_header_bytes:
+                raise ValueError(
+                    f"signature {signature!r} of format {self.name} is longer "
+                    f"than {n_header_bytes} bytes"
+                )
+
+    def matches_header(self, header: bytes) -> bool:
+        """
+        check if the first bytes of a file carry one of the backend's signatures
+
+        Args:
+            header (bytes): first bytes of file
+
+        Returns:
+            bool: True if header starts with any of the backend's signatures
+        """
+        return any(header.startswith(signature) for signature in self.signatures)
+
+    def load(self) -> type[BaseFile]:
+        """
+        import backend module and return its file class
+
+        Returns:
+            type[BaseFile]: file class of backend
+        """
+        module = import_module(self.module)
+        file_class: type[BaseFile] = getattr(module, self.class_name)
+        return file_class
+
+
+_backends: dict[str, Backend] = {
+    backend.name: backend
+    for backend in [
+        Backend(
+            "xml",
+            "saveables.xml_format.xml_file",
+            "XmlFile",
+            (".xml", ".xml.gz", ".xml.bz2", ".xml.xz"),
+            (b"<?xml", b"\xef\xbb\xbf<?xml"),  # prolog with and w/o utf-8 BOM
+        ),
+        Backend(
+            "hdf5",
+            "saveables.hdf5_format.h5_file",
+            "H5File",
+            (".h5", ".hdf5", ".hdf"),
+            (b"\x89HDF\r\n\x1a\n",),
+        ),
+        Backend(
+            "sqlite3",
+            "saveables.sqlite3_format.sqlite3_file",
+            "Sqlite3File",
+            (".sqlite3", ".sqlite", ".db"),
+            (b"SQLite format 3\x00",),
+        ),
+        Backend(
+            "binary",
+            "saveables.binary_format.binary_file",
+            "BinaryFile",
+            (".svb",),
+            (b"SAVEBIN\x00",),
+        ),
+    ]
+}
+
+
+def register_backend(backend: Backend, replace: bool = False) -> None:
+    """
+    register a file format backend, so that it can be resolved by name,
+    file extension or file signature without changing callers
+
+    Args:
+        backend (Backend): description of backend
+        replace (bool, optional): replace a registered backend with the same name.
+                                  Defaults to False.
+
+    Raises:
+        ValueError: if a backend with the same name is registered and replace is
+                    False
+    """
+    if backend.name in _backends and not replace:
+        raise ValueError(f"a backend for format {backend.name} is already registered")
+    _backends[backend.name] = backend
+
+
+def list_formats() -> list[str]:
+    """
+    list names of all known formats
+
+    Returns:
+        list[str]: format names
+    """
+    return list(_backends.keys())
+
+
+def get_backend(format: str) -> Backend:
+    """
+    return registered backend of given format
+
+    Args:
+        format (str): name of format, e.g. "xml", "hdf5" or "sqlite3"
+
+    Raises:
+        ValueError: if format is unknown
+
+    Returns:
+        Backend: description of backend
+    """
+    try:
+        return _backends[format]
+    except KeyError:
+        raise ValueError(
+            f"unknown format {format}. Known formats are: {', '.join(_backends)}"
+        )
+
+
+def get_file_class(format: str) -> type[BaseFile]:
+    """
+    return file class of given format. The backend module is imported
+    on first use
+
+    Args:
+        format (str): name of format, e.g. "xml", "hdf5" or "sqlite3"
+
+    Raises:
+        ValueError: if format is unknown
+
+    Returns:
+        type[BaseFile]: file class that handles given format
+    """
+    return get_backend(format).load()
+
+
+def get_format_from_extension(path: str | Path) -> str:
+    """
+    determine format name from the file name extension of given path
+
+    Args:
+        path (str | Path): path of file
+
+    Raises:
+        ValueError: if no format is registered for the path's extension
+
+    Returns:
+        str: name of format
+    """
+    file_name = Path(path).name.lower()
+
+    # check longest extensions first, so that compound extensions win
+    candidates = [
+        (extension, backend.name)
+        for backend in _backends.values()
+        for extension in backend.extensions
+    ]
+    candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
+    for extension, format in candidates:
+        if file_name.endswith(extension):
+            return format
+    raise ValueError(f"cannot determine file format from extension of {path}")
+
+
+def detect_format(path: str | Path) -> str:
+    """
+    determine format of an existing file from its first bytes. If no
+    signature matches, the format is determined from the file name extension
+
+    Args:
+        path (str | Path): path of existing file
+
+    Returns:
+        str: name of format
+    """
+    with open(path, "rb") as f:
+        header = f.read(n_header_bytes)
+    for backend in _backends.values():
+        if backend.matches_header(header):
+            return backend.name
+    return get_format_from_extension(path)
+
+
+def detect_format_of_bytes(data: bytes) -> str:
+    """
+    determine format of the content of a file from its first bytes
+
+    Args:
+        data (bytes): content of file, e.g. returned by BaseFile.to_bytes
+
+    Raises:
+        ValueError: if no signature matches
+
+    Returns:
+        str: name of format
+    """
+    header = bytes(data[:n_header_bytes])
+    for backend in _backends.values():
+        if backend.matches_header(header):
+            return backend.name
+    raise ValueError("cannot determine file format from first bytes of data")
+
+
+def get_file_class_for_path(path: str | Path) -> type[BaseFile]:
+    """
+    return file class that handles the format given path's extension stands for
+
+    Args:
+        path (str | Path): path of file
+
+    Returns:
+        type[BaseFile]: file class that handles the file format
+    """
+    return get_file_class(get_format_from_extension(path))
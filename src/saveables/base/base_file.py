@@ -1,34 +1,145 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar, Generator, Iterable
 
 from saveables.base.base_file_node import BaseFileNode
-from saveables.saveable.saveable import Saveable
+from saveables.base.content_index import ContentIndex
+from saveables.base.field_selection import FieldSelection
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.saveable.data_field import DataField
+from saveables.saveable.saveable import Saveable, create_data_field
 
 if TYPE_CHECKING:
     from saveables.contracts.data_type import tFileMode
 
+# path of files that are held in memory, see BaseFile.to_bytes
+memory_path = "<memory>"
+
 
 class BaseFile(ABC):
     """
     base class that provides save and load functionality for Saveable objects
     """
 
+    # True if files can be held in memory instead of the file system, see
+    # to_bytes and from_bytes
+    supports_bytes: ClassVar[bool] = False
+
     def __init__(self, path: str | Path, mode: tFileMode):
         self.path = path if isinstance(path, Path) else Path(path)
         self.root: BaseFileNode | None = (  # type: ignore[type-arg]
             None  # root file node. Needs to be initialized in subclasses
         )
         self.mode = mode
+        # write duplicate saveables and iterables as references. Set by file
+        # classes of formats that support references
+        self.deduplicate = False
+        # content of a file that is held in memory. Files that are written into
+        # memory start with empty content, which is set when they are closed.
+        # None if file is on the file system
+        self._image: bytes | None = None
+
+    @classmethod
+    def to_bytes(
+        cls, saveable: Saveable, validate: bool = True, **kwargs: Any
+    ) -> bytes:
+        """
+        save object into the content of a file without accessing the file system,
+        e.g. to send it to another process
+
+        Args:
+            saveable (Saveable): object whose data are to be written
+            validate (bool, optional): if False, the types of the data are not
+                                       checked, see save. Defaults to True.
+            kwargs (Any): further keyword arguments passed to the file class,
+                          e.g. deduplicate
+
+        Raises:
+            ValueError: if format does not support files in memory
+
+        Returns:
+            bytes: content of file
+        """
+        file = cls._in_memory(write_mode, b"", **kwargs)
+        with file:
+            file.save(saveable, validate)
+        return file._image  # type: ignore[return-value]
 
-    def save(self, saveable: Saveable) -> None:
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        saveable: Saveable,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        shared: bool = False,
+        validate: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        load data from the content of a file into given object without accessing
+        the file system, see to_bytes and load
+
+        Args:
+            data (bytes): content of file
+            saveable (Saveable): object that is supposed to hold the data
+            fields (Iterable[str] | None, optional): paths of attributes to be
+                                                     loaded. Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+            shared (bool, optional): if True, attributes that refer to the same
+                                     data are set to the same object.
+                                     Defaults to False.
+            validate (bool, optional): if False, checks of the data that are read
+                                       are skipped. Defaults to True.
+            kwargs (Any): further keyword arguments passed to the file class
+
+        Raises:
+            ValueError: if format does not support files in memory
+        """
+        with cls._in_memory(read_mode, bytes(data), **kwargs) as file:
+            file.load(saveable, fields, exclude, shared, validate)
+
+    @classmethod
+    def _in_memory(cls, mode: tFileMode, image: bytes, **kwargs: Any) -> BaseFile:
+        """
+        create file object that is held in memory
+
+        Args:
+            mode (tFileMode): file mode, "r" or "w"
+            image (bytes): content of file that is read, empty if file is written
+            kwargs (Any): further keyword arguments passed to the file class
+
+        Raises:
+            ValueError: if format does not support files in memory
+
+        Returns:
+            BaseFile: file object
+        """
+        if not cls.supports_bytes:
+            raise ValueError(f"files of {cls.__name__} cannot be held in memory")
+        file = cls(memory_path, mode, **kwargs)
+        file._image = image
+        return file
+
+    def save(self, saveable: Saveable, validate: bool = True) -> None:
         """
         save object to file
 
         Args:
             saveable (Saveable): object whose data are to be written to file
+            validate (bool, optional): if False, the types of values and of the
+                                       elements of lists, tuples, sets and
+                                       dictionaries are not checked while they
+                                       are written. Data that do not have the
+                                       types their meta data declare may then be
+                                       written wrongly, so only trusted data, or
+                                       data that have been checked with
+                                       saveables.validate, should be saved
+                                       without validation. Defaults to True.
 
         Raises:
             ValueError: raises ValueError is root is not initialized. Most probable
@@ -39,16 +150,43 @@ class BaseFile(ABC):
         if self.root is None:
             raise ValueError("no root node initialized")
 
-        # add data to top level node
-        for data_field in saveable.iter_fields():
-            self.root.write_data(data_field)
+        # add data to top level node. Objects that are referenced more than once
+        # and, if enabled, duplicates are looked up in an index that is shared
+        # by all nodes written during the save
+        self._write(self.root, saveable.iter_fields(validate), saveable, validate)
 
-    def load(self, saveable: Saveable) -> None:
+    def load(
+        self,
+        saveable: Saveable,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        shared: bool = False,
+        validate: bool = True,
+    ) -> None:
         """
-        load data from file into given object
+        load data from file into given object. Attributes can be selected by
+        dotted paths, e.g. fields=["name", "address.city"] loads only the name and
+        the city of the address. Attributes that are not selected keep their
+        values and are skipped when the file is read. Saveables that have been
+        written as references to the same data are loaded into independent
+        objects unless shared is True
 
         Args:
             saveable (Saveable): object that is supposed to hold the data from the file
+            fields (Iterable[str] | None, optional): paths of attributes to be loaded.
+                                                     Segments can be patterns, see
+                                                     fnmatch. None loads all
+                                                     attributes. Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+            shared (bool, optional): if True, attributes that refer to the same
+                                     data in the file are set to the same object.
+                                     Defaults to False.
+            validate (bool, optional): if False, the file is trusted to hold data
+                                       of the saveable's class, and checks of the
+                                       data that are read are skipped, e.g.
+                                       whether the saveable has the attributes
+                                       of the file. Defaults to True.
 
         Raises:
             ValueError: raises ValueError is root is not initialized. Most probable
@@ -60,7 +198,167 @@ class BaseFile(ABC):
             raise ValueError("no root node initialized")
 
         # load data
-        self.root.load(saveable)
+        self.root.validate = validate
+        try:
+            self.root.load(
+                saveable, FieldSelection.create(fields, exclude), {} if shared else None
+            )
+        finally:
+            self.root.validate = True
+
+    def load_as_dict(
+        self,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        load data from file into nested dictionaries, e.g. to scan files whose
+        saveable classes are not available. The structure is reconstructed from
+        the meta data in the file. Objects are loaded as dictionaries that map
+        the names of their attributes to the values
+
+        Args:
+            fields (Iterable[str] | None, optional): paths of attributes to be loaded.
+                                                     Segments can be patterns, see
+                                                     fnmatch. None loads all
+                                                     attributes. Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+
+        Raises:
+            ValueError: raises ValueError is root is not initialized. Most probable
+                        cause for this that it has been forgotten to open the file
+
+        Returns:
+            dict[str, Any]: data of file by attribute name
+        """
+
+        # check if root is initialized
+        if self.root is None:
+            raise ValueError("no root node initialized")
+
+        return self.root.load_as_dict(FieldSelection.create(fields, exclude))
+
+    def get(self, path: str) -> Any:
+        """
+        read the value of a single attribute without loading the object that
+        holds it, e.g. get("config.seed"). The file is walked along the path
+        from node to node, so that only the addressed attribute is read. Objects
+        are returned as dictionaries, see load_as_dict
+
+        Args:
+            path (str): dotted path of attribute
+
+        Raises:
+            ValueError: raises ValueError is root is not initialized
+            KeyError: if file has no attribute at given path
+
+        Returns:
+            Any: value of attribute
+        """
+        node, name_ = self._walk(path)
+        for data_field in node.read_python_attributes(FieldSelection.create([name_])):
+            return data_field.value
+        child_node = node.get_child(name_)
+        if child_node is not None:
+            return child_node.load_as_dict()
+        raise KeyError(f"{self.path} has no attribute {path}")
+
+    def set(self, path: str, value: Any) -> None:
+        """
+        write the value of a single attribute into a file that has been opened
+        for update, e.g. set("config.seed", 42). The previous data of the
+        attribute are removed. The object that holds the attribute must exist
+        in the file
+
+        Args:
+            path (str): dotted path of attribute
+            value (Any): value of attribute, any supported attribute type
+
+        Raises:
+            ValueError: raises ValueError is root is not initialized or if file
+                        is opened for reading
+            KeyError: if file has no object at given path
+            TypeError: if type of value is not supported
+        """
+        if self.mode == read_mode:
+            raise ValueError(f"{self.path} has been opened for reading")
+        node, name_ = self._walk(path)
+        data_field = create_data_field(name_, value)
+        node.remove(name_)
+        self._write(node, [data_field])
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        run the writes of a with block within a single transaction of the file.
+        Formats that support transactions discard all writes of the block if an
+        error occurs. For other formats, the block is run as it is
+        """
+        yield
+
+    def _write(
+        self,
+        node: BaseFileNode,  # type: ignore[type-arg]
+        data_fields: Iterable[DataField],
+        saveable: Saveable | None = None,
+        validate: bool = True,
+    ) -> None:
+        """
+        write data fields into a node. The saveables that are written are tracked
+        in an index, so that objects that are referenced more than once are
+        written as references and cycles are detected
+
+        Args:
+            node (BaseFileNode): node the data are written into
+            data_fields (Iterable[DataField]): data to be written
+            saveable (Saveable | None, optional): object that holds the data
+                                                  fields, if node represents it.
+                                                  Defaults to None.
+            validate (bool, optional): if False, the data are written without
+                                       checks of their types. Defaults to True.
+        """
+        index = ContentIndex(deduplicate=self.deduplicate)
+        if saveable is not None:
+            index.identities[id(saveable)] = node
+            index.writing.add(id(saveable))
+        node.content_index = index
+        node.validate = validate
+        try:
+            for data_field in data_fields:
+                node.write_data(data_field)
+            node.finish_writing()
+        finally:
+            node.content_index = None
+            node.validate = True
+            index.close()
+
+    def _walk(self, path: str) -> tuple[BaseFileNode, str]:  # type: ignore[type-arg]
+        """
+        walk along a dotted path to the node that holds the addressed attribute
+
+        Args:
+            path (str): dotted path of attribute
+
+        Raises:
+            ValueError: if root is not initialized or path is invalid
+            KeyError: if a node along the path does not exist
+
+        Returns:
+            tuple[BaseFileNode, str]: node and name of attribute
+        """
+        if self.root is None:
+            raise ValueError("no root node initialized")
+        *node_names, name_ = path.split(".")
+        if "" in node_names or name_ == "":
+            raise ValueError(f"invalid path of attribute: {path}")
+        node = self.root
+        for node_name in node_names:
+            child_node = node.get_child(node_name)
+            if child_node is None:
+                raise KeyError(f"{self.path} has no object {node_name} in {path}")
+            node = child_node
+        return node, name_
 
     def __enter__(self):  # type: ignore[no-untyped-def]
         self.open()
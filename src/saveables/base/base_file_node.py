@@ -1,22 +1,198 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generator, Generic, TypeVar
+from functools import cache
+from typing import (TYPE_CHECKING, Any, Callable, Generator, Generic, Hashable,
+                    Iterable, TypeVar)
 
-from saveables.contracts.constants import dict_keys, dict_values
+from saveables.contracts.constants import (dict_keys, dict_values, empty_type,
+                                           saveable)
 from saveables.contracts.data_type import (EmptyIterable,
                                            python_type_literal_map,
+                                           python_type_literal_map_reversed,
                                            supported_primitive_data_types,
                                            tRole)
-from saveables.python_utils import get_element_type  # type: ignore[attr-defined]
 from saveables.saveable.data_field import DataField
-from saveables.saveable.meta_data import MetaData
+from saveables.saveable.meta_data import MetaData, get_meta_data
 from saveables.saveable.saveable import Saveable
-from saveables.saveable.utils import is_simple_dictionary, is_simple_iterable
+from saveables.saveable.stream import Stream
+from saveables.saveable.utils import (is_simple_dictionary, is_simple_iterable,
+                                      is_typed_uniformly)
+
+if TYPE_CHECKING:
+    from saveables.base.content_index import ContentIndex
+    from saveables.base.field_selection import FieldSelection
 
 T = TypeVar("T")
 
 
+def check_stream(data_field: DataField) -> Stream:
+    """
+    return the stream of a data field
+
+    Args:
+        data_field (DataField): object that holds a stream and its meta data
+
+    Raises:
+        TypeError: if data is not a stream
+
+    Returns:
+        Stream: stream of data field
+    """
+    if not isinstance(data_field.value, Stream):
+        raise TypeError(
+            f"value in {data_field.meta.name} is supposed to be a stream "
+            f"but is {type(data_field.value)}"
+        )
+    return data_field.value
+
+
+def empty_stream_meta(meta: MetaData) -> MetaData:
+    """
+    meta data of a stream that has not produced any elements. It is written
+    like an empty list
+
+    Args:
+        meta (MetaData): meta data of stream
+
+    Returns:
+        MetaData: meta data with empty element type
+    """
+    return get_meta_data(
+        meta.python_type, meta.role, meta.name, empty_type  # type: ignore[arg-type]
+    )
+
+
+def stream_data_field(
+    meta: MetaData, elements: Iterable[Any], chunk_size: int
+) -> DataField:
+    """
+    data field that holds the elements of an iterable as a stream
+
+    Args:
+        meta (MetaData): meta data of iterable
+        elements (Iterable[Any]): elements of iterable, e.g. a generator that
+                                  reads them from file
+        chunk_size (int): number of elements consumed at once
+
+    Returns:
+        DataField: data field whose value is a stream. Empty iterables, which
+                   have no element type, are returned as empty lists
+    """
+    element_type_ = python_type_literal_map_reversed[meta.element_type]
+    if element_type_ == EmptyIterable:
+        return DataField(meta=meta, value=[])
+    return DataField(meta=meta, value=Stream(elements, element_type_, chunk_size))
+
+
+def dictionary_data_field(
+    data_field: DataField, role: tRole, validate: bool = True
+) -> DataField:
+    """
+    data field that holds the keys or the values of a dictionary as a list
+
+    Args:
+        data_field (DataField): object that holds the dictionary and its meta data
+        role (tRole): role of the data. Can be either "dict_keys" or
+                      "dict_values" which determines wether dictionary keys
+                      or values are returned
+        validate (bool, optional): if False, keys and values are trusted to
+                                   have the type of the first one each.
+                                   Defaults to True.
+
+    Raises:
+        ValueError: if an unexpected argument for role is used
+        TypeError: if the value is not a dictionary or if its keys / values are
+                   not uniformly typed or of a type that is not supported
+
+    Returns:
+        DataField: keys or values along with their meta data
+    """
+    if not isinstance(data_field.value, dict):
+        raise TypeError(
+            f"value in {data_field.meta.name} is supposed to be a dictionary"
+        )
+
+    # create data field for keys/values
+    if role == dict_keys:
+        value = list(data_field.value.keys())
+    elif role == dict_values:
+        value = list(data_field.value.values())
+    else:
+        raise ValueError(
+            f"error while writing attribute {data_field.meta.name}. "
+            f"Origin is expected to be {dict_keys} or {dict_values} but is {role}"
+        )
+
+    # the elements are checked once, along with the type of the first one
+    element_type = type(value[0]) if value else EmptyIterable
+    if validate and (
+        (
+            element_type not in supported_primitive_data_types
+            and not element_type == EmptyIterable
+        )
+        or not is_typed_uniformly(value)
+    ):
+        raise TypeError(
+            f"value in {data_field.meta.name} is supposed to be a dictionary "
+            f"with unformly typed keys and values of supported types, but "
+            f"{role} are not"
+        )
+    meta = get_meta_data(
+        data_field.meta.python_type,
+        role,
+        data_field.meta.name,
+        python_type_literal_map[element_type],  # type: ignore[arg-type]
+    )
+    return DataField(value=value, meta=meta)
+
+
+# types a value may have for each python type of its meta data. Streams are
+# written as lists
+_value_types: dict[str, type | tuple[type, ...]] = {
+    **{
+        python_type_literal_map[type_]: type_
+        for type_ in (*supported_primitive_data_types, type(None), tuple, set, dict)
+    },
+    python_type_literal_map[list]: (list, Stream),
+    saveable: Saveable,
+}
+
+# names of the methods that write values by python type of their meta data
+_write_method_names: dict[str, str] = {
+    **{
+        python_type_literal_map[type_]: "write_primitive_data"
+        for type_ in supported_primitive_data_types
+    },
+    python_type_literal_map[type(None)]: "write_none",
+    python_type_literal_map[list]: "write_iterable",
+    python_type_literal_map[tuple]: "write_iterable",
+    python_type_literal_map[set]: "write_iterable",
+    python_type_literal_map[dict]: "write_simple_dictionary",
+    saveable: "write_saveable",
+}
+
+
+@cache
+def _write_methods(
+    cls: type[BaseFileNode],  # type: ignore[type-arg]
+) -> dict[str, Callable[[BaseFileNode, DataField], None]]:  # type: ignore[type-arg]
+    """
+    write methods of a file node class by python type of the meta data of the
+    values they write. Methods that the class overrides are looked up once
+
+    Args:
+        cls (type[BaseFileNode]): file node class
+
+    Returns:
+        dict[str, Callable[[BaseFileNode, DataField], None]]: unbound write methods
+    """
+    return {
+        python_type_: getattr(cls, method_name)
+        for python_type_, method_name in _write_method_names.items()
+    }
+
+
 class BaseFileNode(ABC, Generic[T]):
     """
     base class that provides format independet code to read / write
@@ -26,35 +202,107 @@ class BaseFileNode(ABC, Generic[T]):
     def __init__(self, name: str, parent: BaseFileNode | None, *args, **kwargs):  # type: ignore[no-untyped-def, type-arg] # noqa: E501
         self.name = name
         self.parent = parent
+        # digests of written data if duplicates are written as references. The
+        # index is shared by all nodes of a file
+        self.content_index: ContentIndex | None = (
+            None if parent is None else parent.content_index
+        )
+        # if False, data are trusted to have the types their meta data declare,
+        # and the checks of values and elements are skipped
+        self.validate: bool = True if parent is None else parent.validate
 
-    def read_python_attributes(self) -> list[DataField]:
+    def read_python_attributes(
+        self, selection: FieldSelection | None = None, chunk_size: int | None = None
+    ) -> list[DataField]:
         """
         read data from file that represents
         native python data type like str, int, list etc
 
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+            chunk_size (int | None, optional): if given, lists, tuples and sets are
+                                               read as streams of this chunk size,
+                                               see read_stream. Defaults to None.
+
         Returns:
             list: list of DataField objects holds data along with meta data
         """
 
         data_fields: list[DataField] = []
         data_field: DataField | None
-        for data, python_type_ in self:
+        for data, python_type_ in self.iter_attributes(selection):
             if python_type_ in supported_primitive_data_types:
                 data_field = self.read_primitive_data(data)
                 data_fields.append(data_field)
             if python_type_ in (list, tuple, set):
-                data_field = self.read_simple_iterable(data)
+                if chunk_size is None:
+                    data_field = self.read_simple_iterable(data)
+                else:
+                    data_field = self.read_stream(data, chunk_size)
                 if data_field is not None:
                     data_fields.append(data_field)
             if python_type_ == dict:
                 data_field = self.read_simple_dictionary(data)
                 if data_field is not None:
                     data_fields.append(data_field)
+        if selection is not None:
+            data_fields = [
+                data_field
+                for data_field in data_fields
+                if selection.selects(data_field.meta.name)
+            ]
         return data_fields
 
+    def iter_attributes(
+        self, selection: FieldSelection | None = None
+    ) -> Generator[tuple[T, type], None, None]:
+        """
+        iterate over the file data of the node's attributes. File nodes override
+        this method to skip attributes that are not selected before they are
+        read. By default, all attributes are iterated and filtered after they
+        have been read
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+
+        Yields:
+            Generator[tuple[T, type], None, None]: file data and python type
+        """
+        yield from self
+
+    def read_stream(self, filedata: T, chunk_size: int) -> DataField | None:
+        """
+        read list, set or tuple as a stream whose elements are read while it is
+        consumed, e.g. to write them into another file. File nodes override this
+        method to read the elements chunk by chunk. By default, the iterable is
+        read with read_simple_iterable and wrapped. Empty iterables are returned
+        as they are
+
+        Args:
+            filedata (T): file data of iterable
+            chunk_size (int): number of elements consumed at once
+
+        Returns:
+            DataField | None: meta data of iterable along with a stream of its
+                              elements, None if the iterable has already been read
+        """
+        data_field = self.read_simple_iterable(filedata)
+        if data_field is None:
+            return None
+        return stream_data_field(
+            data_field.meta, data_field.value, chunk_size  # type: ignore[arg-type]
+        )
+
     def write_data(self, data_field: DataField) -> None:
         """
-        write data to node
+        write data to node. The write method is looked up by the python type of
+        the meta data, which create_data_field has derived from the value after
+        checking that its type and the types of its elements are supported. Data
+        whose meta data do not match the type of their value are checked again
 
         Args:
             data_field (DataField): object that holds data and
@@ -64,19 +312,50 @@ class BaseFileNode(ABC, Generic[T]):
             ValueError: raise ValueError if data type is not supported
                         and cannot be written to node
         """
-        if data_field.value is None:
+        python_type_ = data_field.meta.python_type
+        method = _write_methods(type(self)).get(python_type_)
+        if method is not None and (
+            not self.validate
+            or isinstance(data_field.value, _value_types[python_type_])
+        ):
+            method(self, data_field)
+        elif data_field.value is None:
             self.write_none(data_field)
         elif type(data_field.value) in supported_primitive_data_types:
             self.write_primitive_data(data_field)
         elif isinstance(data_field.value, Saveable):
             self.write_saveable(data_field)
+        elif isinstance(data_field.value, Stream):
+            self.write_stream(data_field)
         elif is_simple_iterable(data_field.value):
-            self.write_simple_iterable(data_field)
+            self.write_iterable(data_field)
         elif is_simple_dictionary(data_field.value):
             self.write_simple_dictionary(data_field)
         else:
             raise ValueError(f"attribute {data_field.meta.name} cannot be saved")
 
+    def finish_writing(self) -> None:
+        """
+        write data that the node has buffered while its attributes have been
+        passed to write_data. Called once all attributes of the node have been
+        passed. File nodes that buffer data override this method
+        """
+
+    def write_iterable(self, data_field: DataField) -> None:
+        """
+        write list, tuple or set, or a stream, which is written as a list. Lists,
+        tuples and sets that have already been written are referenced if the
+        format supports references
+
+        Args:
+            data_field (DataField): object that holds a list / tuple / set or a
+                                    stream and its meta data
+        """
+        if isinstance(data_field.value, Stream):
+            self.write_stream(data_field)
+        elif not self._link_duplicate_iterable(data_field):
+            self.write_simple_iterable(data_field)
+
     def write_saveable(self, data_field: DataField) -> None:
         """
         write saveable object along with its meta data to node
@@ -89,7 +368,8 @@ class BaseFileNode(ABC, Generic[T]):
         Raises:
             TypeError: if the data is not None and
                        does not inherit from Saveable
-            ValueError: if data is None
+            ValueError: if data is None or if it is part of a cycle that cannot
+                        be written as a reference
         """
         # check if value is saveable
         if data_field.value is None:
@@ -99,10 +379,146 @@ class BaseFileNode(ABC, Generic[T]):
         if not isinstance(data_field.value, Saveable):
             raise TypeError(f"value of type {type(data_field.value)} is not supported")
 
-        # create new sub node and save the fields
+        index = self.content_index
+        if index is None or not index.active:
+            self._write_saveable_fields(data_field)
+            return
+
+        # write reference if the object or, if duplicates are looked up, the
+        # same data have already been written
+        key = id(data_field.value)
+        if key in index.identities:
+            if self.link_saveable(data_field.meta, index.identities[key]):
+                return
+            if key in index.writing:
+                raise ValueError(
+                    f"attribute {data_field.meta.name} of {self.name} is a cyclic "
+                    f"reference, which {type(self).__name__} cannot write"
+                )
+        digest = index.digest(data_field.value) if index.deduplicate else None
+        if digest is not None and digest in index.nodes:
+            if self.link_saveable(data_field.meta, index.nodes[digest]):
+                return
+
+        index.writing.add(key)
+        try:
+            sub_node = self._write_saveable_fields(data_field)
+        finally:
+            index.writing.discard(key)
+        if digest is not None:
+            index.nodes.setdefault(digest, sub_node)
+
+    def _write_saveable_fields(self, data_field: DataField) -> BaseFileNode:  # type: ignore[type-arg] # noqa: E501
+        """
+        create child node for a saveable and write its attributes into it
+
+        Args:
+            data_field (DataField): object that holds saveable and its meta data
+
+        Returns:
+            BaseFileNode: child node
+        """
         sub_node = self.create_child_node(data_field.meta)
-        for data_field in data_field.value.iter_fields():
-            sub_node.write_data(data_field)
+        index = self.content_index
+        if index is not None and index.active:
+            # register node before its attributes are written, so that cycles
+            # can refer to it
+            index.identities.setdefault(id(data_field.value), sub_node)
+        for data_field_ in data_field.value.iter_fields(self.validate):  # type: ignore[union-attr] # noqa: E501
+            sub_node.write_data(data_field_)
+        sub_node.finish_writing()
+        return sub_node
+
+    def _link_duplicate_iterable(self, data_field: DataField) -> bool:
+        """
+        write a reference to a list, tuple or set that has already been written,
+        if duplicates are written as references
+
+        Args:
+            data_field (DataField): object that holds list / tuple / set and its meta
+                                    data
+
+        Returns:
+            bool: True if a reference has been written, False if the iterable is
+                  to be written in full
+        """
+        index = self.content_index
+        if (
+            index is None
+            or not index.active
+            or not index.deduplicate
+            or len(data_field.value) < index.min_length  # type: ignore[arg-type]
+        ):
+            return False
+        digest = index.digest_iterable(data_field.meta, data_field.value)
+        original = index.iterables.get(digest)
+        if original is None:
+            index.iterables[digest] = (self, data_field.meta.name)
+            return False
+        return self.link_iterable(data_field.meta, *original)
+
+    def link_saveable(self, meta: MetaData, original: BaseFileNode) -> bool:  # type: ignore[type-arg] # noqa: E501
+        """
+        write a reference to a node that holds the same data as the saveable
+        that is about to be written. File nodes of formats that support
+        references override this method
+
+        Args:
+            meta (MetaData): meta data of saveable
+            original (BaseFileNode): node that holds the data
+
+        Returns:
+            bool: True if a reference has been written, False if the saveable is
+                  to be written in full
+        """
+        return False
+
+    def link_iterable(
+        self, meta: MetaData, original: BaseFileNode, original_name: str  # type: ignore[type-arg] # noqa: E501
+    ) -> bool:
+        """
+        write a reference to a list, tuple or set that has already been written
+        with the same meta data. File nodes of formats that support references
+        override this method
+
+        Args:
+            meta (MetaData): meta data of iterable
+            original (BaseFileNode): node that holds the iterable
+            original_name (str): name of attribute that holds the iterable in
+                                 original node
+
+        Returns:
+            bool: True if a reference has been written, False if the iterable is
+                  to be written in full
+        """
+        return False
+
+    def content_key(self) -> Hashable | None:
+        """
+        key that identifies the stored data of the node. Nodes that refer to the
+        same data have equal keys
+
+        Returns:
+            Hashable | None: key of data, None if the format has no references
+        """
+        return None
+
+    def write_stream(self, data_field: DataField) -> None:
+        """
+        write elements of a stream as a list into node. File nodes override this
+        method to write the stream chunk by chunk. By default, the elements are
+        collected and written with write_simple_iterable
+
+        Args:
+            data_field (DataField): object that holds a stream and its meta data
+
+        Raises:
+            TypeError: if data is not a stream
+        """
+        stream = check_stream(data_field)
+        values = [value for chunk in stream.iter_chunks() for value in chunk]
+        meta = data_field.meta if len(values) else empty_stream_meta(data_field.meta)
+        self.write_simple_iterable(DataField(meta=meta, value=values))
 
     def write_simple_dictionary(self, data_field: DataField) -> None:
         """
@@ -119,18 +535,17 @@ class BaseFileNode(ABC, Generic[T]):
         """
 
         # check if value type is correct
-        if not is_simple_dictionary(data_field.value):
-            msg = (
-                f"value in {data_field.meta.name} is supposed to be a dictionary "
-                f"with unformly typed keys and values"
+        if not isinstance(data_field.value, dict):
+            raise TypeError(
+                f"value in {data_field.meta.name} is supposed to be a dictionary"
             )
-            raise TypeError(msg)
-
-        # write dictionary keys as list
-        self.write_dictionary_keys_or_values(data_field, dict_keys)
 
-        # save dictionary values as a list
-        self.write_dictionary_keys_or_values(data_field, dict_values)
+        # check keys and values before any of them is written, then write
+        # dictionary keys and values as lists
+        keys = dictionary_data_field(data_field, dict_keys, self.validate)
+        values = dictionary_data_field(data_field, dict_values, self.validate)
+        self.write_simple_iterable(keys)
+        self.write_simple_iterable(values)
 
     def write_dictionary_keys_or_values(
         self, data_field: DataField, role: tRole
@@ -149,57 +564,52 @@ class BaseFileNode(ABC, Generic[T]):
             TypeError: if the type of dictionary keys / values
                        are not supported
         """
-        if not isinstance(data_field.value, dict):
-            raise TypeError(f"value in {data_field.meta.name} is supposed to be a list")
-
-        # create data field for keys/values
-        if role == dict_keys:
-            value = list(data_field.value.keys())
-        elif role == dict_values:
-            value = list(data_field.value.values())
-        else:
-            raise ValueError(
-                f"error while writing attribute {data_field.meta.name}. "
-                f"Origin is expected to be {dict_keys} or {dict_values} but is {role}"
-            )
-        element_type = get_element_type(value)
-
-        if (
-            element_type not in supported_primitive_data_types
-            and not element_type == EmptyIterable
-        ):
-            raise TypeError(
-                f"element type in attribute {data_field.meta.name} ({role})"
-                f" is {element_type} which is not supported"
-            )
-        element_type_literal = python_type_literal_map[element_type]
-        meta = MetaData(
-            data_field.meta.python_type,
-            role,
-            data_field.meta.name,
-            element_type_literal,  # type: ignore[arg-type]
+        self.write_simple_iterable(
+            dictionary_data_field(data_field, role, self.validate)
         )
-        data_field_to_write = DataField(value=value, meta=meta)
 
-        # write keys / values as list in file
-        self.write_simple_iterable(data_field_to_write)
-
-    def load(self, saveable: Saveable) -> None:
+    def load(
+        self,
+        saveable: Saveable,
+        selection: FieldSelection | None = None,
+        shared: dict[Hashable, Saveable] | None = None,
+        ancestors: dict[Hashable, Saveable] | None = None,
+    ) -> None:
         """
         load data from node to given saveable
 
         Args:
             saveable (Saveable): object the node's data is written into
+            selection (FieldSelection | None, optional): attributes to be loaded.
+                                                         None loads all attributes.
+                                                         Defaults to None.
+            shared (dict[Hashable, Saveable] | None, optional): loaded saveables by
+                                                               content key. If
+                                                               given, nodes that
+                                                               refer to the same
+                                                               data are loaded
+                                                               into one shared
+                                                               object. Defaults
+                                                               to None.
+            ancestors (dict[Hashable, Saveable] | None, optional): saveables that
+                                                                  are being loaded
+                                                                  by content key.
+                                                                  References to
+                                                                  them restore
+                                                                  cycles. Defaults
+                                                                  to None.
 
         Raises:
             AttributeError: if data in node is
                             supposed for a field that the saveable
-                            object does not possess
+                            object does not possess. Without validation,
+                            attributes that hold standard python data are
+                            set without this check
         """
 
         # load standard python data
-        for data_field in self.read_python_attributes():
-            if not hasattr(saveable, data_field.meta.name):
+        for data_field in self.read_python_attributes(selection):
+            if self.validate and not hasattr(saveable, data_field.meta.name):
                 raise AttributeError(
                     f"object {saveable} does not have"
                     f"expected attribute {data_field.meta.name}"
@@ -207,16 +617,129 @@ class BaseFileNode(ABC, Generic[T]):
             setattr(saveable, data_field.meta.name, data_field.value)
 
         # load saveables
+        ancestors = dict() if ancestors is None else ancestors
+        key = self.content_key()
+        if key is not None:
+            ancestors[key] = saveable
+        try:
+            for child_node in self.list_children():
+                if selection is not None and not selection.selects(child_node.name):
+                    continue
+                if not hasattr(saveable, child_node.name):
+                    raise AttributeError(
+                        f"object {saveable} does not have the expected "
+                        f"attribute {child_node.name}"
+                    )
+
+                # references to objects that are being loaded restore cycles.
+                # Objects that have already been loaded from the same data are
+                # shared if requested
+                child_key = child_node.content_key()
+                if child_key is not None:
+                    loaded = ancestors.get(child_key)
+                    if loaded is None and shared is not None:
+                        loaded = shared.get(child_key)
+                    if loaded is not None:
+                        setattr(saveable, child_node.name, loaded)
+                        continue
+
+                obj: Saveable = getattr(saveable, child_node.name)
+                if isinstance(obj, Saveable):
+                    if shared is not None and child_key is not None:
+                        shared[child_key] = obj
+                    child_selection = None
+                    if selection is not None:
+                        child_selection = selection.child(child_node.name)
+                    child_node.validate = self.validate
+                    child_node.load(obj, child_selection, shared, ancestors)
+        finally:
+            if key is not None:
+                ancestors.pop(key, None)
+
+    def load_as_dict(
+        self,
+        selection: FieldSelection | None = None,
+        ancestors: dict[Hashable, dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        load data from node into a dictionary without an instance of the saveable
+        class. Attributes are mapped to their values and child nodes to
+        dictionaries of their own data
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be loaded.
+                                                         None loads all attributes.
+                                                         Defaults to None.
+            ancestors (dict[Hashable, dict[str, Any]] | None, optional): dictionaries
+                                                                        that are
+                                                                        being loaded
+                                                                        by content
+                                                                        key.
+                                                                        References
+                                                                        to them
+                                                                        restore
+                                                                        cycles.
+                                                                        Defaults to
+                                                                        None.
+
+        Returns:
+            dict[str, Any]: data of node by attribute name
+        """
+        data = {
+            data_field.meta.name: data_field.value
+            for data_field in self.read_python_attributes(selection)
+        }
+        ancestors = dict() if ancestors is None else ancestors
+        key = self.content_key()
+        if key is not None:
+            ancestors[key] = data
+        try:
+            for child_node in self.list_children():
+                if selection is not None and not selection.selects(child_node.name):
+                    continue
+                child_key = child_node.content_key()
+                if child_key is not None and child_key in ancestors:
+                    data[child_node.name] = ancestors[child_key]
+                elif selection is None:
+                    data[child_node.name] = child_node.load_as_dict(None, ancestors)
+                else:
+                    data[child_node.name] = child_node.load_as_dict(
+                        selection.child(child_node.name), ancestors
+                    )
+        finally:
+            if key is not None:
+                ancestors.pop(key, None)
+        return data
+
+    def get_child(self, name: str) -> BaseFileNode | None:  # type: ignore[type-arg]
+        """
+        return the child node of given name. File nodes override this method to
+        look up the child by name instead of listing all children
+
+        Args:
+            name (str): name of child node
+
+        Returns:
+            BaseFileNode | None: child node, None if node has no such child
+        """
         for child_node in self.list_children():
-            if not hasattr(saveable, child_node.name):
-                raise AttributeError(
-                    f"object {saveable} does not have the expected "
-                    f"attribute {child_node.name}"
-                )
+            if child_node.name == name:
+                return child_node
+        return None
+
+    def remove(self, name: str) -> None:
+        """
+        remove the data of an attribute or the child node of given name from
+        node, e.g. before the attribute is written again. File nodes of formats
+        that can be updated override this method
 
-            obj: Saveable = getattr(saveable, child_node.name)
-            if isinstance(obj, Saveable):
-                child_node.load(obj)
+        Args:
+            name (str): name of attribute or child node
+
+        Raises:
+            ValueError: if the node cannot be updated
+        """
+        raise ValueError(f"{type(self).__name__} {self.name} cannot be updated")
 
     @abstractmethod
     def __iter__(self) -> Generator[tuple[T, type], None, None]:
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from saveables.saveable.saveable import Saveable
+from saveables.saveable.stream import Stream
+
+if TYPE_CHECKING:
+    from saveables.base.base_file_node import BaseFileNode
+    from saveables.saveable.meta_data import MetaData
+
+# minimal number of elements of lists, tuples and sets that are deduplicated
+dedup_min_length = 64
+
+# number of bytes of a content digest
+digest_size = 16
+
+
+def _encode(value: Any) -> bytes:
+    """
+    encode the value of an attribute that is neither a saveable nor a stream.
+    Values that are equal and are written equally have the same encoding
+
+    Args:
+        value (Any): value of attribute
+
+    Returns:
+        bytes: encoded value
+    """
+    if isinstance(value, set):
+        # the order of equal sets may differ
+        return repr(sorted(value)).encode()
+    if isinstance(value, dict):
+        return repr(list(value.items())).encode()
+    return repr(value).encode()
+
+
+def _update(hash_: Any, data: bytes) -> None:
+    # prefix data with its length, so that concatenations are unambiguous
+    hash_.update(len(data).to_bytes(8, "little"))
+    hash_.update(data)
+
+
+@dataclass
+class ContentIndex:
+    """
+    saveables and large iterables that have been written during a save, along
+    with the file nodes that hold them. Saveables are looked up by their id, so
+    that objects that are referenced more than once are written once and
+    cycles are detected. If deduplicate is True, saveables and iterables are
+    also looked up by the digest of their data. Ids of saveables are only
+    valid while they are written, so an index is only active during a single
+    save
+    """
+
+    deduplicate: bool = True  # look up equal data by digest
+    min_length: int = dedup_min_length  # minimal length of deduplicated iterables
+    # nodes that hold the data of saveables by id of saveable
+    identities: dict[int, BaseFileNode] = field(  # type: ignore[type-arg]
+        default_factory=dict
+    )
+    # ids of saveables whose attributes are being written
+    writing: set[int] = field(default_factory=set)
+    # nodes that hold the data of saveables by digest
+    nodes: dict[bytes, BaseFileNode] = field(  # type: ignore[type-arg]
+        default_factory=dict
+    )
+    # node and name of attribute that hold the data of iterables by digest
+    iterables: dict[bytes, tuple[BaseFileNode, str]] = field(  # type: ignore[type-arg] # noqa: E501
+        default_factory=dict
+    )
+    _digests: dict[int, bytes | None] = field(default_factory=dict)
+    active: bool = True  # False once the save is finished
+
+    def close(self) -> None:
+        """
+        deactivate index after a save and release the nodes it holds
+        """
+        self.active = False
+        self.identities.clear()
+        self.writing.clear()
+        self.nodes.clear()
+        self.iterables.clear()
+        self._digests.clear()
+
+    def digest(self, saveable: Saveable) -> bytes | None:
+        """
+        digest of the data of a saveable and all its child saveables. The
+        digests of child saveables are computed only once
+
+        Args:
+            saveable (Saveable): object whose data are hashed
+
+        Returns:
+            bytes | None: digest, None if the object holds a stream, which can
+                          only be consumed once, or if it is part of a cycle
+        """
+        key = id(saveable)
+        if key in self._digests:
+            return self._digests[key]
+        # saveables whose digest is being computed are reached again by cycles
+        self._digests[key] = None
+
+        hash_ = blake2b(digest_size=digest_size)
+        digest: bytes | None = None
+        for data_field in saveable.iter_fields():
+            _update(hash_, repr(data_field.meta).encode())
+            if isinstance(data_field.value, Stream):
+                break
+            if isinstance(data_field.value, Saveable):
+                child_digest = self.digest(data_field.value)
+                if child_digest is None:
+                    break
+                _update(hash_, child_digest)
+            else:
+                _update(hash_, _encode(data_field.value))
+        else:
+            digest = hash_.digest()
+        self._digests[key] = digest
+        return digest
+
+    def digest_iterable(self, meta: MetaData, value: Any) -> bytes:
+        """
+        digest of a list, tuple or set along with its meta data
+
+        Args:
+            meta (MetaData): meta data of iterable, including its name
+            value (Any): list, tuple or set
+
+        Returns:
+            bytes: digest
+        """
+        hash_ = blake2b(digest_size=digest_size)
+        _update(hash_, repr(meta).encode())
+        _update(hash_, _encode(value))
+        return hash_.digest()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Iterable
+
+# characters that turn a segment of a dotted path into a pattern
+_wildcards = frozenset("*?[")
+
+
+def _split(paths: Iterable[str]) -> tuple[tuple[str, ...], ...]:
+    return tuple(tuple(path.split(".")) for path in paths)
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    """
+    selection of the attributes of a node that are loaded. Attributes of child
+    nodes are selected by dotted paths, e.g. "address.city". Each segment of a
+    path can be a pattern like "raw_*", see fnmatch
+    """
+
+    # split paths of selected attributes. None selects all attributes
+    fields: tuple[tuple[str, ...], ...] | None
+    # split paths of attributes that are excluded even if they are selected
+    exclude: tuple[tuple[str, ...], ...] = ()
+
+    @classmethod
+    def create(
+        cls, fields: Iterable[str] | None = None, exclude: Iterable[str] | None = None
+    ) -> FieldSelection | None:
+        """
+        create selection from dotted paths
+
+        Args:
+            fields (Iterable[str] | None, optional): paths of attributes to be
+                                                     loaded. None loads all
+                                                     attributes. Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+
+        Raises:
+            ValueError: if a path is empty or has an empty segment
+
+        Returns:
+            FieldSelection | None: selection, None if all attributes are selected
+        """
+        fields_ = None if fields is None else _split(fields)
+        exclude_ = () if exclude is None else _split(exclude)
+        for path in (fields_ or ()) + exclude_:
+            if "" in path:
+                raise ValueError(f"invalid path of attribute: {'.'.join(path)}")
+        if fields_ is None and len(exclude_) == 0:
+            return None
+        return cls(fields_, exclude_)
+
+    def selects(self, name: str) -> bool:
+        """
+        check if an attribute or a child node is selected. A child node is
+        selected if any of its attributes is selected
+
+        Args:
+            name (str): name of attribute or child node
+
+        Returns:
+            bool: True if attribute or child node is to be loaded
+        """
+        if any(len(path) == 1 and fnmatchcase(name, path[0]) for path in self.exclude):
+            return False
+        if self.fields is None:
+            return True
+        return any(fnmatchcase(name, path[0]) for path in self.fields)
+
+    def child(self, name: str) -> FieldSelection | None:
+        """
+        selection of attributes within a selected child node
+
+        Args:
+            name (str): name of child node
+
+        Returns:
+            FieldSelection | None: selection within child node, None if all of its
+                                   attributes are selected
+        """
+        fields: tuple[tuple[str, ...], ...] | None = None
+        if self.fields is not None and not any(
+            len(path) == 1 and fnmatchcase(name, path[0]) for path in self.fields
+        ):
+            fields = tuple(
+                path[1:] for path in self.fields if fnmatchcase(name, path[0])
+            )
+        exclude = tuple(
+            path[1:]
+            for path in self.exclude
+            if len(path) > 1 and fnmatchcase(name, path[0])
+        )
+        if fields is None and len(exclude) == 0:
+            return None
+        return FieldSelection(fields, exclude)
+
+    def names(self) -> tuple[str, ...] | None:
+        """
+        names of the attributes that are selected in a node, if they can be
+        looked up by name
+
+        Returns:
+            tuple[str, ...] | None: selected names. None if all attributes are
+                                    selected or if a name is a pattern
+        """
+        if self.fields is None:
+            return None
+        names = tuple(dict.fromkeys(path[0] for path in self.fields))
+        if any(_wildcards.intersection(name) for name in names):
+            return None
+        return tuple(name for name in names if self.selects(name))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import mmap
+from typing import IO
+
+from saveables.base.base_file import BaseFile
+from saveables.binary_format.binary_filenode import BinaryFileNode
+from saveables.binary_format.binary_layout import (BinaryTables,
+                                                   header_struct, magic,
+                                                   version)
+from saveables.contracts.constants import read_mode, root, write_mode
+
+
+class BinaryFile(BaseFile):
+    """
+    compact binary container format to save and load Saveable objects.
+    Files are read through mmap, so that loading only unpacks the payloads
+    that are requested
+    """
+
+    supports_bytes = True
+
+    def open(self) -> None:
+        """
+        prepares file for loading/writing
+
+        Raises:
+            ValueError: if unexpected file mode occurs or file is not a
+                        binary saveables file
+        """
+        self._failed = False
+        if self.mode == write_mode:
+            self._tables = BinaryTables()
+            self.root = BinaryFileNode(root, None, self._tables)
+        elif self.mode == read_mode:
+            self._open_to_read()
+        else:
+            raise ValueError(f"unknown file mode {self.mode}")
+
+    def _open_to_read(self) -> None:
+        """
+        map file into memory, check header and read tables. Files that are held
+        in memory are read from their content
+
+        Raises:
+            ValueError: if file is not a binary saveables file
+        """
+        self._file: IO[bytes] | None = None
+        self._buffer: mmap.mmap | bytes
+        if self._image is not None:
+            self._buffer = self._image
+        else:
+            file = self._file = open(self.path, "rb")
+            try:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                file.close()
+                raise ValueError(f"{self.path} is empty")
+
+        if len(self._buffer) < header_struct.size:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary saveables file")
+        magic_, version_, _, root_offset, tables_offset = header_struct.unpack_from(
+            self._buffer, 0
+        )
+        if magic_ != magic:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary saveables file")
+        if version_ != version:
+            self.close()
+            raise ValueError(f"unsupported version {version_} of file {self.path}")
+
+        self._tables = BinaryTables.unpack(self._buffer, tables_offset)
+        self.root = BinaryFileNode(
+            root, None, self._tables, self._buffer, root_offset
+        )
+
+    def __exit__(self, exc_type, exc_value, traceback):  # type: ignore[no-untyped-def]
+        # nodes are only serialized when the file is closed, so a file whose
+        # with block has raised is not written
+        self._failed = exc_type is not None
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """
+        write collected nodes into file or release mapped file. Files whose
+        with block has raised an error are not written
+
+        Raises:
+            ValueError: if file has not been opened
+        """
+        if self.mode == write_mode:
+            if not isinstance(self.root, BinaryFileNode):
+                raise ValueError(f"binary file {self.path} has not been opened")
+            if self._failed:
+                self.root = None
+                return
+
+            # nodes are serialized first, since they fill the tables
+            body = self.root.serialize()
+            tables = self._tables.pack()
+            root_offset = header_struct.size
+            tables_offset = root_offset + len(body)
+            header = header_struct.pack(magic, version, 0, root_offset, tables_offset)
+            if self._image is not None:
+                self._image = b"".join((header, body, tables))
+                return
+            with open(self.path, "wb") as f:
+                f.write(header)
+                f.write(body)
+                f.write(tables)
+        elif self.mode == read_mode:
+            self.root = None
+            if self._file is not None:
+                self._buffer.close()  # type: ignore[union-attr]
+                self._file.close()
@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Generator, Union
+
+from saveables.base.base_file_node import (BaseFileNode, check_stream,
+                                           empty_stream_meta)
+from saveables.binary_format.binary_layout import (BinaryTables, count_struct,
+                                                   entry_struct, format_chars,
+                                                   kind_array, kind_node,
+                                                   kind_scalar)
+from saveables.binary_format.binaryfiledata import BinaryFileData
+from saveables.contracts.constants import (attribute, dict_keys, dict_values,
+                                           empty_type, encoding, none_type)
+from saveables.contracts.data_type import (python_type_literal_map_reversed,
+                                           supported_primitive_data_types)
+from saveables.saveable.data_field import DataField
+from saveables.saveable.meta_data import MetaData, get_meta_data
+from saveables.saveable.saveable import Saveable
+from saveables.saveable.utils import is_supported_primitive
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+    from saveables.base.field_selection import FieldSelection
+    from saveables.contracts.data_type import tPrimitiveDataType
+
+# payload of an entry that is about to be written. Nested nodes are serialized
+# not before the file is closed
+tPayload = Union[bytes, "BinaryFileNode"]
+
+
+def pack_count(count: int) -> bytes:
+    """
+    pack a number of elements, entries or bytes
+
+    Args:
+        count (int): number to be packed
+
+    Raises:
+        ValueError: if count does not fit into the 4 bytes of a count
+
+    Returns:
+        bytes: packed number
+    """
+    try:
+        return count_struct.pack(count)
+    except struct.error:
+        raise ValueError(
+            f"count {count} exceeds the maximum of the binary format "
+            f"{2 ** (8 * count_struct.size) - 1}"
+        )
+
+
+def pack_scalar(value: tPrimitiveDataType, type_literal: str) -> bytes:
+    """
+    pack a primitive value
+
+    Args:
+        value (tPrimitiveDataType): value to be packed
+        type_literal (str): python type literal of value
+
+    Raises:
+        ValueError: if value cannot be represented in the binary format
+
+    Returns:
+        bytes: packed value
+    """
+    if type_literal == none_type:
+        return b""
+    if isinstance(value, str):
+        return value.encode(encoding)
+    try:
+        return struct.pack(f"<{format_chars[type_literal]}", value)
+    except (KeyError, struct.error) as e:
+        raise ValueError(f"cannot pack {value} as {type_literal}: {e}")
+
+
+def pack_array(values: list[tPrimitiveDataType], type_literal: str) -> bytes:
+    """
+    pack a list of uniformly typed primitive values
+
+    Args:
+        values (list[tPrimitiveDataType]): values to be packed
+        type_literal (str): python type literal of the elements
+
+    Raises:
+        ValueError: if values cannot be represented in the binary format
+
+    Returns:
+        bytes: number of elements followed by packed elements
+    """
+    count = pack_count(len(values))
+    if len(values) == 0 or type_literal == empty_type:
+        return count
+    return count + pack_elements(values, type_literal)
+
+
+def pack_elements(values: list[tPrimitiveDataType], type_literal: str) -> bytes:
+    """
+    pack uniformly typed primitive values without the number of elements, e.g.
+    a chunk of an array
+
+    Args:
+        values (list[tPrimitiveDataType]): values to be packed
+        type_literal (str): python type literal of the elements
+
+    Raises:
+        ValueError: if values cannot be represented in the binary format
+
+    Returns:
+        bytes: packed elements
+    """
+    if type_literal == "str":
+        parts = []
+        for value in values:
+            encoded = str(value).encode(encoding)
+            parts.append(pack_count(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+    try:
+        return struct.pack(f"<{len(values)}{format_chars[type_literal]}", *values)
+    except (KeyError, struct.error) as e:
+        raise ValueError(f"cannot pack elements as {type_literal}: {e}")
+
+
+class BinaryFileNode(BaseFileNode[BinaryFileData]):
+    """
+    node of the binary container format. When writing, entries are collected in
+    memory and serialized when the file is closed. When reading, entries are
+    located in the memory mapped file and only the requested payloads are
+    unpacked
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: BinaryFileNode | None,
+        tables: BinaryTables,
+        buffer: mmap | bytes | None = None,
+        offset: int = 0,
+    ):
+        super().__init__(name, parent)
+        self._tables = tables
+        self._buffer = buffer  # content of file, None if node is written
+        self._offset = offset  # position of node in buffer
+        self._entries: list[tuple[int, int, tPayload]] = []  # entries to be written
+        self._written: set[tuple[str, str]] = set()  # names and roles of entries
+        self._dict_keys_cache: dict[
+            str, list[float] | list[str] | list[int] | list[bool]
+        ] = dict()
+        self._dict_values_cache: dict[
+            str, list[float] | list[str] | list[int] | list[bool]
+        ] = dict()
+
+    def _iter_entries(self) -> Generator[BinaryFileData, None, None]:
+        """
+        iterate through the entries of the node in the file
+
+        Raises:
+            ValueError: if node has not been read from a file
+        """
+        if self._buffer is None:
+            raise ValueError(f"node {self.name} has not been read from a file")
+        buffer = self._buffer
+        (n_entries,) = count_struct.unpack_from(buffer, self._offset)
+        offset = self._offset + count_struct.size
+        for _ in range(n_entries):
+            meta_index, kind, length = entry_struct.unpack_from(buffer, offset)
+            offset += entry_struct.size
+            yield BinaryFileData(self._tables.metas[meta_index], kind, offset, length)
+            offset += length
+
+    def __iter__(self) -> Generator[tuple[BinaryFileData, type], None, None]:
+        yield from self.iter_attributes()
+
+    def iter_attributes(
+        self, selection: FieldSelection | None = None
+    ) -> Generator[tuple[BinaryFileData, type], None, None]:
+        """
+        iterate over the entries of the node. Entries that are not selected are
+        skipped by their meta data, so that their payload is never unpacked
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+
+        Yields:
+            Generator[tuple[BinaryFileData, type], None, None]: entry and python
+                                                                type
+        """
+        for filedata in self._iter_entries():
+            if selection is not None and not selection.selects(filedata.meta.name):
+                continue
+            if filedata.kind == kind_node:
+                yield filedata, Saveable
+            else:
+                yield filedata, python_type_literal_map_reversed[
+                    filedata.meta.python_type
+                ]
+
+    def read_python_attributes(
+        self, selection: FieldSelection | None = None, chunk_size: int | None = None
+    ) -> list[DataField]:
+        """
+        read data from file that represents
+        native python data type like str, int, list etc
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+            chunk_size (int | None, optional): if given, lists, tuples and sets are
+                                               read as streams of this chunk size.
+                                               Defaults to None.
+
+        Returns:
+            list: list of DataField objects holds data along with meta data
+        """
+        # call super call method with cleared caches
+        self._dict_keys_cache = dict()
+        self._dict_values_cache = dict()
+        return super().read_python_attributes(selection, chunk_size)
+
+    def list_children(self) -> list[BaseFileNode[BinaryFileData]]:
+        """
+        list child nodes of current node
+
+        Returns:
+            list[BaseFileNode]: children of current node
+        """
+        if self._buffer is None:
+            return [
+                payload
+                for _, kind, payload in self._entries
+                if isinstance(payload, BinaryFileNode)
+            ]
+        return [
+            BinaryFileNode(
+                filedata.meta.name, self, self._tables, self._buffer, filedata.offset
+            )
+            for filedata in self._iter_entries()
+            if filedata.kind == kind_node
+        ]
+
+    def create_child_node(self, meta: MetaData) -> BinaryFileNode:
+        """
+        create child node from given meta data
+
+        Args:
+            meta (MetaData): holds meta data neccessary
+                             to create a node, like name
+                             etc.
+
+        Returns:
+            BinaryFileNode: newly created child node
+        """
+        child = BinaryFileNode(meta.name, self, self._tables)
+        self._add_entry(meta, kind_node, child)
+        return child
+
+    def write_primitive_data(self, data_field: DataField) -> None:
+        """
+        write scalar supported data to file node
+
+        Args:
+            data_field (DataField): object that holds scalar data and its meta data to
+                                    be written into node
+
+        Raises:
+            TypeError: if data type is not supported
+        """
+        if self.validate and not is_supported_primitive(data_field.value):
+            raise TypeError(f"data type {type(data_field.value)} is not supported")
+
+        payload = pack_scalar(data_field.value, data_field.meta.python_type)  # type: ignore[arg-type] # noqa: E501
+        self._add_entry(data_field.meta, kind_scalar, payload)
+
+    def write_simple_iterable(self, data_field: DataField) -> None:
+        """
+        write python lists / tuples / set with uniformly typed
+        elements into node as a packed array
+
+        Args:
+            data_field (DataField): object that holds list / tuple / set and its meta
+                                    data to be written into node
+
+        Raises:
+            ValueError: if meta data indicates that the list / tuple / set is empty
+                        but it is not
+        """
+        # the elements have been checked when the data field was created
+        values = list(data_field.value)  # type: ignore[arg-type]
+        if len(values) and data_field.meta.element_type == empty_type:
+            raise ValueError(
+                f"data for {data_field.meta.name} is declared as empty, but it is not"
+            )
+        payload = pack_array(values, data_field.meta.element_type)
+        self._add_entry(data_field.meta, kind_array, payload)
+
+    def write_stream(self, data_field: DataField) -> None:
+        """
+        write elements of a stream into node as a packed array. Each chunk of
+        elements is packed before the next chunk is consumed, so that only the
+        packed payload is held in memory until the file is closed
+
+        Args:
+            data_field (DataField): object that holds a stream and its meta data
+        """
+        parts: list[bytes] = [b""]
+        n_elements = 0
+        for chunk in check_stream(data_field).iter_chunks():
+            parts.append(pack_elements(chunk, data_field.meta.element_type))
+            n_elements += len(chunk)
+        meta = data_field.meta if n_elements else empty_stream_meta(data_field.meta)
+        parts[0] = pack_count(n_elements)
+        self._add_entry(meta, kind_array, b"".join(parts))
+
+    def write_none(self, data_field: DataField) -> None:
+        """
+        special method to write None into file node
+
+        Args:
+            data_field (DataField): object that holds None as a data along with its
+                                    meta data
+
+        Raises:
+            TypeError: if data to be written is not None
+        """
+        if data_field.value is not None:
+            raise TypeError(
+                f"datafield {data_field.meta.name} is"
+                f"expected to be None but is {data_field.value}"
+            )
+        none_meta = get_meta_data(
+            python_type=none_type,
+            name=data_field.meta.name,
+            role=data_field.meta.role,
+            element_type=none_type,  # type: ignore[arg-type]
+        )
+        self._add_entry(none_meta, kind_scalar, b"")
+
+    def read_primitive_data(self, filedata: BinaryFileData) -> DataField:
+        """
+        read file data that represents primitive python data like int, str, float etc.
+
+        Args:
+            filedata (BinaryFileData): entry of node
+
+        Returns:
+            DataField: object that holds read data and its meta data
+        """
+        value = self._unpack_scalar(filedata)
+        return DataField(meta=filedata.meta, value=value)
+
+    def read_simple_iterable(self, filedata: BinaryFileData) -> DataField | None:
+        """
+        read list, set or tuple whose elements have all the same type
+
+        Args:
+            filedata (BinaryFileData): entry of node
+
+        Returns:
+            DataField | None: object that holds read data and its meta data
+        """
+        values = self._unpack_array(filedata)
+        python_type_ = python_type_literal_map_reversed[filedata.meta.python_type]
+        return DataField(meta=filedata.meta, value=python_type_(values))
+
+    def read_simple_dictionary(self, filedata: BinaryFileData) -> DataField | None:
+        """
+        read dictionaries whose keys have all the same type
+        and whose values have all the same type
+
+        Args:
+            filedata (BinaryFileData): entry of node that holds dictionary keys or
+                                       dictionary values
+
+        Returns:
+            DataField | None: if keys and values have been read, a datafield
+                              is returned
+        """
+        meta = filedata.meta
+        values = self._unpack_array(filedata)
+        if meta.role == dict_keys:
+            self._dict_keys_cache[meta.name] = values  # type: ignore[assignment]
+        if meta.role == dict_values:
+            self._dict_values_cache[meta.name] = values  # type: ignore[assignment]
+
+        # if keys and values are read, create datafield
+        if meta.name in self._dict_keys_cache and meta.name in self._dict_values_cache:
+            dict_meta = get_meta_data(
+                python_type=meta.python_type,
+                role=attribute,
+                name=meta.name,
+                element_type=none_type,  # type: ignore[arg-type]
+            )
+            keys = self._dict_keys_cache[meta.name]
+            value = dict(zip(keys, self._dict_values_cache[meta.name]))
+            return DataField(value=value, meta=dict_meta)
+        return None
+
+    def serialize(self) -> bytes:
+        """
+        serialize node and its children
+
+        Returns:
+            bytes: serialized node
+        """
+        parts: list[bytes] = [pack_count(len(self._entries))]
+        for meta_index, kind, payload in self._entries:
+            if isinstance(payload, BinaryFileNode):
+                payload = payload.serialize()
+            parts.append(entry_struct.pack(meta_index, kind, len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+    def _add_entry(self, meta: MetaData, kind: int, payload: tPayload) -> None:
+        """
+        add entry to node
+
+        Args:
+            meta (MetaData): meta data of entry
+            kind (int): kind of entry
+            payload (tPayload): packed data or child node
+
+        Raises:
+            ValueError: if node has been opened for reading or already holds an
+                        entry of the same name and role
+        """
+        if self._buffer is not None:
+            raise ValueError(f"node {self.name} has been opened for reading")
+        if (meta.name, meta.role) in self._written:
+            raise ValueError(f"node {self.name} already holds attribute {meta.name}")
+        self._written.add((meta.name, meta.role))
+        self._entries.append((self._tables.meta_index(meta), kind, payload))
+
+    def _unpack_scalar(self, filedata: BinaryFileData) -> tPrimitiveDataType:
+        """
+        unpack scalar value of given entry
+
+        Args:
+            filedata (BinaryFileData): entry of node
+
+        Returns:
+            tPrimitiveDataType: unpacked value
+        """
+        buffer = self._buffer
+        if buffer is None:
+            raise ValueError(f"node {self.name} has not been read from a file")
+        type_literal = filedata.meta.python_type
+        if type_literal == none_type:
+            return None
+        if type_literal == "str":
+            start = filedata.offset
+            return buffer[start : start + filedata.length].decode(encoding)
+        (value,) = struct.unpack_from(
+            f"<{format_chars[type_literal]}", buffer, filedata.offset
+        )
+        return value  # type: ignore[no-any-return]
+
+    def _unpack_array(self, filedata: BinaryFileData) -> list[tPrimitiveDataType]:
+        """
+        unpack elements of given array entry
+
+        Args:
+            filedata (BinaryFileData): entry of node
+
+        Returns:
+            list[tPrimitiveDataType]: unpacked elements
+        """
+        buffer = self._buffer
+        if buffer is None:
+            raise ValueError(f"node {self.name} has not been read from a file")
+        (count,) = count_struct.unpack_from(buffer, filedata.offset)
+        offset = filedata.offset + count_struct.size
+        type_literal = filedata.meta.element_type
+        if count == 0:
+            return []
+        if type_literal == "str":
+            values: list[tPrimitiveDataType] = []
+            for _ in range(count):
+                (length,) = count_struct.unpack_from(buffer, offset)
+                offset += count_struct.size
+                values.append(buffer[offset : offset + length].decode(encoding))
+                offset += length
+            return values
+        element_type_ = python_type_literal_map_reversed[type_literal]
+        if element_type_ not in supported_primitive_data_types:
+            raise ValueError(f"unsupported element type {type_literal}")
+        return list(
+            struct.unpack_from(f"<{count}{format_chars[type_literal]}", buffer, offset)
+        )
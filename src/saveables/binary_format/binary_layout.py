@@ -0,0 +1,152 @@
+"""
+layout of the binary container format. All numbers are little endian.
+
+    header      magic (8 bytes), version (u32), reserved (u32),
+                offset of root node (u64), offset of tables (u64)
+    node        number of entries (u32) followed by the entries
+    entry       meta data index (u32), kind (u8), payload length (u64), payload
+    payload     scalar: packed value, utf-8 bytes for strings, nothing for None
+                array:  number of elements (u32) followed by the packed elements,
+                        strings are packed as length (u32) and utf-8 bytes
+                node:   a nested node
+    tables      string table: number of strings (u32), each string as
+                length (u32) and utf-8 bytes
+                meta data table: number of meta data (u32), each meta data
+                as four string table indices (u32) in the order of the MetaData
+                fields
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from saveables.contracts.constants import encoding
+from saveables.saveable.meta_data import MetaData, get_meta_data
+from saveables.saveable.utils import (list_meta_data_attribute_values,
+                                      list_meta_data_attributes)
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+magic = b"SAVEBIN\x00"
+version = 1
+header_struct = struct.Struct("<8sIIQQ")
+count_struct = struct.Struct("<I")
+entry_struct = struct.Struct("<IBQ")
+meta_struct = struct.Struct("<IIII")
+
+# kinds of node entries
+kind_scalar = 0
+kind_array = 1
+kind_node = 2
+
+# struct format characters of primitive python type literals
+# strings are stored as utf-8 bytes and None does not have a payload
+format_chars: dict[str, str] = {"int": "q", "float": "d", "bool": "?"}
+
+
+class BinaryTables:
+    """
+    string table and meta data table of a binary file. Each string and each
+    meta data object is stored only once and referenced by its index
+    """
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.metas: list[MetaData] = []
+        self._string_indices: dict[str, int] = dict()
+        self._meta_indices: dict[MetaData, int] = dict()
+
+    def string_index(self, string: str) -> int:
+        """
+        return index of given string and add it to the table if neccessary
+
+        Args:
+            string (str): string to be looked up
+
+        Returns:
+            int: index of string in string table
+        """
+        try:
+            return self._string_indices[string]
+        except KeyError:
+            index = len(self.strings)
+            self.strings.append(string)
+            self._string_indices[string] = index
+            return index
+
+    def meta_index(self, meta: MetaData) -> int:
+        """
+        return index of given meta data and add it to the table if neccessary
+
+        Args:
+            meta (MetaData): meta data to be looked up
+
+        Returns:
+            int: index of meta data in meta data table
+        """
+        try:
+            return self._meta_indices[meta]
+        except KeyError:
+            index = len(self.metas)
+            self.metas.append(meta)
+            self._meta_indices[meta] = index
+            for value in list_meta_data_attribute_values(meta):
+                self.string_index(value)
+            return index
+
+    def pack(self) -> bytes:
+        """
+        pack string table and meta data table
+
+        Returns:
+            bytes: packed tables
+        """
+        parts: list[bytes] = [count_struct.pack(len(self.strings))]
+        for string in self.strings:
+            encoded = string.encode(encoding)
+            parts.append(count_struct.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(count_struct.pack(len(self.metas)))
+        for meta in self.metas:
+            indices = [
+                self._string_indices[value]
+                for value in list_meta_data_attribute_values(meta)
+            ]
+            parts.append(meta_struct.pack(*indices))
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, buffer: mmap | bytes, offset: int) -> BinaryTables:
+        """
+        read string table and meta data table from buffer
+
+        Args:
+            buffer (mmap | bytes): content of binary file
+            offset (int): position of tables in buffer
+
+        Returns:
+            BinaryTables: tables read from buffer
+        """
+        tables = cls()
+        (n_strings,) = count_struct.unpack_from(buffer, offset)
+        offset += count_struct.size
+        for _ in range(n_strings):
+            (length,) = count_struct.unpack_from(buffer, offset)
+            offset += count_struct.size
+            tables.string_index(buffer[offset : offset + length].decode(encoding))
+            offset += length
+
+        (n_metas,) = count_struct.unpack_from(buffer, offset)
+        offset += count_struct.size
+        field_names = list_meta_data_attributes()
+        for _ in range(n_metas):
+            indices = meta_struct.unpack_from(buffer, offset)
+            offset += meta_struct.size
+            kwargs = {
+                field_name: tables.strings[index]
+                for field_name, index in zip(field_names, indices)
+            }
+            tables.meta_index(get_meta_data(**kwargs))
+        return tables
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from saveables.saveable.meta_data import MetaData
+
+
+@dataclass
+class BinaryFileData:
+    """
+    object that is extracted from a binary file for each entry of a node
+    """
+
+    meta: MetaData  # meta data of entry
+    kind: int  # kind of entry, see constants in binary_layout
+    offset: int  # position of entry payload in file
+    length: int  # length of entry payload in bytes
@@ -18,11 +18,18 @@ dict_keys: tRole = "dict_keys"
 attribute: tRole = "attribute"
 read_mode: tFileMode = "r"
 write_mode: tFileMode = "w"
+update_mode: tFileMode = "a"  # existing files are read and updated in place
 encoding = "utf-8"
 none_literal = "__NONE__"
 empty_type: tPythonTypeLiteral = "empty_iterable"
 none_type: tPythonTypeLiteral = "none_type"
+packed_meta_data = "__meta_data__"  # hdf5 attribute that holds all meta data
+packed_scalars = "__scalars__"  # hdf5 dataset that holds all scalars of a node
+xml_id = "id"  # xml attribute that identifies an element that is referenced
+xml_ref = "ref"  # xml attribute that holds the id of the referenced element
 meta_data_table_name = "meta_data"
+nodes_table_name = "saveables_nodes"  # references of consolidated sqlite3 layout
+values_table_name = "saveables_values"  # data of consolidated sqlite3 layout
 column_name_object_id = "object_id"
 column_name_data = "data"
 column_name_meta_data = "meta_data"
@@ -36,4 +43,6 @@ column_names = [
     column_name_reference,
     column_name_reference_id,
 ]
-n_object_id_chars = 8
+# object ids are complete uuid4 hex strings, so that nodes do not share ids,
+# also not among all nodes of the consolidated sqlite3 layout
+n_object_id_chars = 32
@@ -14,7 +14,8 @@ tPythonTypeLiteral = (
     tPrimitivePythonLiteral | tIterablePythonLiteral | Literal["saveable"]
 )
 tRole = Literal["attribute", "dict_keys", "dict_values"]
-tFileMode = Literal["r", "w"]
+tFileMode = Literal["r", "w", "a"]
+tSqlite3Layout = Literal["tables", "consolidated"]
 python_type_literal_map: dict[type, tPythonTypeLiteral] = {
     list: "list",
     set: "set",
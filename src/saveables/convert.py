@@ -0,0 +1,216 @@
+"""
+convert files from one format into another without the classes of the saved
+objects. The nodes of the source file are read one by one and written into the
+target file. Lists, tuples and sets are piped as streams, so that only one chunk
+of their elements is held in memory at once
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Hashable, Iterable
+
+from saveables.backends import (detect_format, get_backend, get_file_class,
+                                get_format_from_extension)
+from saveables.contracts.constants import (attribute, read_mode, saveable,
+                                           write_mode)
+from saveables.python_utils import generate_uuid
+from saveables.saveable.meta_data import get_meta_data
+from saveables.saveable.stream import stream_chunk_size
+
+if TYPE_CHECKING:
+    from saveables.base.base_file_node import BaseFileNode
+
+
+def convert_node(
+    source: BaseFileNode,  # type: ignore[type-arg]
+    target: BaseFileNode,  # type: ignore[type-arg]
+    chunk_size: int = stream_chunk_size,
+    converted: dict[Hashable, BaseFileNode] | None = None,  # type: ignore[type-arg]
+    converting: set[Hashable] | None = None,
+) -> None:
+    """
+    write the data of a node and of all its child nodes into a node of another
+    file. Nodes that are referenced more than once in the source file are
+    written once and referenced in the target file if its format supports
+    references
+
+    Args:
+        source (BaseFileNode): node that is read
+        target (BaseFileNode): node that is written
+        chunk_size (int, optional): number of elements of lists, tuples and sets
+                                    that are held in memory at once.
+                                    Defaults to stream_chunk_size.
+        converted (dict[Hashable, BaseFileNode] | None, optional): written target
+                                                                  nodes by content
+                                                                  key of their
+                                                                  source nodes.
+                                                                  Defaults to
+                                                                  None.
+        converting (set[Hashable] | None, optional): content keys of source nodes
+                                                     that are being converted.
+                                                     Defaults to None.
+
+    Raises:
+        ValueError: if the source file holds a cycle that the target format
+                    cannot write
+    """
+    converted = dict() if converted is None else converted
+    converting = set() if converting is None else converting
+    key = source.content_key()
+    if key is not None:
+        converted[key] = target
+        converting.add(key)
+
+    for data_field in source.read_python_attributes(chunk_size=chunk_size):
+        target.write_data(data_field)
+    target.finish_writing()
+    for child_node in source.list_children():
+        meta = get_meta_data(saveable, attribute, child_node.name, saveable)  # type: ignore[arg-type] # noqa: E501
+        child_key = child_node.content_key()
+        if child_key is not None and child_key in converted:
+            if target.link_saveable(meta, converted[child_key]):
+                continue
+            if child_key in converting:
+                raise ValueError(
+                    f"node {child_node.name} of {source.name} is a cyclic "
+                    f"reference, which {type(target).__name__} cannot write"
+                )
+        convert_node(
+            child_node,
+            target.create_child_node(meta),
+            chunk_size,
+            converted,
+            converting,
+        )
+    converting.discard(key)
+
+
+def convert(
+    source: str | Path,
+    target: str | Path,
+    format: str | None = None,
+    chunk_size: int = stream_chunk_size,
+    **kwargs: Any,
+) -> Path:
+    """
+    convert a file into another format. The format of the source file is
+    detected from its first bytes. The nodes are written into a temporary file
+    next to the target, which replaces the target once the conversion
+    succeeded. A conversion that fails removes the temporary file and leaves
+    no partial target, an existing target is kept
+
+    Args:
+        source (str | Path): path of file that is read
+        target (str | Path): path of file that is written
+        format (str | None, optional): name of target format. If None, the format
+                                       is determined from the extension of
+                                       target. Defaults to None.
+        chunk_size (int, optional): number of elements of lists, tuples and sets
+                                    that are held in memory at once.
+                                    Defaults to stream_chunk_size.
+        kwargs (Any): further keyword arguments passed to the target file class
+
+    Raises:
+        ValueError: if the source file is the target file
+
+    Returns:
+        Path: path of written file
+    """
+    source_, target_ = Path(source), Path(target)
+    if source_.resolve() == target_.resolve():
+        raise ValueError(f"cannot convert {source_} into itself")
+    if format is None:
+        format = get_format_from_extension(target_)
+    source_file = get_file_class(detect_format(source_))(source_, read_mode)
+    # the temporary file keeps the extensions of the target, which select codecs
+    temporary = target_.with_name(f".{generate_uuid(8)}.{target_.name}")
+    target_file = get_file_class(format)(temporary, write_mode, **kwargs)
+    try:
+        with source_file, target_file, target_file.transaction():
+            if source_file.root is None or target_file.root is None:
+                raise ValueError("no root node initialized")
+            convert_node(source_file.root, target_file.root, chunk_size)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    os.replace(temporary, target_)
+    return target_
+
+
+def target_path(
+    source: str | Path, format: str, directory: str | Path | None = None
+) -> Path:
+    """
+    path of the converted file, e.g. "data.xml" becomes "data.h5" for format
+    "hdf5". The extension of the source format is replaced by the first
+    extension of the target format
+
+    Args:
+        source (str | Path): path of file that is converted
+        format (str): name of target format
+        directory (str | Path | None, optional): directory of converted file. If
+                                                 None, it is the directory of
+                                                 source. Defaults to None.
+
+    Returns:
+        Path: path of converted file
+    """
+    source_ = Path(source)
+    stem = source_.stem
+    try:
+        source_format = get_format_from_extension(source_)
+    except ValueError:
+        pass
+    else:
+        for extension in get_backend(source_format).extensions:
+            if source_.name.lower().endswith(extension):
+                stem = source_.name[: -len(extension)]
+                break
+    directory_ = source_.parent if directory is None else Path(directory)
+    return directory_ / f"{stem}{get_backend(format).extensions[0]}"
+
+
+def convert_many(
+    sources: Iterable[str | Path],
+    targets: Iterable[str | Path],
+    format: str | None = None,
+    chunk_size: int = stream_chunk_size,
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[Path]:
+    """
+    convert files in parallel. Each file is converted in a process of its own
+
+    Args:
+        sources (Iterable[str | Path]): paths of files that are read
+        targets (Iterable[str | Path]): paths of files that are written, one per
+                                        source
+        format (str | None, optional): name of target format. If None, the format
+                                       of each target is determined from its
+                                       extension. Defaults to None.
+        chunk_size (int, optional): number of elements of lists, tuples and sets
+                                    that are held in memory at once.
+                                    Defaults to stream_chunk_size.
+        max_workers (int | None, optional): number of processes. If None, the
+                                            number of processors is used.
+                                            Defaults to None.
+        kwargs (Any): further keyword arguments passed to the target file class
+
+    Raises:
+        ValueError: if the numbers of sources and targets differ
+
+    Returns:
+        list[Path]: paths of written files
+    """
+    sources_, targets_ = list(sources), list(targets)
+    if len(sources_) != len(targets_):
+        raise ValueError(
+            f"got {len(sources_)} sources but {len(targets_)} targets to convert"
+        )
+    convert_ = partial(convert, format=format, chunk_size=chunk_size, **kwargs)
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(convert_, sources_, targets_))
@@ -1,13 +1,96 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
 import h5py
 
-from saveables.base.base_file import BaseFile
-from saveables.contracts.constants import read_mode, root, write_mode
+from saveables.base.base_file import BaseFile, memory_path
+from saveables.contracts.constants import (read_mode, root, update_mode,
+                                           write_mode)
 from saveables.hdf5_format.h5_filenode import H5FileNode
+from saveables.hdf5_format.h5_profile import H5Profile, default_profile
+
+if TYPE_CHECKING:
+    from saveables.contracts.data_type import tFileMode
 
 
 class H5File(BaseFile):
     """HDF5 specific implementations to save and load Saveable objects"""
 
+    supports_bytes = True
+
+    def __init__(
+        self,
+        path: str | Path | IO[bytes],
+        mode: tFileMode,
+        pack_meta_data: bool = False,
+        deduplicate: bool = False,
+        swmr: bool = False,
+        driver: str | None = None,
+        backing_store: bool = True,
+        profile: H5Profile = default_profile,
+        pack_scalars: bool = False,
+    ):
+        """
+        Args:
+            path (str | Path | IO[bytes]): path of hdf5 file or binary file-like
+                                           object, e.g. io.BytesIO
+            mode (tFileMode): file mode
+            pack_meta_data (bool, optional): if True, the meta data of each dataset
+                                             are written into a single attribute
+                                             instead of one attribute per meta data
+                                             field. Files with either layout can
+                                             be read regardless of this flag.
+                                             Defaults to False.
+            deduplicate (bool, optional): if True, saveables and large lists,
+                                          tuples and sets that equal data that
+                                          have already been written are saved
+                                          as hard links. Defaults to False.
+            swmr (bool, optional): if True, the file is accessed in single writer
+                                   multiple reader mode. Files are written with
+                                   the latest file format and lists as resizable
+                                   datasets, which a single process can append
+                                   to while other processes read the file, see
+                                   start_swmr, append and refresh. Files that are
+                                   updated must have been written with swmr=True.
+                                   Defaults to False.
+            driver (str | None, optional): HDF5 file driver, e.g. "core", which
+                                           holds the file in memory. None uses
+                                           the default driver. Defaults to None.
+            backing_store (bool, optional): if False, files of the core driver are
+                                            not written to the file system when
+                                            they are closed. Defaults to True.
+            profile (H5Profile, optional): options of the hdf5 library, e.g.
+                                           paged_profile for files with many
+                                           small datasets. Options that are
+                                           stored in the file only apply when it
+                                           is written. Files that are updated
+                                           with a page buffer must have been
+                                           written with the "page" file space
+                                           strategy. Defaults to default_profile.
+            pack_scalars (bool, optional): if True, the int, float, bool and str
+                                           attributes of each object are written
+                                           into a single compound dataset
+                                           instead of one dataset per attribute.
+                                           Files with either layout can be read
+                                           regardless of this flag.
+                                           Defaults to False.
+        """
+        # file-like objects are read and written by h5py directly
+        self.fileobj: IO[bytes] | None = None
+        if not isinstance(path, (str, Path)):
+            self.fileobj, path = path, memory_path
+        super().__init__(path, mode)
+        self.pack_meta_data = pack_meta_data
+        self.deduplicate = deduplicate
+        self.swmr = swmr
+        self.driver = driver
+        self.backing_store = backing_store
+        self.profile = profile
+        self.pack_scalars = pack_scalars
+
     def open(self) -> None:
         """
         prepares file for loading/writing
@@ -15,17 +98,98 @@ class H5File(BaseFile):
         Raises:
             ValueError: if unexpected file mode occurs
         """
-        # open hdf5 file
-        self._file = h5py.File(str(self.path), mode=self.mode)
+        # open hdf5 file and create root node. Files that are updated are opened
+        # for reading and writing without being truncated
+        name_: str | IO[bytes] = (
+            str(self.path) if self.fileobj is None else self.fileobj
+        )
+        kwargs = self.profile.options(self.mode)
+        if self.swmr:
+            kwargs["libver"] = "latest"
+        if self.driver is not None:
+            kwargs["driver"] = self.driver
+        if self.driver == "core":
+            kwargs["backing_store"] = self.backing_store
+        if self._image is not None and self.mode == write_mode:
+            # files that are written into memory have no backing file
+            kwargs.update(driver="core", backing_store=False)
+        elif self._image is not None:
+            name_ = BytesIO(self._image)
 
-        # create root node
         if self.mode == write_mode:
+            self._file = h5py.File(name_, mode=write_mode, **kwargs)
             group = self._file.create_group(root)
         elif self.mode == read_mode:
+            self._file = h5py.File(name_, mode=read_mode, swmr=self.swmr, **kwargs)
+            group = self._file[root]
+        elif self.mode == update_mode:
+            self._file = h5py.File(name_, mode="r+", **kwargs)
             group = self._file[root]
         else:
             raise ValueError(f"unknown file mode {self.mode}")
-        self.root = H5FileNode(root, None, group)
+        self.root = H5FileNode(
+            root, None, group, self.pack_meta_data, self.swmr, self.pack_scalars
+        )
+
+    def start_swmr(self) -> None:
+        """
+        switch a file that has been written or opened for update into single
+        writer multiple reader mode, so that other processes can open it for
+        reading. No attributes or objects can be added afterwards, but the
+        elements of lists can be appended
+
+        Raises:
+            ValueError: if file has not been opened with swmr=True for writing
+        """
+        if not self.swmr or self.mode == read_mode:
+            raise ValueError(
+                f"{self.path} has not been opened with swmr=True for writing"
+            )
+        self._file.swmr_mode = True
+
+    def append(self, path: str, values: list[Any] | tuple[Any, ...]) -> None:
+        """
+        append elements to a list in the file, e.g. append("history.loss", [0.1]).
+        Lists that are written with swmr=True or from streams can be appended.
+        The elements are flushed, so that readers see them once they refresh
+
+        Args:
+            path (str): dotted path of attribute that holds the list
+            values (list[Any] | tuple[Any, ...]): elements to be appended, of the
+                                                  same type as the elements of
+                                                  the list
+
+        Raises:
+            ValueError: if file is opened for reading or if list cannot be
+                        appended
+            KeyError: if file has no list at given path
+            TypeError: if elements are not of the type of the list's elements
+        """
+        if self.mode == read_mode:
+            raise ValueError(f"{self.path} has been opened for reading")
+        node, name_ = self._walk(path)
+        node.append(name_, values)  # type: ignore[attr-defined]
+
+    def refresh(self) -> None:
+        """
+        refresh a file that is read in single writer multiple reader mode, so
+        that the elements a writer has appended since the file has been opened
+        or last refreshed are loaded
+
+        Raises:
+            ValueError: if file has not been opened with swmr=True for reading
+        """
+        if not self.swmr or self.mode != read_mode:
+            raise ValueError(
+                f"{self.path} has not been opened with swmr=True for reading"
+            )
+        self.root.refresh()  # type: ignore[union-attr]
 
     def close(self) -> None:
+        if self._image is not None and self.mode == write_mode:
+            self._file.flush()
+            self._image = self._file.id.get_file_image()
+        if isinstance(self.root, H5FileNode):
+            self.root.release()
+        self.root = None
         self._file.close()
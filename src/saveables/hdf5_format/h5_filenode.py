@@ -1,31 +1,101 @@
 from __future__ import annotations
 
-from dataclasses import fields
-from typing import Any, Generator
+import re
+from typing import TYPE_CHECKING, Any, Generator, Hashable
 
 import h5py
 import numpy as np
-from h5py import Dataset, Group
+from h5py import Dataset, Group, h5i, h5o
 
-from saveables.base.base_file_node import BaseFileNode
+from saveables.base.base_file_node import (BaseFileNode, check_stream,
+                                           empty_stream_meta,
+                                           stream_data_field)
 from saveables.contracts.constants import (attribute, dict_keys, dict_values,
                                            element_type, encoding, name,
                                            none_literal, none_type,
+                                           packed_meta_data, packed_scalars,
                                            python_type, role)
 from saveables.contracts.data_type import (EmptyIterable,
                                            python_type_literal_map,
                                            python_type_literal_map_reversed)
 from saveables.python_utils import decode_list
 from saveables.saveable.data_field import DataField
-from saveables.saveable.meta_data import MetaData
+from saveables.saveable.meta_data import MetaData, get_meta_data
 from saveables.saveable.saveable import Saveable
-from saveables.saveable.utils import is_simple_iterable, is_supported_primitive
+from saveables.saveable.utils import (get_element_type,
+                                      is_supported_primitive,
+                                      list_meta_data_attribute_values,
+                                      list_meta_data_attributes)
+
+if TYPE_CHECKING:
+    from saveables.base.field_selection import FieldSelection
+
+# dataset names of dictionary keys / values, see H5FileNode._create_dataset
+_dictionary_dataset_name = re.compile(r"__(.*)___(keys|values)")
+
+
+def attribute_name(dataset_name: str) -> str:
+    """
+    return the name of the attribute a dataset belongs to
+
+    Args:
+        dataset_name (str): name of dataset
+
+    Returns:
+        str: name of attribute, which differs from the dataset name for the keys
+             and values of dictionaries
+    """
+    match = _dictionary_dataset_name.fullmatch(dataset_name)
+    return dataset_name if match is None else match.group(1)
+
+
+# data types of datasets that hold the elements of streams
+stream_dtypes: dict[str, Any] = {
+    "str": h5py.string_dtype(encoding=encoding),
+    "int": np.dtype(np.int64),
+    "float": np.dtype(np.float64),
+    "bool": np.dtype(np.bool_),
+}
+
+# number of elements per chunk of the datasets of lists that can be appended
+append_chunk_size = 1024
+
+# data type of the rows of the dataset that holds the packed scalars of a node.
+# Each row holds the name, the python type and the value of one scalar in the
+# column of its type, booleans are held as integers
+scalars_dtype = np.dtype(
+    [
+        ("name", h5py.string_dtype(encoding=encoding)),
+        ("python_type", h5py.string_dtype(encoding=encoding)),
+        ("int", np.int64),
+        ("float", np.float64),
+        ("str", h5py.string_dtype(encoding=encoding)),
+    ]
+)
+
+# column of the packed scalars dataset by python type of scalar
+_scalar_columns = {"int": "int", "bool": "int", "float": "float", "str": "str"}
 
 
 class H5FileNode(BaseFileNode[Dataset | Group]):
-    def __init__(self, name: str, parent: H5FileNode | None, group: Group):
+    def __init__(
+        self,
+        name: str,
+        parent: H5FileNode | None,
+        group: Group,
+        pack_meta_data: bool = False,
+        appendable: bool = False,
+        pack_scalars: bool = False,
+    ):
         super().__init__(name, parent)
         self._group = group
+        self._pack_meta_data = pack_meta_data  # write meta data as one attribute
+        self._appendable = appendable  # write lists as resizable datasets
+        self._pack_scalars = pack_scalars  # write scalars into one dataset
+        self._scalars: list[DataField] = []  # scalars to be packed
+        self._meta_data_cache: dict[str, MetaData] = dict()  # dataset name -> meta
+        self._members_cache: dict[str, Dataset | Group] | None = None  # opened members
+        self._children_cache: dict[str, H5FileNode] = dict()  # child nodes by name
         self._dict_keys_cache: dict[
             str, list[float] | list[str] | list[int] | list[bool]
         ] = dict()
@@ -36,18 +106,77 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
     def __iter__(self) -> Generator[tuple[Dataset | Group, type], None, None]:
 
         # iter through group an extract dataset
-        for name_ in self._group:
-            item = self._group[name_]
+        for member_name, item in self._members().items():
+            if member_name == packed_scalars:
+                continue
             if isinstance(item, Dataset):
-                python_type_ = python_type_literal_map_reversed[item.attrs[python_type]]
+                meta = self._read_meta_data(item)
+                python_type_ = python_type_literal_map_reversed[meta.python_type]
                 yield item, python_type_
             else:
                 yield item, Saveable
 
-    def read_python_attributes(self) -> list[DataField]:
+    def iter_attributes(
+        self, selection: FieldSelection | None = None
+    ) -> Generator[tuple[Dataset | Group, type], None, None]:
+        """
+        iterate over the datasets of the node. If the selected attributes are
+        given by name, their datasets are looked up by name. Otherwise, the names
+        of the group's links are matched against the selection. Datasets that are
+        not selected are neither opened nor are their attributes read
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+
+        Yields:
+            Generator[tuple[Dataset | Group, type], None, None]: dataset and python
+                                                                 type
+        """
+        if selection is None:
+            yield from self
+            return
+
+        names = selection.names()
+        if names is None:
+            if self._members_cache is not None:
+                link_names = list(self._members_cache)
+            else:
+                link_names = [link.decode(encoding) for link in self._group.id]
+        else:
+            link_names = [
+                dataset_name
+                for name_ in names
+                for dataset_name in (name_, f"__{name_}___keys", f"__{name_}___values")
+                if dataset_name in self._group
+            ]
+
+        for link_name in link_names:
+            if link_name == packed_scalars or not selection.selects(
+                attribute_name(link_name)
+            ):
+                continue
+            item = self._member(link_name)
+            if isinstance(item, Dataset):
+                meta = self._read_meta_data(item)
+                yield item, python_type_literal_map_reversed[meta.python_type]
+
+    def read_python_attributes(
+        self, selection: FieldSelection | None = None, chunk_size: int | None = None
+    ) -> list[DataField]:
         """
         read data from file that represents
-        native python data type like str, int, list etc
+        native python data type like str, int, list etc. Scalars that have been
+        packed into a single dataset are read along with the other attributes
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+            chunk_size (int | None, optional): if given, lists, tuples and sets are
+                                               read as streams of this chunk size.
+                                               Defaults to None.
 
         Returns:
             list: list of DataField objects holds data along with meta data
@@ -55,7 +184,13 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
         # call super call method with cleared caches
         self._dict_keys_cache = dict()
         self._dict_values_cache = dict()
-        return super().read_python_attributes()
+        data_fields = super().read_python_attributes(selection, chunk_size)
+        data_fields.extend(
+            data_field
+            for data_field in self._read_packed_scalars()
+            if selection is None or selection.selects(data_field.meta.name)
+        )
+        return data_fields
 
     def create_child_node(self, meta: MetaData) -> H5FileNode:
         """
@@ -71,21 +206,89 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
         """
 
         child_group = self._group.create_group(meta.name)
-        return H5FileNode(meta.name, self, child_group)
+        self._members()[meta.name] = child_group
+        return self._get_child_node(meta.name, child_group)
+
+    def link_saveable(self, meta: MetaData, original: BaseFileNode) -> bool:  # type: ignore[type-arg] # noqa: E501
+        """
+        write a hard link to the group of a node that holds the same data
+
+        Args:
+            meta (MetaData): meta data of saveable
+            original (BaseFileNode): node that holds the data
+
+        Returns:
+            bool: True if a link has been written
+        """
+        if not isinstance(original, H5FileNode):
+            return False
+        self._group[meta.name] = original._group
+        self._members()[meta.name] = original._group
+        return True
+
+    def link_iterable(
+        self, meta: MetaData, original: BaseFileNode, original_name: str  # type: ignore[type-arg] # noqa: E501
+    ) -> bool:
+        """
+        write a hard link to the dataset of an iterable that has already been
+        written. The meta data attributes of the dataset hold the name of the
+        attribute, so only iterables of the same name are linked
+
+        Args:
+            meta (MetaData): meta data of iterable
+            original (BaseFileNode): node that holds the iterable
+            original_name (str): name of attribute that holds the iterable in
+                                 original node
+
+        Returns:
+            bool: True if a link has been written
+        """
+        if not isinstance(original, H5FileNode) or original_name != meta.name:
+            return False
+        if self._appendable:
+            # appending to a linked dataset would change both iterables
+            return False
+        dset = original._member(original_name)
+        self._group[meta.name] = dset
+        self._members()[meta.name] = dset
+        return True
+
+    def content_key(self) -> Hashable:
+        """
+        key that identifies the group of the node. Hard links to the same group
+        have equal keys
+
+        Returns:
+            Hashable: identifier of group
+        """
+        key: Hashable = self._group.id
+        return key
 
     def write_primitive_data(self, data_field: DataField) -> None:
         """
-        write scalar supported data to file node
+        write scalar supported data to file node. If scalars are packed, they are
+        buffered until finish_writing is called
 
         Args:
             data_field (DataField): object that holds scalar data and its meta data to
                                     be written into node
+
+        Raises:
+            TypeError: if data type is not supported
+            ValueError: if name of attribute is reserved for packed scalars
         """
 
         # check if data type is correct
-        if not is_supported_primitive(data_field.value):
+        if self.validate and not is_supported_primitive(data_field.value):
             raise TypeError(f"data type {type(data_field.value)} is not supported")
 
+        # packed scalars are written at once by finish_writing
+        if data_field.meta.name == packed_scalars:
+            raise ValueError(f"{packed_scalars} is reserved and cannot be written")
+        if self._pack_scalars:
+            self._scalars.append(data_field)
+            return
+
         # write data
         dtype = None
         if isinstance(data_field.value, str):
@@ -107,14 +310,10 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
                                     data to be written into node
 
         Raises:
-            TypeError: if data_field does not represent a list / tuple / set with
-                       uniformly typed elements
             ValueError: if meta data indicates that the list / tuple / set is empty
                         but it is not
         """
-        # check if value type is correct
-        if not is_simple_iterable(data_field.value):
-            raise TypeError("value must be of type list, set or tuple ")
+        # the elements have been checked when the data field was created
 
         # save data as a numpy array
         len_ = len(data_field.value)  # type: ignore[arg-type]
@@ -140,9 +339,73 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             if data_field.meta.element_type == python_type_literal_map[str]:
                 dtype = h5py.string_dtype(encoding=encoding)
             data = np.array(data_, dtype=dtype)
+        kwargs: dict[str, Any] = {}
+        is_list = data_field.meta.python_type == python_type_literal_map[list]
+        if self._appendable and is_list:
+            # lists are written as resizable datasets, so that they can be appended
+            kwargs = {"maxshape": (None,), "chunks": (append_chunk_size,)}
         self._create_dataset(
-            data_field.meta.name, data=data, dtype=data.dtype, meta=data_field.meta
+            data_field.meta.name,
+            data=data,
+            dtype=data.dtype,
+            meta=data_field.meta,
+            **kwargs,
+        )
+
+    def write_stream(self, data_field: DataField) -> None:
+        """
+        write elements of a stream into a resizable, chunked dataset. The dataset
+        is created from the first chunk of elements and extended by each
+        following chunk, so that only one chunk is held in memory at once
+
+        Args:
+            data_field (DataField): object that holds a stream and its meta data
+        """
+        stream = check_stream(data_field)
+        chunks = stream.iter_chunks()
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            meta = empty_stream_meta(data_field.meta)
+            self.write_simple_iterable(DataField(meta=meta, value=[]))
+            return
+
+        dtype = stream_dtypes[data_field.meta.element_type]
+        dset = self._create_dataset(
+            data_field.meta.name,
+            data=np.array(first_chunk, dtype=dtype),
+            dtype=dtype,
+            meta=data_field.meta,
+            maxshape=(None,),
+            chunks=(min(len(first_chunk), stream.chunk_size),),
         )
+        for chunk in chunks:
+            n_elements = dset.shape[0]
+            dset.resize((n_elements + len(chunk),))
+            dset[n_elements:] = np.array(chunk, dtype=dtype)
+
+    def finish_writing(self) -> None:
+        """
+        write the scalars that have been buffered while the attributes of the node
+        have been written into a single compound dataset, which costs one dataset
+        instead of one per scalar. Scalars that the dataset holds already, e.g.
+        of a file that is updated, are kept
+
+        Raises:
+            ValueError: if the dataset already holds a scalar of the same name
+        """
+        if not self._scalars:
+            return
+        data_fields = self._read_packed_scalars()
+        names = {data_field.meta.name for data_field in data_fields}
+        for data_field in self._scalars:
+            if data_field.meta.name in names:
+                raise ValueError(
+                    f"An error occured while writing {data_field.meta.name}: it "
+                    f"already exists in {self._group.name}"
+                )
+        data_fields.extend(self._scalars)
+        self._scalars = []
+        self._write_packed_scalars(data_fields)
 
     def write_none(self, data_field: DataField) -> None:
         """
@@ -162,7 +425,7 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             )
 
         # write none string into file
-        none_meta = MetaData(
+        none_meta = get_meta_data(
             python_type=none_type,
             name=data_field.meta.name,
             role=data_field.meta.role,
@@ -191,16 +454,8 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             raise TypeError("primitive data is expected to be hold by a dataset")
 
         # extract meta data
-        python_type_ = python_type_literal_map_reversed[filedata.attrs[python_type]]
-        role_ = filedata.attrs[role]
-        name_ = filedata.attrs[name]
-        element_type_ = filedata.attrs[element_type]
-        meta = MetaData(
-            python_type=filedata.attrs[python_type],
-            role=role_,
-            name=name_,
-            element_type=element_type_,
-        )
+        meta = self._read_meta_data(filedata)
+        python_type_ = python_type_literal_map_reversed[meta.python_type]
 
         # extract data
         if python_type_ == str:
@@ -229,20 +484,46 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             raise TypeError("primitive data is expected to be hold by a dataset")
 
         # extract meta data
-        meta = self._create_meta_data(filedata)
+        meta = self._read_meta_data(filedata)
 
         # read data as a list
         value = filedata[:].tolist()
 
         # strings are saved as bytes, so we need to encode them
-        value = decode_list(value, encoding)
+        value = decode_list(value, encoding, self.validate)
 
         # restore original python type
-        python_type_ = python_type_literal_map_reversed[filedata.attrs[python_type]]
+        python_type_ = python_type_literal_map_reversed[meta.python_type]
         value = python_type_(value)
 
         return DataField(value=value, meta=meta)
 
+    def read_stream(self, filedata: Dataset | Group, chunk_size: int) -> DataField:
+        """
+        read list, set or tuple as a stream. The dataset is read slice by slice
+        while the stream is consumed
+
+        Args:
+            filedata (Dataset | Group): h5 file element that holds data from file
+            chunk_size (int): number of elements read at once
+
+        Raises:
+            TypeError: if file element is a h5 group
+
+        Returns:
+            DataField: meta data of iterable along with a stream of its elements
+        """
+        if isinstance(filedata, Group):
+            raise TypeError("primitive data is expected to be hold by a dataset")
+
+        def iter_elements() -> Generator[Any, None, None]:
+            for start in range(0, filedata.shape[0], chunk_size):
+                chunk = filedata[start : start + chunk_size].tolist()
+                yield from decode_list(chunk, encoding, self.validate)
+
+        meta = self._read_meta_data(filedata)
+        return stream_data_field(meta, iter_elements(), chunk_size)
+
     def read_simple_dictionary(self, filedata: Dataset | Group) -> DataField | None:
         """
         read dictionaries whose keys have all the same type
@@ -263,11 +544,12 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
         data = filedata[:].tolist()
 
         # decode if neccessary
-        data = decode_list(data, encoding)
+        data = decode_list(data, encoding, self.validate)
 
         # put data into cache
-        role_ = filedata.attrs[role]
-        name_ = filedata.attrs[name]
+        meta = self._read_meta_data(filedata)
+        role_ = meta.role
+        name_ = meta.name
         if role_ == dict_keys:
             self._dict_keys_cache[name_] = data
         if role_ == dict_values:
@@ -275,9 +557,8 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
 
         # if keys and values are read, create datafield
         if name_ in self._dict_keys_cache and name_ in self._dict_values_cache:
-            python_type_ = filedata.attrs[python_type]
-            meta = MetaData(
-                python_type=python_type_,
+            meta = get_meta_data(
+                python_type=meta.python_type,
                 role=attribute,
                 name=name_,
                 element_type=none_type,  # type: ignore[arg-type]
@@ -306,14 +587,197 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
 
         # create child node for each h5 group that is a direct child
         # of the node's h5 group
-        for h5_element_name in self._group:
-            h5_element = self._group[h5_element_name]
+        for h5_element_name, h5_element in self._members().items():
             if isinstance(h5_element, Group):
-                children.append(H5FileNode(h5_element_name, self, h5_element))
+                children.append(self._get_child_node(h5_element_name, h5_element))
 
         return children
 
-    def _create_dataset(self, name: str, data: Any, dtype: Any, meta: MetaData) -> None:
+    def get_child(self, name_: str) -> H5FileNode | None:
+        """
+        return the child node of given name. The child group is looked up by name
+        without opening the other members of the node's group
+
+        Args:
+            name_ (str): name of child node
+
+        Returns:
+            H5FileNode | None: child node, None if node has no such child
+        """
+        if name_ not in self._group:
+            return None
+        member = self._member(name_)
+        if not isinstance(member, Group):
+            return None
+        return self._get_child_node(name_, member)
+
+    def remove(self, name_: str) -> None:
+        """
+        remove the datasets of an attribute or the child group of given name.
+        The space of removed data is not reclaimed by HDF5
+
+        Args:
+            name_ (str): name of attribute or child node
+
+        Raises:
+            ValueError: if name is reserved for packed scalars
+        """
+        if name_ == packed_scalars:
+            raise ValueError(f"{packed_scalars} is reserved and cannot be removed")
+        data_fields = self._read_packed_scalars()
+        kept = [
+            data_field for data_field in data_fields if data_field.meta.name != name_
+        ]
+        if len(kept) < len(data_fields):
+            self._write_packed_scalars(kept)
+        for member_name in (name_, f"__{name_}___keys", f"__{name_}___values"):
+            if member_name in self._group:
+                del self._group[member_name]
+            if self._members_cache is not None:
+                self._members_cache.pop(member_name, None)
+            # meta data are cached by the absolute path of datasets
+            self._meta_data_cache.pop(f"{self._group.name}/{member_name}", None)
+        self._children_cache.pop(name_, None)
+
+    def append(self, name_: str, values: list[Any] | tuple[Any, ...]) -> None:
+        """
+        append elements to the dataset of a list. Lists are appendable if they
+        are written by a node that is appendable or from a stream. The dataset is
+        flushed, so that readers in swmr mode see the elements once they refresh
+
+        Args:
+            name_ (str): name of attribute that holds the list
+            values (list[Any] | tuple[Any, ...]): elements to be appended, of the
+                                                  same type as the elements of
+                                                  the list
+
+        Raises:
+            KeyError: if node has no list of given name
+            ValueError: if dataset cannot be resized, if list is empty, since
+                        the type of its elements is unknown, or if elements are
+                        not of the same type
+            TypeError: if elements are not of the type of the list's elements
+        """
+        member = self._member(name_) if name_ in self._group else None
+        if not isinstance(member, Dataset):
+            raise KeyError(f"{self._group.name} has no list {name_}")
+        meta = self._read_meta_data(member)
+        resizable = member.maxshape == (None,)
+        if meta.python_type != python_type_literal_map[list] or not resizable:
+            raise ValueError(
+                f"{name_} in {self._group.name} is not a list that can be appended"
+            )
+        if meta.element_type == python_type_literal_map[EmptyIterable]:
+            raise ValueError(
+                f"elements cannot be appended to {name_} in {self._group.name}, "
+                "since it has been written as an empty list"
+            )
+        if len(values) == 0:
+            return
+        element_type_ = get_element_type(values)
+        if python_type_literal_map.get(element_type_) != meta.element_type:
+            raise TypeError(
+                f"elements of {name_} are of type {meta.element_type}, but "
+                f"{element_type_} are appended"
+            )
+
+        n_elements = member.shape[0]
+        member.resize((n_elements + len(values),))
+        member[n_elements:] = np.array(values, dtype=stream_dtypes[meta.element_type])
+        member.flush()
+
+    def refresh(self) -> None:
+        """
+        refresh the datasets of the node's group and of all its subgroups, so
+        that elements appended by a writer in swmr mode are read. Datasets that
+        are opened afterwards are only up to date once they have been refreshed,
+        so all datasets are refreshed, not only the opened ones. Each object is
+        visited once, even if it is linked more than once
+        """
+
+        def refresh_dataset(name_: str, member: Dataset | Group) -> None:
+            if isinstance(member, Dataset):
+                member.refresh()
+
+        self._group.visititems(refresh_dataset)
+
+    def release(self) -> None:
+        """
+        drop the opened members and child nodes of the node and of its child
+        nodes. Called before the file is closed, so that the h5py objects are
+        closed while their identifiers are valid. Otherwise, nodes that are
+        garbage collected after the file has been closed may close objects of
+        another file that have been assigned the same identifiers
+        """
+        for child in self._children_cache.values():
+            child.release()
+        self._children_cache = dict()
+        self._members_cache = None
+
+    def _members(self) -> dict[str, Dataset | Group]:
+        """
+        return the opened datasets and groups that are direct members of the node's
+        group. The group's links are enumerated only once with low level h5g
+        iteration and each member is opened only once per node lifetime
+
+        Returns:
+            dict[str, Dataset | Group]: member names and opened members
+        """
+        if self._members_cache is None:
+            members: dict[str, Dataset | Group] = dict()
+            group_id = self._group.id
+            for link_name in group_id:
+                object_id = h5o.open(group_id, link_name)
+                object_type = h5i.get_type(object_id)
+                if object_type == h5i.DATASET:
+                    members[link_name.decode(encoding)] = Dataset(object_id)
+                elif object_type == h5i.GROUP:
+                    members[link_name.decode(encoding)] = Group(object_id)
+            self._members_cache = members
+        return self._members_cache
+
+    def _member(self, name_: str) -> Dataset | Group:
+        """
+        return the opened dataset or group of given name without opening the
+        other members of the node's group
+
+        Args:
+            name_ (str): name of member
+
+        Returns:
+            Dataset | Group: opened member
+        """
+        if self._members_cache is not None:
+            return self._members_cache[name_]
+        member: Dataset | Group = self._group[name_]
+        return member
+
+    def _get_child_node(self, name_: str, group: Group) -> H5FileNode:
+        """
+        return child node for given group. Child nodes are created only once,
+        so that their own caches are kept for the node's lifetime
+
+        Args:
+            name_ (str): name of child group
+            group (Group): child group
+
+        Returns:
+            H5FileNode: child node
+        """
+        if name_ not in self._children_cache:
+            self._children_cache[name_] = H5FileNode(
+                name_,
+                self,
+                group,
+                self._pack_meta_data,
+                self._appendable,
+                self._pack_scalars,
+            )
+        return self._children_cache[name_]
+
+    def _create_dataset(
+        self, name: str, data: Any, dtype: Any, meta: MetaData, **kwargs: Any
+    ) -> Dataset:
         """
         create h5 dataset
 
@@ -323,10 +787,16 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             dtype (Any): type of data
             meta (MetaData): meta data of data that are written as dataset attributes
                              to file
+            kwargs (Any): further keyword arguments passed to create_dataset, e.g.
+                          maxshape and chunks
 
         Raises:
             ValueError: raises  ValueError if a dataset with intended name already
-                        exists in current node
+                        exists in current node or if the name is reserved for
+                        packed scalars
+
+        Returns:
+            Dataset: created dataset
         """
 
         # add suffix _keys / _values if data represent dictionary keys/values
@@ -338,22 +808,108 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
             name_ = name
 
         # check if there already is a dataset with given name in group
-        if name_ in self._group and isinstance(self._group[name], Dataset):
+        if name_ == packed_scalars:
+            raise ValueError(f"{packed_scalars} is reserved and cannot be written")
+        members = self._members()
+        if isinstance(members.get(name_), Dataset):
             raise ValueError(
                 f"An error occured while writing {meta.name}: Dataset {name_} "
                 f"already exists in {self._group.name}"
             )
 
         # create dataset
-        dset = self._group.create_dataset(name=name_, data=data, dtype=dtype)
+        dset = self._group.create_dataset(name=name_, data=data, dtype=dtype, **kwargs)
+        members[name_] = dset
+
+        # update attributes with meta data. Packed meta data are written as a single
+        # string array attribute, which costs one attribute write instead of one
+        # per meta data field
+        if self._pack_meta_data:
+            dset.attrs[packed_meta_data] = list_meta_data_attribute_values(meta)
+        else:
+            for field_name in list_meta_data_attributes():
+                dset.attrs[field_name] = str(getattr(meta, field_name))
+        return dset
+
+    def _read_packed_scalars(self) -> list[DataField]:
+        """
+        read the scalars that have been packed into a single dataset
+
+        Returns:
+            list[DataField]: scalars along with their meta data, empty if the
+                             node has no packed scalars
+        """
+        if self._members_cache is not None:
+            dset = self._members_cache.get(packed_scalars)
+        else:
+            dset = self._group.get(packed_scalars)
+        if not isinstance(dset, Dataset):
+            return []
+
+        data_fields: list[DataField] = []
+        for name_, python_type_, int_, float_, str_ in dset[()].tolist():
+            name_ = name_.decode(encoding)
+            python_type_ = python_type_.decode(encoding)
+            column = _scalar_columns[python_type_]
+            value: Any = int_
+            if python_type_ == "bool":
+                value = bool(int_)
+            elif column == "float":
+                value = float_
+            elif column == "str":
+                value = str_.decode(encoding)
+            meta = get_meta_data(python_type_, attribute, name_, python_type_)
+            data_fields.append(DataField(meta, value))
+        return data_fields
+
+    def _write_packed_scalars(self, data_fields: list[DataField]) -> None:
+        """
+        write scalars into a single dataset, which replaces the packed scalars
+        the node holds already
+
+        Args:
+            data_fields (list[DataField]): scalars along with their meta data
+        """
+        if packed_scalars in self._group:
+            del self._group[packed_scalars]
+            if self._members_cache is not None:
+                self._members_cache.pop(packed_scalars, None)
+        if not data_fields:
+            return
+
+        rows = np.zeros(len(data_fields), dtype=scalars_dtype)
+        rows["name"] = [data_field.meta.name for data_field in data_fields]
+        rows["python_type"] = [
+            data_field.meta.python_type for data_field in data_fields
+        ]
+        rows["str"] = ""
+        for i, data_field in enumerate(data_fields):
+            rows[_scalar_columns[data_field.meta.python_type]][i] = data_field.value
+        dset = self._group.create_dataset(packed_scalars, data=rows)
+        self._members()[packed_scalars] = dset
+
+    def _read_meta_data(self, filedata: Dataset) -> MetaData:
+        """
+        return meta data of given dataset. The attributes of each dataset
+        are read only once per node, subsequent calls are served from cache
+
+        Args:
+            filedata (Dataset): dataset with attributes
 
-        # update attributes with meta data
-        for field in fields(meta):
-            dset.attrs[field.name] = str(getattr(meta, field.name))
+        Returns:
+            MetaData: meta data object that holds dataset attribute data
+        """
+        try:
+            return self._meta_data_cache[filedata.name]
+        except KeyError:
+            meta = self._create_meta_data(filedata)
+            self._meta_data_cache[filedata.name] = meta
+            return meta
 
     def _create_meta_data(self, filedata: Dataset) -> MetaData:
         """
-        create meta data object from dataset attributes
+        create meta data object from dataset attributes. Both packed meta data
+        and meta data that are saved as one attribute per field are supported
 
         Args:
             filedata (Dataset): dataset with attributes
@@ -361,10 +917,19 @@ class H5FileNode(BaseFileNode[Dataset | Group]):
         Returns:
             MetaData: meta data object that holds dataset attribute data
         """
+        try:
+            packed = filedata.attrs[packed_meta_data]
+        except KeyError:
+            pass
+        else:
+            kwargs = dict(zip(list_meta_data_attributes(), packed.tolist()))
+            return get_meta_data(**kwargs)
+
+        # legacy layout: one attribute per meta data field
         role_ = filedata.attrs[role]
         name_ = filedata.attrs[name]
         element_type_ = filedata.attrs[element_type]
-        return MetaData(
+        return get_meta_data(
             python_type=filedata.attrs[python_type],
             role=role_,
             name=name_,
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Literal
+
+from saveables.contracts.constants import write_mode
+
+if TYPE_CHECKING:
+    from saveables.contracts.data_type import tFileMode
+
+tFsStrategy = Literal["fsm", "page", "aggregate", "none"]
+tLibver = Literal["earliest", "v108", "v110", "v112", "v114", "latest"]
+
+# allowed values of the options that take keywords
+_keyword_values: dict[str, tuple[str, ...]] = {
+    "fs_strategy": ("fsm", "page", "aggregate", "none"),
+    "libver": ("earliest", "v108", "v110", "v112", "v114", "latest"),
+}
+
+# options that are stored in the file when it is created. HDF5 cannot change
+# them for existing files, so they are only passed when a file is written
+_creation_options = ("fs_strategy", "fs_page_size")
+
+# default size of the pages of files with the "page" file space strategy
+_default_page_size = 4096
+
+
+@dataclass(frozen=True)
+class H5Profile:
+    """
+    performance profile of an hdf5 file. Each field corresponds to the keyword
+    argument of h5py.File with the same name. Fields that are None keep the
+    defaults of HDF5. The page buffer can only be enabled for files that are
+    written with the "page" file space strategy. Files that are read do not
+    need to have been written with the same profile
+    """
+
+    fs_strategy: tFsStrategy | None = None  # file space strategy of new files
+    fs_page_size: int | None = None  # bytes per page of the "page" strategy
+    page_buf_size: int | None = None  # bytes of page buffer, at least one page
+    meta_block_size: int | None = None  # bytes allocated at once for meta data
+    libver: tLibver | None = None  # earliest and latest file format version
+    rdcc_nbytes: int | None = None  # bytes of chunk cache per dataset
+    rdcc_nslots: int | None = None  # slots of chunk cache, ideally a prime
+    rdcc_w0: float | None = None  # preference to evict fully read chunks, 0 to 1
+
+    def __post_init__(self) -> None:
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is None:
+                continue
+            if field.name in _keyword_values:
+                if value not in _keyword_values[field.name]:
+                    raise ValueError(f"invalid value {value} for {field.name}")
+            elif field.name == "rdcc_w0":
+                if not isinstance(value, (int, float)) or not 0 <= value <= 1:
+                    raise ValueError(f"rdcc_w0 must be between 0 and 1 but is {value}")
+            elif not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(
+                    f"{field.name} must be a non-negative integer but is {value}"
+                )
+        if self.page_buf_size is not None:
+            if self.fs_strategy != "page":
+                raise ValueError('page_buf_size requires fs_strategy "page"')
+            page_size = self.fs_page_size or _default_page_size
+            if self.page_buf_size < page_size:
+                raise ValueError(
+                    f"page_buf_size {self.page_buf_size} is smaller than the page "
+                    f"size {page_size}"
+                )
+
+    def options(self, mode: tFileMode = write_mode) -> dict[str, Any]:
+        """
+        keyword arguments of h5py.File that apply the profile
+
+        Args:
+            mode (tFileMode, optional): mode the file is opened in. Options that
+                                        are stored in the file are only returned
+                                        for files that are written.
+                                        Defaults to write_mode.
+
+        Returns:
+            dict[str, Any]: keyword arguments by name
+        """
+        options: dict[str, Any] = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is None or (
+                mode != write_mode and field.name in _creation_options
+            ):
+                continue
+            options[field.name] = value
+        return options
+
+
+# defaults of HDF5
+default_profile = H5Profile()
+
+# profile for files with many small datasets, e.g. objects with thousands of
+# attributes. Space is allocated in pages, so that the meta data of many
+# datasets share pages, which a page buffer keeps in memory while the file is
+# open. Files are written with the latest file format, which older versions of
+# HDF5 may not read
+paged_profile = H5Profile(
+    fs_strategy="page",
+    fs_page_size=65536,  # 64 KiB
+    page_buf_size=16777216,  # 16 MiB
+    meta_block_size=1048576,  # 1 MiB
+    libver="latest",
+    rdcc_nbytes=4194304,  # 4 MiB
+)
@@ -4,7 +4,7 @@ from typing import Any
 from saveables.saveable.utils import get_element_type
 
 
-def decode_list(lst: list[Any], encoding: str) -> list[Any]:
+def decode_list(lst: list[Any], encoding: str, validate: bool = True) -> list[Any]:
     """
     if lst is a list of bytes decode these bytes
     and return a list of strings with decoded data
@@ -12,6 +12,8 @@ def decode_list(lst: list[Any], encoding: str) -> list[Any]:
     Args:
         lst (list): list
         encoding (str): encoding used to decode bytes
+        validate (bool, optional): if False, the elements are trusted to have the
+                                   type of the first one. Defaults to True.
 
     Returns:
         list: if input was a list of decoded bytes
@@ -25,7 +27,7 @@ def decode_list(lst: list[Any], encoding: str) -> list[Any]:
         return lst
 
     # get list element type and decode it if neccessary
-    element_type = get_element_type(lst)
+    element_type = get_element_type(lst) if validate else type(lst[0])
     if element_type == bytes:
         return [el.decode(encoding) for el in lst]
     else:
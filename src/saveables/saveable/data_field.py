@@ -8,6 +8,7 @@ if TYPE_CHECKING:
                                                tPrimitiveDataType)
     from saveables.saveable.meta_data import MetaData
     from saveables.saveable.saveable import Saveable
+    from saveables.saveable.stream import Stream
 
 
 @dataclass
@@ -16,5 +17,9 @@ class DataField:
     holds value to be saved along with its meta data
     """
 
+    # one data field is created per attribute of each object that is written
+    # or read, so they do not hold a __dict__
+    __slots__ = ("meta", "value")
+
     meta: MetaData
-    value: Saveable | tPrimitiveDataType | tIterableDataType
+    value: Saveable | Stream | tPrimitiveDataType | tIterableDataType
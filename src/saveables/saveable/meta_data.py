@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from saveables.contracts.constants import attribute
 from saveables.contracts.data_type import python_type_literal_map
@@ -10,13 +12,20 @@ if TYPE_CHECKING:
     from saveables.contracts.data_type import (tPrimitivePythonLiteral,
                                                tPythonTypeLiteral, tRole)
 
+# maximal number of distinct meta data objects that are shared
+meta_data_cache_size = 2**16
 
-@dataclass
+
+@dataclass(frozen=True)
 class MetaData:
     """
-    Holds meta data information for the data to be saved
+    Holds meta data information for the data to be saved. Meta data objects
+    are immutable and hashable, so that equal meta data can be shared, see
+    get_meta_data
     """
 
+    __slots__ = ("python_type", "role", "name", "element_type")
+
     python_type: tPythonTypeLiteral  # determines original python type of the data
     role: tRole  # determines data role. Data can either be the value of an object field
     # or a list dictionary keys/values # noqa: E116, E114
@@ -33,3 +42,56 @@ class MetaData:
                 f"if python type is {self.python_type}, element_type must be "
                 f"{python_type_literal_map[type(None)]}"
             )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # frozen objects without __dict__ cannot be restored attribute by
+        # attribute, and restored objects are shared as well
+        return get_meta_data, (
+            self.python_type,
+            self.role,
+            self.name,
+            self.element_type,
+        )
+
+
+def get_meta_data(
+    python_type: tPythonTypeLiteral,
+    role: tRole,
+    name: str,
+    element_type: tPrimitivePythonLiteral,
+) -> MetaData:
+    """
+    return meta data object with given attributes. Meta data objects are
+    shared, so that the meta data of the same attribute of many objects, or of
+    many rows that are read, are only created and checked once
+
+    Args:
+        python_type (tPythonTypeLiteral): original python type of the data
+        role (tRole): role of the data
+        name (str): name of attribute
+        element_type (tPrimitivePythonLiteral): type of elements if data is
+                                                list/tuple/set
+
+    Raises:
+        ValueError: if meta data are inconsistent
+
+    Returns:
+        MetaData: shared meta data object
+    """
+    # keyword arguments would be cached separately from positional ones
+    return _get_meta_data(python_type, role, name, element_type)
+
+
+@lru_cache(maxsize=meta_data_cache_size)
+def _get_meta_data(
+    python_type: str, role: str, name: str, element_type: str
+) -> MetaData:
+    # strings read from files are interned, so that they are held only once
+    # and compared by identity. str() turns subclasses like numpy.str_ into
+    # strings, which cannot be interned otherwise
+    return MetaData(
+        python_type=sys.intern(str(python_type)),  # type: ignore[arg-type]
+        role=sys.intern(str(role)),  # type: ignore[arg-type]
+        name=sys.intern(str(name)),
+        element_type=sys.intern(str(element_type)),  # type: ignore[arg-type]
+    )
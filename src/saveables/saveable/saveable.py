@@ -1,19 +1,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator
 
 from saveables.contracts.constants import attribute, none_type, saveable
-from saveables.contracts.data_type import (python_type_literal_map,
-                                           python_type_literal_map_reversed)
-from saveables.python_utils import get_element_type  # type: ignore[attr-defined]
+from saveables.contracts.data_type import (EmptyIterable,
+                                           python_type_literal_map,
+                                           python_type_literal_map_reversed,
+                                           supported_primitive_data_types)
 from saveables.saveable.data_field import DataField
-from saveables.saveable.meta_data import MetaData
-from saveables.saveable.utils import is_simple_dictionary, is_simple_iterable
+from saveables.saveable.meta_data import get_meta_data
+from saveables.saveable.stream import Stream
+from saveables.saveable.utils import is_typed_uniformly
 
 if TYPE_CHECKING:
     from saveables.contracts.data_type import tPythonTypeLiteral
 
+# python types of lists, tuples and sets
+simple_iterable_types = tuple(
+    python_type_literal_map[type_] for type_ in (list, tuple, set)
+)
+# element types of lists, tuples and sets that can be saved
+primitive_element_types = tuple(
+    python_type_literal_map[type_]
+    for type_ in (*supported_primitive_data_types, EmptyIterable)
+)
+
 
 @dataclass
 class Saveable:
@@ -22,10 +34,15 @@ class Saveable:
     must inherit from this class
     """
 
-    def iter_fields(self) -> Generator[DataField, None, None]:
+    def iter_fields(self, validate: bool = True) -> Generator[DataField, None, None]:
         """
         iterate over attributes that are to be saved
 
+        Args:
+            validate (bool, optional): if False, the elements of lists, tuples and
+                                       sets are not checked for a uniform type,
+                                       see create_data_field. Defaults to True.
+
         Raises:
             TypeError: if an object's attribute has a type that is not supported
 
@@ -34,42 +51,121 @@ class Saveable:
                                               along with meta data
         """
         for field in fields(self):
-            name = field.name
-            role = attribute
-            value = getattr(self, name)
-            python_type: tPythonTypeLiteral
-            if isinstance(value, Saveable):
-                python_type = saveable
-            else:
-                try:
-                    python_type = python_type_literal_map[type(value)]
-                except KeyError:
-                    raise TypeError(
-                        f"Unsupported field type: {type(value)} for field {name}"
-                    )
-            if is_simple_iterable(value):
-                try:
-                    element_type = python_type_literal_map[get_element_type(value)]
-                except KeyError:
-                    raise TypeError(
-                        f"Unsupported element type: {get_element_type(value)} "
-                        f"for field {name}"
-                    )
-            elif is_simple_dictionary(value):
-                # put dummy placeholder as element type since
-                # keys and values of a dictionary different element types
-                # and the information is not relevant for dictionaries
-                # since its keys/values are saved separately as lists
-                element_type = none_type
-            else:
-                element_type = python_type
-            meta = MetaData(
-                python_type=python_type,
-                role=role,
-                name=name,
-                element_type=element_type,  # type: ignore[arg-type]
-            )
-            yield DataField(meta=meta, value=value)
+            yield create_data_field(field.name, getattr(self, field.name), validate)
+
+
+def create_data_field(name: str, value: Any, validate: bool = True) -> DataField:
+    """
+    create data field that holds an attribute value along with its meta data.
+    The type of the value and the types of the elements of lists, tuples and
+    sets are checked here, so that the value can be written by its meta data
+    without checking it again
+
+    Args:
+        name (str): name of attribute
+        value (Any): value of attribute
+        validate (bool, optional): if False, the elements of lists, tuples and
+                                   sets are trusted to have the type of their
+                                   first element, which saves a scan over all
+                                   elements. Defaults to True.
+
+    Raises:
+        TypeError: if the value has a type that is not supported
+        ValueError: if the elements of a list, tuple or set have different types
+
+    Returns:
+        DataField: value along with meta data
+    """
+    role = attribute
+    python_type: tPythonTypeLiteral | None
+    element_type: tPythonTypeLiteral | None
+    if isinstance(value, Stream):
+        # streams are saved and loaded as lists
+        python_type = python_type_literal_map[list]
+        element_type = python_type_literal_map[value.element_type]
+    elif isinstance(value, Saveable):
+        python_type = element_type = saveable
+    else:
+        python_type = python_type_literal_map.get(type(value))
+        if python_type is None:
+            raise TypeError(f"Unsupported field type: {type(value)} for field {name}")
+        if python_type in simple_iterable_types:
+            if validate and not is_typed_uniformly(value):
+                raise ValueError(
+                    f"elements of field {name} are supposed to have the same type"
+                )
+            element_type_ = type(next(iter(value))) if len(value) else EmptyIterable
+            element_type = python_type_literal_map.get(element_type_)
+            if element_type is None:
+                raise TypeError(
+                    f"Unsupported element type: {element_type_} for field {name}"
+                )
+        elif python_type == python_type_literal_map[dict]:
+            # put dummy placeholder as element type since
+            # keys and values of a dictionary different element types
+            # and the information is not relevant for dictionaries
+            # since its keys/values are saved separately as lists. They are
+            # checked while they are written
+            element_type = none_type
+        else:
+            element_type = python_type
+    meta = get_meta_data(
+        python_type=python_type,
+        role=role,
+        name=name,
+        element_type=element_type,  # type: ignore[arg-type]
+    )
+    return DataField(meta=meta, value=value)
+
+
+def validate(saveable: Saveable) -> None:
+    """
+    check that all attributes of a saveable and of its child saveables can be
+    saved, without writing them. Data that have been checked can be saved with
+    validate=False, which skips the checks while the data are written
+
+    Args:
+        saveable (Saveable): object to be checked
+
+    Raises:
+        TypeError: if an attribute, an element or a dictionary key or value has a
+                   type that is not supported
+        ValueError: if the elements of a list, tuple or set or the keys or values
+                    of a dictionary have different types
+    """
+    checked: set[int] = set()
+    pending = [saveable]
+    while pending:
+        saveable_ = pending.pop()
+        if id(saveable_) in checked:
+            # objects that are referenced more than once, including cycles
+            continue
+        checked.add(id(saveable_))
+        for data_field in saveable_.iter_fields():
+            name = data_field.meta.name
+            if isinstance(data_field.value, Saveable):
+                pending.append(data_field.value)
+            elif isinstance(data_field.value, dict):
+                for part in (data_field.value.keys(), data_field.value.values()):
+                    if not is_typed_uniformly(list(part)):
+                        raise ValueError(
+                            f"keys and values of field {name} are supposed to "
+                            f"have the same type each"
+                        )
+                    if part and not isinstance(
+                        next(iter(part)), supported_primitive_data_types
+                    ):
+                        raise TypeError(
+                            f"Unsupported key or value type of field {name}"
+                        )
+            elif (
+                data_field.meta.python_type in simple_iterable_types
+                and data_field.meta.element_type not in primitive_element_types
+            ):
+                raise TypeError(
+                    f"Unsupported element type: {data_field.meta.element_type} "
+                    f"for field {name}"
+                )
 
 
 python_type_literal_map[Saveable] = saveable
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Generator, Iterable
+
+from saveables.contracts.data_type import supported_primitive_data_types
+
+# number of elements that are consumed from a stream at once
+stream_chunk_size = 1 << 16
+
+
+@dataclass
+class Stream:
+    """
+    list whose elements are produced while it is saved, e.g. by a generator.
+    File nodes consume the elements chunk by chunk, so that the whole list is
+    never held in memory. XML files are the exception, their documents hold
+    every element until they are written. A stream is saved as a list of its
+    declared element type and loaded as a list. Streams that wrap a generator
+    can be saved only once
+    """
+
+    source: Iterable[Any]  # elements of the list, e.g. a generator
+    element_type: type  # type of elements, one of str, int, float and bool
+    chunk_size: int = stream_chunk_size  # number of elements consumed at once
+
+    def __post_init__(self) -> None:
+        if self.element_type not in supported_primitive_data_types:
+            raise TypeError(f"unsupported element type of stream: {self.element_type}")
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk size must be positive but is {self.chunk_size}")
+
+    def iter_chunks(self) -> Generator[list[Any], None, None]:
+        """
+        consume the elements of the stream chunk by chunk
+
+        Raises:
+            TypeError: if an element is not of the declared element type
+
+        Yields:
+            list[Any]: up to chunk_size elements
+        """
+        iterator = iter(self.source)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if len(chunk) == 0:
+                return
+            # compare types exactly, since e.g. bool is a subclass of int
+            if not all(type(element) is self.element_type for element in chunk):
+                raise TypeError(
+                    f"stream of {self.element_type} produced an element "
+                    f"of another type"
+                )
+            yield chunk
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any
 
 from saveables.contracts.data_type import (EmptyIterable,
@@ -19,9 +20,10 @@ def is_typed_uniformly(data: list[Any] | set[Any] | tuple[Any]) -> bool:
     """
     if len(data) == 0:
         return True
-    else:
-        obj_ = list(data)  # make sure data is indexable
-        return all([isinstance(el, type(obj_[0])) for el in obj_])
+    # sets are not indexable, and copying data is not needed to get the type
+    # of its first element
+    type_ = type(next(iter(data)))
+    return all(isinstance(el, type_) for el in data)
 
 
 def get_element_type(data: list[Any] | set[Any] | tuple[Any]) -> type:
@@ -46,7 +48,7 @@ def get_element_type(data: list[Any] | set[Any] | tuple[Any]) -> type:
             "can only return element type if all elements have the same type"
         )
     else:
-        return type(list(data)[0])
+        return type(next(iter(data)))
 
 
 def is_simple_iterable(data: Any) -> bool:
@@ -109,7 +111,7 @@ def is_supported_primitive(data: Any) -> bool:
     Returns:
         bool: True if data's type is any of the supported primitive data types
     """
-    return any([isinstance(data, type_) for type_ in supported_primitive_data_types])
+    return isinstance(data, supported_primitive_data_types)
 
 
 def list_meta_data_attributes() -> list[str]:
@@ -119,11 +121,17 @@ def list_meta_data_attributes() -> list[str]:
     Returns:
         list[str]: list of attribute names
     """
-    return [str(name) for name in MetaData.__dataclass_fields__.keys()]
+    return list(_meta_data_attributes())
+
+
+@cache
+def _meta_data_attributes() -> tuple[str, ...]:
+    # the fields of MetaData do not change, so they are looked up only once
+    return tuple(str(name) for name in MetaData.__dataclass_fields__.keys())
 
 
 def list_meta_data_attribute_values(meta: MetaData) -> list[str]:
-    values = [getattr(meta, name) for name in list_meta_data_attributes()]
+    values = [getattr(meta, name) for name in _meta_data_attributes()]
     if any([not isinstance(val, str) for val in values]):
         raise ValueError("found attribute in meta object that is not a string")
     else:
@@ -0,0 +1,257 @@
+"""
+numeric iterables packed into sqlite3 BLOBs. Elements are stored as little
+endian 8 byte integers, 8 byte floats or 1 byte booleans. BLOBs are read and
+written incrementally through Connection.blobopen, so that the payload is never
+held in memory as a whole. Connection.blobopen exists since python 3.11. Older
+versions read the payload of a BLOB at once and cannot write packed iterables
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from array import array
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from saveables.contracts.constants import column_name_data
+
+if TYPE_CHECKING:
+    from sqlite3 import Blob, Connection
+
+    from saveables.contracts.data_type import tPythonTypeLiteral
+
+# number of bytes read or written at once
+blob_chunk_size = 1 << 20
+
+# BLOBs are read and written incrementally since python 3.11
+supports_blob_io = hasattr(sqlite3.Connection, "blobopen")
+
+# array type codes of element types that can be packed
+packed_type_codes: dict[str, str] = {"int": "q", "float": "d", "bool": "B"}
+
+# range of integers that can be packed
+_int_range = (-(2**63), 2**63 - 1)
+
+
+def is_packable(values: list[Any] | tuple[Any, ...] | set[Any], type_: type) -> bool:
+    """
+    check if the elements of a simple iterable can be packed into a BLOB
+
+    Args:
+        values (list | tuple | set): uniformly typed elements
+        type_ (type): type of elements
+
+    Returns:
+        bool: True if the iterable is not empty, its elements are int, float or
+              bool and integers fit into 8 bytes
+    """
+    if len(values) == 0 or type_ not in (int, float, bool):
+        return False
+    if type_ is int:
+        return bool(_int_range[0] <= min(values) and max(values) <= _int_range[1])
+    return True
+
+
+def _type_code(type_literal: tPythonTypeLiteral) -> str:
+    try:
+        return packed_type_codes[type_literal]
+    except KeyError:
+        raise ValueError(f"elements of type {type_literal} cannot be packed")
+
+
+def pack_chunks(
+    values: Iterable[Any], type_literal: tPythonTypeLiteral, chunk_size: int
+) -> Iterator[bytes]:
+    """
+    pack elements into chunks of bytes without packing all elements at once
+
+    Args:
+        values (Iterable[Any]): elements, e.g. a generator
+        type_literal (tPythonTypeLiteral): literal of element type
+        chunk_size (int): maximum number of bytes per chunk
+
+    Raises:
+        ValueError: if elements cannot be packed
+
+    Yields:
+        bytes: packed elements
+    """
+    type_code = _type_code(type_literal)
+    n_elements = max(1, chunk_size // array(type_code).itemsize)
+    iterator = iter(values)
+    while True:
+        try:
+            chunk = array(type_code, islice(iterator, n_elements))
+        except (OverflowError, TypeError) as e:
+            raise ValueError(f"cannot pack elements as {type_literal}: {e}")
+        if len(chunk) == 0:
+            return
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        yield chunk.tobytes()
+
+
+def unpack_chunk(chunk: bytes, type_literal: tPythonTypeLiteral) -> list[Any]:
+    """
+    unpack elements from bytes
+
+    Args:
+        chunk (bytes): packed elements
+        type_literal (tPythonTypeLiteral): literal of element type
+
+    Returns:
+        list[Any]: elements
+    """
+    elements = array(_type_code(type_literal))
+    elements.frombytes(chunk)
+    if sys.byteorder == "big":
+        elements.byteswap()
+    if type_literal == "bool":
+        return [bool(element) for element in elements]
+    return elements.tolist()
+
+
+def item_size(type_literal: tPythonTypeLiteral) -> int:
+    """
+    number of bytes of a packed element
+
+    Args:
+        type_literal (tPythonTypeLiteral): literal of element type
+
+    Returns:
+        int: size of element in bytes
+    """
+    return array(_type_code(type_literal)).itemsize
+
+
+class PackedBlob:
+    """
+    numeric iterable that is packed into the data column of a table row. The
+    payload is read incrementally, chunk by chunk
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        table_name: str,
+        row_id: int,
+        element_type: tPythonTypeLiteral,
+    ):
+        """
+        Args:
+            connection (Connection): connection to file
+            table_name (str): name of table that holds the row
+            row_id (int): id of row
+            element_type (tPythonTypeLiteral): literal of element type
+        """
+        self._connection = connection
+        self.table_name = table_name
+        self.row_id = row_id
+        self.element_type = element_type
+        self.item_size = item_size(element_type)
+        if supports_blob_io:
+            with self._open() as blob:
+                self.nbytes = len(blob)
+        else:
+            cmd = f"SELECT length({column_name_data}) FROM {table_name} WHERE rowid = ?"
+            (self.nbytes,) = connection.execute(cmd, (row_id,)).fetchone()
+
+    def __len__(self) -> int:
+        return self.nbytes // self.item_size
+
+    def _open(self) -> Blob:
+        return self._connection.blobopen(
+            self.table_name, column_name_data, self.row_id, readonly=True
+        )
+
+    def iter_chunks(self, chunk_size: int = blob_chunk_size) -> Iterator[bytes]:
+        """
+        iterate over the payload in chunks of bytes. Chunks hold whole elements
+
+        Args:
+            chunk_size (int, optional): maximum number of bytes per chunk.
+                                        Defaults to blob_chunk_size.
+
+        Yields:
+            bytes: chunk of payload
+        """
+        chunk_size = max(self.item_size, chunk_size - chunk_size % self.item_size)
+        if not supports_blob_io:
+            # the payload is read at once and sliced into chunks
+            cmd = f"SELECT {column_name_data} FROM {self.table_name} WHERE rowid = ?"
+            (payload,) = self._connection.execute(cmd, (self.row_id,)).fetchone()
+            view = memoryview(payload)
+            for offset in range(0, len(view), chunk_size):
+                yield bytes(view[offset : offset + chunk_size])
+            return
+        with self._open() as blob:
+            while True:
+                chunk = blob.read(chunk_size)
+                if len(chunk) == 0:
+                    return
+                yield chunk
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self.iter_chunks():
+            yield from unpack_chunk(chunk, self.element_type)
+
+    def readinto(self, buffer: Any, chunk_size: int = blob_chunk_size) -> int:
+        """
+        copy the payload into a preallocated buffer, e.g. a bytearray or a
+        numpy array of dtype "<i8", "<f8" or bool. The payload is copied as
+        stored, in little endian byte order, and chunk by chunk, so that no copy
+        of the whole payload is created
+
+        Args:
+            buffer (Any): writable object that supports the buffer protocol
+            chunk_size (int, optional): maximum number of bytes copied at once.
+                                        Defaults to blob_chunk_size.
+
+        Raises:
+            ValueError: if the buffer is too small
+
+        Returns:
+            int: number of bytes copied
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < self.nbytes:
+            raise ValueError(
+                f"buffer of {len(view)} bytes is too small for {self.nbytes} bytes"
+            )
+        offset = 0
+        for chunk in self.iter_chunks(chunk_size):
+            view[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return offset
+
+
+def write_blob(
+    connection: Connection, table_name: str, row_id: int, chunks: Iterable[bytes]
+) -> None:
+    """
+    write chunks into the data column of a row, which must hold a BLOB of the
+    size of all chunks, e.g. created with zeroblob
+
+    Args:
+        connection (Connection): connection to file
+        table_name (str): name of table that holds the row
+        row_id (int): id of row
+        chunks (Iterable[bytes]): payload, e.g. created by pack_chunks
+
+    Raises:
+        ValueError: if size of chunks does not match size of BLOB or BLOBs
+                    cannot be written incrementally
+    """
+    if not supports_blob_io:
+        raise ValueError("packed iterables can only be written with python 3.11+")
+    with connection.blobopen(table_name, column_name_data, row_id) as blob:
+        size = len(blob)
+        offset = 0
+        for chunk in chunks:
+            if offset + len(chunk) > size:
+                raise ValueError(f"payload exceeds BLOB of {size} bytes")
+            blob.write(chunk)
+            offset += len(chunk)
+    if offset != size:
+        raise ValueError(f"payload of {offset} bytes does not fill {size} bytes")
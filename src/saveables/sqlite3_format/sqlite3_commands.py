@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 
 from saveables.contracts.constants import (column_name_data, column_name_id,
                                            column_name_meta_data,
@@ -9,12 +10,37 @@ from saveables.contracts.constants import (column_name_data, column_name_id,
 from saveables.saveable.utils import list_meta_data_attributes
 
 
-@dataclass
+# maximal number of commands cached per function that creates commands for a
+# table. Table names are taken from the saved data, so their number is unbounded
+command_cache_size = 2**10
+
+# selects the data column but replaces BLOBs by an empty BLOB. Packed iterables
+# are recognized by the type of the data and their payload is read incrementally
+data_without_blobs = (
+    f"CASE WHEN typeof({column_name_data}) = 'blob' THEN zeroblob(0) "
+    f"ELSE {column_name_data} END"
+)
+
+
+@dataclass(frozen=True)
 class SqlCommand:
-    """return type of every function that creates an sql command"""
+    """
+    return type of every function that creates an sql command. Commands are
+    cached by the functions that create them, so they must not be modified
+    """
 
     command: str  # command ready to be executed with cursor
     columns: list[str]  # column names involved in command
+    _column_indices: dict[str, int] = field(
+        init=False, repr=False, compare=False
+    )  # column indices by column name
+
+    def __post_init__(self) -> None:
+        # the first occurence of a column name determines its index
+        indices: dict[str, int] = dict()
+        for index, column_name in enumerate(self.columns):
+            indices.setdefault(column_name, index)
+        object.__setattr__(self, "_column_indices", indices)
 
     def get_column_index(self, column_name: str) -> int:
         """index of given column
@@ -29,11 +55,12 @@ class SqlCommand:
             int: column index
         """
         try:
-            return self.columns.index(column_name)
-        except ValueError:
+            return self._column_indices[column_name]
+        except KeyError:
             raise ValueError(f'column "{column_name}" does not exist')
 
 
+@cache
 def table_exists() -> SqlCommand:
     """
     return an sql command that returns (1, ) when executed if a table with given
@@ -53,6 +80,7 @@ def table_exists() -> SqlCommand:
     return SqlCommand(command=cmd, columns=[])
 
 
+@lru_cache(maxsize=command_cache_size)
 def create_saveables_object_table(table_name: str) -> SqlCommand:
     """
     return command to execute from sqlite cursor object that
@@ -111,6 +139,7 @@ def create_saveables_object_table(table_name: str) -> SqlCommand:
     return SqlCommand(command, columns)
 
 
+@cache
 def create_meta_data_table() -> SqlCommand:
     """
     generate sql command the creates meta data table from meta data attributes
@@ -136,6 +165,48 @@ def create_meta_data_table() -> SqlCommand:
     return SqlCommand(command, [column_name_id] + list_meta_data_attributes())
 
 
+@cache
+def create_meta_data_index() -> SqlCommand:
+    """
+    generate sql command that creates an index over all meta data attributes of
+    the meta data table, so that existing meta data rows are found without
+    scanning the table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = ", ".join(list_meta_data_attributes())
+    command = (
+        f"CREATE INDEX IF NOT EXISTS {meta_data_table_name}_values "
+        f"ON {meta_data_table_name} ({columns})"
+    )
+    return SqlCommand(command, list_meta_data_attributes())
+
+
+@lru_cache(maxsize=command_cache_size)
+def create_object_id_index(table_name: str) -> SqlCommand:
+    """
+    generate sql command that creates an index over the object id and meta data
+    columns of a table, so that the rows of an object are found without scanning
+    the table
+
+    Args:
+        table_name (str): name of table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = [column_name_object_id, column_name_meta_data]
+    command = (
+        f"CREATE INDEX IF NOT EXISTS {table_name}_{column_name_object_id} "
+        f"ON {table_name} ({', '.join(columns)})"
+    )
+    return SqlCommand(command, columns)
+
+
+@cache
 def insert_meta_data() -> SqlCommand:
     """
     sql command that puts information from meta data object into table
@@ -175,11 +246,17 @@ def select_row_id(tablename: str, column_names: list[str]) -> SqlCommand:
         SqlCommand: object that holds sql command as string and relevant column
                     namess
     """
+    return _select_row_id(tablename, tuple(column_names))
+
+
+@lru_cache(maxsize=command_cache_size)
+def _select_row_id(tablename: str, column_names: tuple[str, ...]) -> SqlCommand:
     columns = " AND ".join([f"{column_name} = ?" for column_name in column_names])
     cmd = f"SELECT {column_name_id} FROM {tablename} WHERE " + columns
     return SqlCommand(cmd, [column_name_id])
 
 
+@lru_cache(maxsize=command_cache_size)
 def insert_primitive_data(table_name: str) -> SqlCommand:
     """
     sql command that adds a row to a given table that represents a primitive
@@ -206,6 +283,29 @@ def insert_primitive_data(table_name: str) -> SqlCommand:
     )
 
 
+@lru_cache(maxsize=command_cache_size)
+def insert_packed_data(table_name: str) -> SqlCommand:
+    """
+    sql command that adds a row to a given table that holds a packed iterable.
+    The data column is filled with a BLOB of zeros whose size in bytes is the
+    value passed for the data column. The payload is written into the BLOB
+    afterwards
+
+    Args:
+        table_name (str): name of table the row is to be added
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = [column_name_object_id, column_name_data, column_name_meta_data]
+    return SqlCommand(
+        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES (?, zeroblob(?), ?)",
+        columns,
+    )
+
+
+@lru_cache(maxsize=command_cache_size)
 def insert_saveable_data(table_name: str) -> SqlCommand:
     """
     sql command that adds a row to a given table that represents a saveable datatype
@@ -231,12 +331,30 @@ def insert_saveable_data(table_name: str) -> SqlCommand:
     )
 
 
+def _select_python_attributes(table_name: str, condition: str = "") -> SqlCommand:
+    # the first row of each attribute is selected, since min(id) is the only
+    # aggregate, its bare columns are taken from the row with the smallest id
+    columns = [column_name_data, column_name_meta_data]
+    command = (
+        f"SELECT {data_without_blobs}, {column_name_meta_data} FROM {table_name} "
+        f"WHERE {column_name_object_id} = ? "
+        f"AND {column_name_reference} IS NULL "
+        f"AND {column_name_reference_id} IS NULL{condition} "
+        f"GROUP BY {column_name_meta_data} ORDER BY min({column_name_id})"
+    )
+    return SqlCommand(command, columns)
+
+
+@lru_cache(maxsize=command_cache_size)
 def select_python_attributes_from_table(table_name: str) -> SqlCommand:
     """
-    Select all rows that belong to a certain object and represent
-    a native python type. The row represents a native python type
-    if the reference columns are empty. The object of interest is
-    specified by object_id
+    Select the first row of each attribute that belongs to a certain object and
+    represents a native python type, in the order the attributes have been
+    written. The row represents a native python type if the reference columns
+    are empty. The remaining rows of simple iterables and dictionaries hold
+    their further elements and are not selected. The object of interest is
+    specified by object_id. Packed iterables are selected with an empty BLOB
+    as data
     Args:
         table_name (str): name of table
 
@@ -244,19 +362,34 @@ def select_python_attributes_from_table(table_name: str) -> SqlCommand:
         SqlCommand: object that holds sql command as string and relevant column
                     names
     """
-    # define columns that are relevant
-    columns = ", ".join([column_name_data, column_name_meta_data])
+    return _select_python_attributes(table_name)
 
-    # build select command
-    command = (
-        f"SELECT {columns} FROM {table_name} "
-        f"WHERE {column_name_object_id} = ? "
-        f"AND {column_name_reference} IS NULL "
-        f"AND {column_name_reference_id} IS NULL"
+
+@lru_cache(maxsize=command_cache_size)
+def select_python_attributes_by_name(table_name: str, n_names: int) -> SqlCommand:
+    """
+    Select the rows that belong to a certain object and represent native
+    python attributes with certain names, see
+    select_python_attributes_from_table. The object of interest is specified by
+    object_id, followed by the names of the attributes
+
+    Args:
+        table_name (str): name of table
+        n_names (int): number of attribute names
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    names = ", ".join(["?"] * n_names)
+    return _select_python_attributes(
+        table_name,
+        f" AND {column_name_meta_data} IN "
+        f"(SELECT id FROM {meta_data_table_name} WHERE name IN ({names}))",
     )
-    return SqlCommand(command, columns.split(", "))
 
 
+@cache
 def select_meta_data() -> SqlCommand:
     """
     get an sql command that selects a row from meta data table with
@@ -275,6 +408,7 @@ def select_meta_data() -> SqlCommand:
     return SqlCommand(cmd, columns.split(", "))
 
 
+@lru_cache(maxsize=command_cache_size)
 def select_saveable_attributes_from_table(table_name: str) -> SqlCommand:
     """
     select all rows in a given table that belong to a certain object.
@@ -300,9 +434,59 @@ def select_saveable_attributes_from_table(table_name: str) -> SqlCommand:
     return SqlCommand(command, columns.split(", "))
 
 
+@lru_cache(maxsize=command_cache_size)
+def delete_python_attribute(table_name: str) -> SqlCommand:
+    """
+    delete all rows that belong to a certain object and represent the native
+    python attribute of a certain name. The object of interest is specified by
+    object_id, the attribute by its name
+
+    Args:
+        table_name (str): name of table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    command = (
+        f"DELETE FROM {table_name} "
+        f"WHERE {column_name_object_id} = ? "
+        f"AND {column_name_reference} IS NULL "
+        f"AND {column_name_reference_id} IS NULL "
+        f"AND {column_name_meta_data} IN "
+        f"(SELECT id FROM {meta_data_table_name} WHERE name = ?)"
+    )
+    return SqlCommand(command, [column_name_object_id, "name"])
+
+
+@lru_cache(maxsize=command_cache_size)
+def delete_saveable_reference(table_name: str) -> SqlCommand:
+    """
+    delete the row that references the child object of a certain name. The
+    object of interest is specified by object_id, the child by its name
+
+    Args:
+        table_name (str): name of table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    command = (
+        f"DELETE FROM {table_name} "
+        f"WHERE {column_name_object_id} = ? "
+        f"AND {column_name_reference} = ?"
+    )
+    return SqlCommand(command, [column_name_object_id, column_name_reference])
+
+
+@lru_cache(maxsize=command_cache_size)
 def select_simple_iterable_elements(table_name: str) -> SqlCommand:
     """
-    select all rows that belong to a element in a simple iterable
+    select all rows that belong to a element in a simple iterable, in the order
+    they have been written. The row ids are explicit primary keys, which are
+    kept by VACUUM, so they hold the positions of the elements. A packed
+    iterable is selected as a single row with an empty BLOB as data
 
     Args:
         table_name (str): name of table
@@ -312,17 +496,79 @@ def select_simple_iterable_elements(table_name: str) -> SqlCommand:
                     names
     """
 
-    columns = [column_name_data]
+    columns = [column_name_id, column_name_data]
 
     command = (
-        f"SELECT {columns[0]} FROM {table_name} "
+        f"SELECT {column_name_id}, {data_without_blobs} FROM {table_name} "
         f"WHERE {column_name_meta_data} = ? "
         f"AND {column_name_object_id} = ? "
+        f"ORDER BY {column_name_id}"
     )
 
     return SqlCommand(command, columns)
 
 
+@lru_cache(maxsize=command_cache_size)
+def select_dictionary_elements(table_name: str) -> SqlCommand:
+    """
+    select the rows of the keys and of the values of a dictionary with one
+    query. The object of interest is specified by object_id, followed by the
+    meta data ids of the keys and of the values. Rows are ordered by meta data
+    id and by their position, which is the order of the index over object id
+    and meta data, so that they are read from the index without sorting
+
+    Args:
+        table_name (str): name of table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = [column_name_meta_data, column_name_id, column_name_data]
+    command = (
+        f"SELECT {column_name_meta_data}, {column_name_id}, {data_without_blobs} "
+        f"FROM {table_name} "
+        f"WHERE {column_name_object_id} = ? "
+        f"AND {column_name_meta_data} IN (?, ?) "
+        f"ORDER BY {column_name_meta_data}, {column_name_id}"
+    )
+    return SqlCommand(command, columns)
+
+
+@cache
+def select_all_meta_data() -> SqlCommand:
+    """
+    select all rows of the meta data table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = [column_name_id] + list_meta_data_attributes()
+    cmd = f"SELECT {', '.join(columns)} FROM {meta_data_table_name}"
+    return SqlCommand(cmd, columns)
+
+
+@lru_cache(maxsize=command_cache_size)
+def select_all_rows(table_name: str) -> SqlCommand:
+    """
+    select object id, data, meta data and references of all rows in a given
+    table in the order they have been written. Packed iterables are selected
+    with an empty BLOB as data
+
+    Args:
+        table_name (str): name of table
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    columns = [column_name_id] + column_names
+    selected = [data_without_blobs if c == column_name_data else c for c in columns]
+    cmd = f"SELECT {', '.join(selected)} FROM {table_name} ORDER BY {column_name_id}"
+    return SqlCommand(cmd, columns)
+
+
 def get_first_row_of_table(table_name: str, columns: list[str]) -> SqlCommand:
     """
     get specified columns of the first row in a given table
@@ -339,3 +585,19 @@ def get_first_row_of_table(table_name: str, columns: list[str]) -> SqlCommand:
     columns_string = ", ".join(columns)
     cmd = f"SELECT {columns_string} FROM {table_name} LIMIT 1"
     return SqlCommand(cmd, columns)
+
+
+def set_pragma(pragma_name: str, value: str | int) -> SqlCommand:
+    """
+    sql command that sets a pragma. Pragmas do not support parameters, so the
+    value is put into the command directly and must be validated by the caller
+
+    Args:
+        pragma_name (str): name of pragma
+        value (str | int): value of pragma
+
+    Returns:
+        SqlCommand: object that holds sql command as string and relevant column
+                    names
+    """
+    return SqlCommand(f"PRAGMA {pragma_name} = {value}", [])
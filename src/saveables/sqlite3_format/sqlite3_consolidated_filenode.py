@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generator
+
+from saveables.contracts.constants import (column_name_data, column_name_id,
+                                           column_name_meta_data,
+                                           column_name_object_id,
+                                           column_name_reference,
+                                           column_name_reference_id, name,
+                                           nodes_table_name, values_table_name)
+from saveables.contracts.data_type import (EmptyIterable,
+                                           python_type_literal_map_reversed)
+from saveables.saveable.utils import list_meta_data_attributes
+from saveables.sqlite3_format.sqlite3_commands import (select_all_meta_data,
+                                                       select_all_rows)
+from saveables.sqlite3_format.sqlite3_filenode import Sqlite3FileNode
+
+if TYPE_CHECKING:
+    from sqlite3 import Cursor
+
+    from saveables.contracts.data_type import tPythonTypeLiteral
+
+
+@dataclass
+class Sqlite3Tree:
+    """
+    content of a file with consolidated layout, read with one query per table
+    and grouped by object id
+    """
+
+    # data and meta data id of the first row of each attribute by object id.
+    # The remaining rows of simple iterables are only kept as elements
+    attribute_rows: dict[str, list[tuple[str | bytes, int]]] = field(
+        default_factory=dict
+    )
+    # row id and data of the elements of simple iterables by object id and meta
+    # data id
+    elements: dict[tuple[str, int], list[tuple[int, str | bytes]]] = field(
+        default_factory=dict
+    )
+    # name and object id of child nodes by object id
+    children: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    # meta data keyword arguments by meta data id
+    meta_data_rows: dict[int, dict[str, str]] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, cursor: Cursor) -> Sqlite3Tree:
+        """
+        read all nodes, values and meta data of a file with consolidated layout
+
+        Args:
+            cursor (Cursor): cursor of connection to file
+
+        Returns:
+            Sqlite3Tree: content of file
+        """
+        tree = cls()
+
+        command = select_all_meta_data()
+        cursor.execute(command.command)
+        attribute_names = list_meta_data_attributes()
+        indices = [command.get_column_index(name) for name in attribute_names]
+        id_index = command.get_column_index(column_name_id)
+        for row in cursor.fetchall():
+            tree.meta_data_rows[row[id_index]] = {
+                name: row[index] for name, index in zip(attribute_names, indices)
+            }
+
+        command = select_all_rows(values_table_name)
+        cursor.execute(command.command)
+        id_index = command.get_column_index(column_name_id)
+        object_id_index = command.get_column_index(column_name_object_id)
+        data_index = command.get_column_index(column_name_data)
+        meta_data_index = command.get_column_index(column_name_meta_data)
+        for row in cursor.fetchall():
+            key = (row[object_id_index], row[meta_data_index])
+            elements = tree.elements.get(key)
+            if elements is None:
+                elements = tree.elements[key] = []
+                tree.attribute_rows.setdefault(key[0], []).append(
+                    (row[data_index], key[1])
+                )
+            elements.append((row[id_index], row[data_index]))
+
+        command = select_all_rows(nodes_table_name)
+        cursor.execute(command.command)
+        object_id_index = command.get_column_index(column_name_object_id)
+        reference_index = command.get_column_index(column_name_reference)
+        reference_id_index = command.get_column_index(column_name_reference_id)
+        for row in cursor.fetchall():
+            tree.children.setdefault(row[object_id_index], []).append(
+                (row[reference_index], row[reference_id_index])
+            )
+        return tree
+
+
+class Sqlite3ConsolidatedFileNode(Sqlite3FileNode):
+    """
+    node of the consolidated sqlite3 layout. Instead of one table per attribute
+    name, the data of all nodes are stored in a single values table and the
+    references to child nodes in a single nodes table. Rows are assigned to
+    their node by object id and selected through the object id index. Before a
+    whole file is loaded, its content is read into a Sqlite3Tree, which the
+    nodes take their rows from, so that the file is loaded with a fixed number
+    of queries
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: Sqlite3ConsolidatedFileNode | None,
+        cursor: Cursor,
+        object_id: str,
+        tree: Sqlite3Tree | None = None,
+        pack_iterables: bool = False,
+        read_only: bool = False,
+    ):
+        """
+        Args:
+            name (str): name of node
+            parent (Sqlite3ConsolidatedFileNode | None): parent node
+            cursor (Cursor): cursor of connection to file
+            object_id (str): id of the object the node represents
+            tree (Sqlite3Tree | None, optional): content of file that is read.
+                                                 None if rows are selected by
+                                                 object id. Defaults to None.
+            pack_iterables (bool, optional): if True, non empty iterables of int,
+                                             float or bool are written as a
+                                             single BLOB. Defaults to False.
+            read_only (bool, optional): if True, the file is only read.
+                                        Nodes with a tree are always read only.
+                                        Defaults to False.
+        """
+        super().__init__(
+            name,
+            parent,
+            cursor,
+            object_id,
+            read_only=read_only or tree is not None,
+            pack_iterables=pack_iterables,
+        )
+        self._tree: Sqlite3Tree | None = None
+        if tree is not None:
+            self.use_tree(tree)
+
+    @property
+    def _values_table(self) -> str:
+        return values_table_name
+
+    @property
+    def _nodes_table(self) -> str:
+        return nodes_table_name
+
+    def _child_table(self, name_: str) -> str:
+        return values_table_name
+
+    def _create_node_table(self) -> None:
+        # tables are shared by all nodes and created when the file is opened
+        pass
+
+    def _create_node(self, name: str, object_id: str) -> Sqlite3FileNode:
+        return Sqlite3ConsolidatedFileNode(
+            name,
+            self,
+            self._cursor,
+            object_id,
+            self._tree,
+            self._pack_iterables,
+            self._read_only,
+        )
+
+    def read_tree(self) -> None:
+        """
+        read the whole content of the file into a tree, which the node and the
+        child nodes that are created afterwards take their rows from. Used
+        before all attributes of a file are loaded
+        """
+        self.use_tree(Sqlite3Tree.read(self._cursor))
+
+    def use_tree(self, tree: Sqlite3Tree | None) -> None:
+        """
+        take the rows of the node from given tree, or select them by object id
+        again if tree is None
+
+        Args:
+            tree (Sqlite3Tree | None): content of file
+        """
+        self._tree = tree
+        if tree is not None:
+            self._meta_data_rows.update(tree.meta_data_rows)
+
+    def _select_attribute_rows(
+        self, names: tuple[str, ...] | None = None
+    ) -> list[tuple[str | bytes, int]]:
+        """
+        select the first row of each native python attribute of the object from
+        the tree, or from the values table if the node has no tree, see
+        Sqlite3FileNode._select_attribute_rows
+
+        Args:
+            names (tuple[str, ...] | None, optional): names of attributes whose
+                                                      rows are selected. None
+                                                      selects the rows of all
+                                                      attributes. Defaults to None.
+
+        Returns:
+            list[tuple[str | bytes, int]]: data and meta data id of the first row
+                                           of each attribute
+        """
+        if self._tree is None:
+            return super()._select_attribute_rows(names)
+        rows = self._tree.attribute_rows.get(self._object_id, [])
+        if names is None:
+            return rows
+        return [
+            row
+            for row in rows
+            if self._tree.meta_data_rows[row[1]][name] in names
+        ]
+
+    def _select_elements(self, meta_data_id: int) -> list[tuple[int, str | bytes]]:
+        """
+        select the elements of a simple iterable or of dictionary keys / values
+        from the tree, or from the values table if the node has no tree, see
+        Sqlite3FileNode._select_elements
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+
+        Returns:
+            list[tuple[int, str | bytes]]: row id and data of the elements in the
+                                           order they have been written
+        """
+        if self._tree is None:
+            return super()._select_elements(meta_data_id)
+        return self._tree.elements.get((self._object_id, meta_data_id), [])
+
+    def _select_dictionary_elements(
+        self, keys_meta_data_id: int, values_meta_data_id: int
+    ) -> tuple[list[tuple[int, str | bytes]], list[tuple[int, str | bytes]]]:
+        """
+        select the elements of the keys and of the values of a dictionary from
+        the tree, or with one query if the node has no tree, see
+        Sqlite3FileNode._select_dictionary_elements
+
+        Args:
+            keys_meta_data_id (int): id of meta data row of the keys
+            values_meta_data_id (int): id of meta data row of the values
+
+        Returns:
+            tuple[list[tuple[int, str | bytes]], list[tuple[int, str | bytes]]]:
+                row id and data of the keys and of the values in the order they
+                have been written
+        """
+        if self._tree is None:
+            return super()._select_dictionary_elements(
+                keys_meta_data_id, values_meta_data_id
+            )
+        return self._select_elements(keys_meta_data_id), self._select_elements(
+            values_meta_data_id
+        )
+
+    def _iter_elements(
+        self, meta_data_id: int, element_type_: tPythonTypeLiteral, chunk_size: int
+    ) -> Generator[Any, None, None]:
+        """
+        read elements of a simple iterable one by one. Elements of a tree are
+        converted while they are consumed, otherwise they are fetched chunk by
+        chunk, see Sqlite3FileNode._iter_elements
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+            element_type_ (tPythonTypeLiteral): literal of element type
+            chunk_size (int): number of rows fetched at once
+
+        Yields:
+            Generator[Any, None, None]: elements converted to their type
+        """
+        if self._tree is None:
+            yield from super()._iter_elements(meta_data_id, element_type_, chunk_size)
+            return
+        type_ = python_type_literal_map_reversed[element_type_]
+        if type_ == EmptyIterable:
+            return
+        rows = self._select_elements(meta_data_id)
+        if len(rows) == 1 and isinstance(rows[0][1], bytes):
+            yield from self._open_blob(rows[0][0], element_type_)
+            return
+        for _, data in rows:
+            yield type_(data)
+
+    def _select_children(self) -> list[tuple[str, str]]:
+        """
+        select name and object id of the child nodes from the tree, or from the
+        nodes table if the node has no tree, see Sqlite3FileNode._select_children
+
+        Returns:
+            list[tuple[str, str]]: name and object id of each child node
+        """
+        if self._tree is None:
+            return super()._select_children()
+        return self._tree.children.get(self._object_id, [])
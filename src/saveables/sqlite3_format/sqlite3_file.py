@@ -1,24 +1,241 @@
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Generator, Iterable
 
 from saveables.base.base_file import BaseFile
 from saveables.contracts.constants import (column_name_id,
                                            column_name_object_id,
                                            meta_data_table_name,
-                                           n_object_id_chars, read_mode, root,
-                                           write_mode)
-from saveables.contracts.data_type import tFileMode
+                                           n_object_id_chars, nodes_table_name,
+                                           read_mode, root, update_mode,
+                                           values_table_name, write_mode)
+from saveables.contracts.data_type import tFileMode, tSqlite3Layout
 from saveables.python_utils import generate_uuid
-from saveables.sqlite3_format.sqlite3_commands import (create_meta_data_table,
-                                                       get_first_row_of_table,
-                                                       table_exists)
+from saveables.saveable.saveable import Saveable
+from saveables.sqlite3_format.sqlite3_blob import supports_blob_io
+from saveables.sqlite3_format.sqlite3_commands import (
+    create_meta_data_index, create_meta_data_table, create_object_id_index,
+    create_saveables_object_table, get_first_row_of_table, table_exists)
+from saveables.sqlite3_format.sqlite3_consolidated_filenode import (
+    Sqlite3ConsolidatedFileNode)
 from saveables.sqlite3_format.sqlite3_filenode import Sqlite3FileNode
+from saveables.sqlite3_format.sqlite3_pool import (PooledConnection,
+                                                   Sqlite3ConnectionPool,
+                                                   read_only_uri)
+from saveables.sqlite3_format.sqlite3_profile import (Sqlite3Profile,
+                                                      default_profile)
 
 
 class Sqlite3File(BaseFile):
-    def __init__(self, path: str | Path, mode: tFileMode):
+    # databases are (de)serialized since python 3.11
+    supports_bytes = hasattr(sqlite3.Connection, "serialize")
+    # iterables are packed into BLOBs since python 3.11
+    supports_blob_io = supports_blob_io
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: tFileMode,
+        profile: Sqlite3Profile = default_profile,
+        pool: Sqlite3ConnectionPool | None = None,
+        layout: tSqlite3Layout = "tables",
+        pack_iterables: bool = False,
+        deduplicate: bool = False,
+    ):
+        """
+        Args:
+            path (str | Path): path of sqlite3 file
+            mode (tFileMode): file mode
+            profile (Sqlite3Profile, optional): pragmas applied to the connection,
+                                                e.g. fast_bulk_profile. Pragmas that
+                                                change the database file are only
+                                                applied when writing.
+                                                Defaults to default_profile.
+            pool (Sqlite3ConnectionPool | None, optional): pool of read only
+                                                           connections, e.g.
+                                                           connection_pool. Only
+                                                           used to read files.
+                                                           Defaults to None.
+            layout (tSqlite3Layout, optional): layout of written files. "tables"
+                                               creates one table per attribute
+                                               name, "consolidated" stores all
+                                               nodes in one table and all values
+                                               in another. The layout of a file
+                                               that is read is detected.
+                                               Defaults to "tables".
+            pack_iterables (bool, optional): if True, non empty iterables of int,
+                                             float or bool are written as a single
+                                             BLOB that is read incrementally.
+                                             Requires python 3.11+. Packed
+                                             iterables are detected when
+                                             reading. Defaults to False.
+            deduplicate (bool, optional): if True, saveables that equal data that
+                                          have already been written are saved as
+                                          references to the object id of the data.
+                                          In the tables layout, only saveables of
+                                          the same name are referenced.
+                                          Defaults to False.
+
+        Raises:
+            ValueError: if a pool is given for a file that is written or iterables
+                        are packed with python < 3.11
+        """
         super().__init__(path, mode)
+        if pool is not None and mode != read_mode:
+            raise ValueError("connection pools can only be used to read files")
+        if pack_iterables and not self.supports_blob_io:
+            raise ValueError(
+                "packed iterables are written through Connection.blobopen, "
+                "which requires python 3.11+"
+            )
         self.conn: sqlite3.Connection | None = None
+        self.profile = profile
+        self.pool = pool
+        self.layout = layout
+        self.deduplicate = deduplicate
+        self.pack_iterables = pack_iterables
+        self._pooled: PooledConnection | None = None
+
+    def save(self, saveable: Saveable, validate: bool = True) -> None:
+        """
+        save object to file within a single transaction. If an error occurs,
+        the transaction is rolled back and the error is reraised
+
+        Args:
+            saveable (Saveable): object whose data are to be written to file
+            validate (bool, optional): if False, the types of the data are not
+                                       checked, see BaseFile.save.
+                                       Defaults to True.
+
+        Raises:
+            ValueError: if file has not been opened
+        """
+        with self.transaction():
+            super().save(saveable, validate)
+
+    def set(self, path: str, value: Any) -> None:
+        """
+        write the value of a single attribute within a single transaction, see
+        BaseFile.set
+
+        Args:
+            path (str): dotted path of attribute
+            value (Any): value of attribute
+
+        Raises:
+            ValueError: if file has not been opened
+        """
+        with self.transaction():
+            super().set(path, value)
+
+    def load(
+        self,
+        saveable: Saveable,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        shared: bool = False,
+        validate: bool = True,
+    ) -> None:
+        """
+        load data from file into given object, see BaseFile.load. If all
+        attributes of a file with consolidated layout are loaded, the whole file
+        is read with one query per table
+
+        Args:
+            saveable (Saveable): object that is supposed to hold the data from the file
+            fields (Iterable[str] | None, optional): paths of attributes to be loaded.
+                                                     None loads all attributes.
+                                                     Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+            shared (bool, optional): if True, attributes that refer to the same
+                                     data in the file are set to the same object.
+                                     Defaults to False.
+            validate (bool, optional): if False, checks of the data that are read
+                                       are skipped. Defaults to True.
+        """
+        with self._read_tree(fields is None and not exclude):
+            super().load(saveable, fields, exclude, shared, validate)
+
+    def load_as_dict(
+        self,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        load data from file into nested dictionaries, see BaseFile.load_as_dict.
+        If all attributes of a file with consolidated layout are loaded, the
+        whole file is read with one query per table
+
+        Args:
+            fields (Iterable[str] | None, optional): paths of attributes to be loaded.
+                                                     None loads all attributes.
+                                                     Defaults to None.
+            exclude (Iterable[str] | None, optional): paths of attributes that are
+                                                      not loaded. Defaults to None.
+
+        Returns:
+            dict[str, Any]: data of file by attribute name
+        """
+        with self._read_tree(fields is None and not exclude):
+            return super().load_as_dict(fields, exclude)
+
+    @contextmanager
+    def _read_tree(self, complete: bool) -> Generator[None, None, None]:
+        """
+        read the whole content of a file with consolidated layout into a tree
+        for the statements of a with block, if the file is read completely.
+        Otherwise, the rows of each node are selected by object id
+
+        Args:
+            complete (bool): True if all attributes of the file are read
+        """
+        if (
+            not complete
+            or self.mode != read_mode
+            or not isinstance(self.root, Sqlite3ConsolidatedFileNode)
+        ):
+            yield
+            return
+        node = self.root
+        node.read_tree()
+        try:
+            yield
+        finally:
+            node.use_tree(None)
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        run the statements of a with block within a single transaction. If an
+        error occurs, the transaction is rolled back and the error is reraised,
+        see BaseFile.transaction. Nested transactions are run within a
+        savepoint of the outer transaction, so only their own statements are
+        rolled back on errors
+
+        Raises:
+            ValueError: if file has not been opened
+        """
+        if self.conn is None:
+            raise ValueError(f"sqlite3 file {self.path} has not been opened")
+        if self.conn.in_transaction:
+            self.conn.execute("SAVEPOINT nested")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK TO nested")
+                self.conn.execute("RELEASE nested")
+                raise
+            self.conn.execute("RELEASE nested")
+            return
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def open(self) -> None:
         """
@@ -29,6 +246,8 @@ class Sqlite3File(BaseFile):
             self._open_to_write()
         elif self.mode == read_mode:
             self._open_to_read()
+        elif self.mode == update_mode:
+            self._open_to_update()
         else:
             raise ValueError(f"unknown read mode: {self.mode}")
 
@@ -37,38 +256,157 @@ class Sqlite3File(BaseFile):
         open file for write operation
         """
 
-        # open a sqlite3 file
-        conn = sqlite3.connect(self.path)
+        # open a sqlite3 file. Transactions are controlled explicitly
+        conn = self._connect(isolation_level=None)
         self.conn = conn
+        self.profile.apply(conn)
         cursor = conn.cursor()
 
         # create table for meta data objects
         cursor.execute(create_meta_data_table().command)
+        cursor.execute(create_meta_data_index().command)
 
         # create root file node
-        node = Sqlite3FileNode(
-            name=root,
-            parent=None,
-            cursor=cursor,
-            object_id=generate_uuid(n_object_id_chars),
-        )
-        self.root = node
+        if self.layout == "consolidated":
+            # create the tables that are shared by all nodes. The root node
+            # has a fixed object id, generated object ids are hexadecimal
+            for table_name in (nodes_table_name, values_table_name):
+                cursor.execute(create_saveables_object_table(table_name).command)
+                cursor.execute(create_object_id_index(table_name).command)
+            self.root = Sqlite3ConsolidatedFileNode(
+                root, None, cursor, root, pack_iterables=self.pack_iterables
+            )
+        else:
+            self.root = Sqlite3FileNode(
+                name=root,
+                parent=None,
+                cursor=cursor,
+                object_id=generate_uuid(n_object_id_chars),
+                pack_iterables=self.pack_iterables,
+            )
 
-    def _open_to_read(self) -> None:
+    def _open_to_update(self) -> None:
         """
-        open file for read operation
+        open an existing file to read and write single attributes. The layout
+        of the file is detected
 
         Raises:
             ValueError: If root table or meta table in file is empty or does not exist
         """
-
-        # open a sqlite3 file
-        conn = sqlite3.connect(self.path)
+        conn = self._connect(isolation_level=None)
         self.conn = conn
+        self.profile.apply(conn)
         cursor = conn.cursor()
+        object_id = self._read_root_object_id(cursor)
+        cursor.execute(create_meta_data_index().command)
+        if object_id == root:
+            self.root = Sqlite3ConsolidatedFileNode(
+                root, None, cursor, root, pack_iterables=self.pack_iterables
+            )
+        else:
+            self.root = Sqlite3FileNode(
+                name=root,
+                parent=None,
+                cursor=cursor,
+                object_id=object_id,
+                pack_iterables=self.pack_iterables,
+            )
+
+    def _open_to_read(self) -> None:
+        """
+        open file for read operation. Files are opened read only and immutable,
+        so they are neither created nor locked and must not be changed while
+        they are read. If the file has a pool, a pooled connection is used and
+        the file is only validated the first time it is opened through the pool
+
+        Raises:
+            ValueError: If root table or meta table in file is empty or does not exist
+        """
+        if self.pool is not None and self._image is None:
+            self._pooled = self.pool.acquire(
+                self.path, self.profile, self._read_root_object_id
+            )
+            self.conn = self._pooled.connection
+            object_id = self._pooled.root_object_id
+            cursor = self.conn.cursor()
+        else:
+            # open a sqlite3 file read only
+            conn = self._connect(read_only=True)
+            self.conn = conn
+            self.profile.apply(conn, read_only=True)
+            cursor = conn.cursor()
+            object_id = self._read_root_object_id(cursor)
+
+        # create root node. Files of consolidated layout are only read
+        # completely before all of their attributes are loaded
+        if object_id == root:
+            self.root = Sqlite3ConsolidatedFileNode(
+                root, None, cursor, root, read_only=True
+            )
+        else:
+            self.root = Sqlite3FileNode(
+                name=root,
+                parent=None,
+                cursor=cursor,
+                object_id=object_id,
+                read_only=True,
+            )
+
+    def _connect(self, read_only: bool = False, **kwargs: Any) -> sqlite3.Connection:
+        """
+        connect to file. Files that are held in memory are connected to an in
+        memory database that holds their content
+
+        Args:
+            read_only (bool, optional): if True, files are opened through a read
+                                        only uri, so that they are neither
+                                        changed nor created. Defaults to False.
+            kwargs (Any): keyword arguments passed to sqlite3.connect
+
+        Returns:
+            sqlite3.Connection: connection to file
+        """
+        if self._image is None and read_only:
+            conn: sqlite3.Connection = sqlite3.connect(
+                read_only_uri(self.path), uri=True, **kwargs
+            )
+        elif self._image is None:
+            conn = sqlite3.connect(self.path, **kwargs)
+        else:
+            conn = sqlite3.connect(":memory:", **kwargs)
+            # files that are written into memory start without content
+            if self._image:
+                conn.deserialize(self._image)
+        return conn
+
+    def _read_root_object_id(self, cursor: sqlite3.Cursor) -> str:
+        """
+        check that the file holds a saveable object and return the object id of
+        its root node. The root node of the consolidated layout has the object id
+        root
+
+        Args:
+            cursor (sqlite3.Cursor): cursor of connection to file
+
+        Raises:
+            ValueError: If root table or meta table in file is empty or does not exist
+
+        Returns:
+            str: object id of root node
+        """
 
         # check if neccessary tables exist
         cmd = table_exists()
+        cursor.execute(cmd.command, (values_table_name,))
+        if cursor.fetchone() is not None:
+            for table_name in (nodes_table_name, meta_data_table_name):
+                cursor.execute(cmd.command, (table_name,))
+                if cursor.fetchone() is None:
+                    raise ValueError(
+                        f"table {table_name} does not exist in database {self.path}"
+                    )
+            return root
+
         cursor.execute(cmd.command, (root,))
         if cursor.fetchone() is None:
             raise ValueError(f"table {root} does not exist in database {self.path}")
@@ -100,16 +438,19 @@ class Sqlite3File(BaseFile):
         cursor.execute(cmd.command)
         row = cursor.fetchone()
         index = cmd.get_column_index(column_name_object_id)
-        object_id = row[index]
-
-        # create root node
-        self.root = Sqlite3FileNode(
-            name=root, parent=None, cursor=cursor, object_id=object_id
-        )
+        object_id: str = row[index]
+        return object_id
 
     def close(self) -> None:
-        if self.conn is not None:
+        if self.pool is not None and self._pooled is not None:
+            # hand connection back to the pool instead of closing it
+            self.pool.release(self._pooled)
+            self._pooled = None
+            self.conn = None
+        elif self.conn is not None:
             self.conn.commit()
+            if self._image is not None and self.mode != read_mode:
+                self._image = self.conn.serialize()
             self.conn.close()
         else:
             raise ValueError(f"sqlite3 file {self.path} has not been opened")
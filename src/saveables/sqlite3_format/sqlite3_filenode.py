@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from logging import getLogger
-from typing import TYPE_CHECKING, Generator
+from typing import (TYPE_CHECKING, Any, Collection, Generator, Hashable,
+                    Iterable)
 
-from saveables.base.base_file_node import BaseFileNode
+from saveables.base.base_file_node import (BaseFileNode, check_stream,
+                                           stream_data_field)
 from saveables.contracts.constants import (attribute, column_name_data,
                                            column_name_id,
                                            column_name_meta_data,
@@ -11,49 +13,128 @@ from saveables.contracts.constants import (attribute, column_name_data,
                                            column_name_reference,
                                            column_name_reference_id, dict_keys,
                                            dict_values, meta_data_table_name,
-                                           n_object_id_chars, none_literal,
-                                           python_type)
+                                           n_object_id_chars, name,
+                                           none_literal, python_type, role)
 from saveables.contracts.data_type import (EmptyIterable,
                                            python_type_literal_map,
-                                           python_type_literal_map_reversed)
+                                           python_type_literal_map_reversed,
+                                           tPythonTypeLiteral, tRole)
 from saveables.python_utils import generate_uuid
 from saveables.saveable.data_field import DataField
-from saveables.saveable.meta_data import MetaData
-from saveables.saveable.utils import (is_simple_iterable,
-                                      is_supported_primitive,
+from saveables.saveable.meta_data import MetaData, get_meta_data
+from saveables.saveable.utils import (is_supported_primitive,
                                       list_meta_data_attribute_values,
                                       list_meta_data_attributes)
+from saveables.sqlite3_format.sqlite3_blob import (PackedBlob,
+                                                   blob_chunk_size,
+                                                   is_packable, item_size,
+                                                   pack_chunks, write_blob)
 from saveables.sqlite3_format.sqlite3_commands import (
-    SqlCommand, create_saveables_object_table, insert_meta_data,
-    insert_primitive_data, insert_saveable_data, select_meta_data,
-    select_python_attributes_from_table, select_row_id,
-    select_saveable_attributes_from_table, select_simple_iterable_elements,
-    table_exists)
+    SqlCommand, create_object_id_index, create_saveables_object_table,
+    delete_python_attribute, delete_saveable_reference, insert_meta_data,
+    insert_packed_data, insert_primitive_data, insert_saveable_data,
+    select_dictionary_elements, select_meta_data,
+    select_python_attributes_by_name, select_python_attributes_from_table,
+    select_row_id, select_saveable_attributes_from_table,
+    select_simple_iterable_elements, table_exists)
 from saveables.sqlite3_format.sqlite3filedata import SqlLite3FileData
 
 if TYPE_CHECKING:
     from sqlite3 import Cursor
+
+    from saveables.base.field_selection import FieldSelection
 logger = getLogger(__file__)
 
 
 class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
 
     def __init__(
-        self, name: str, parent: Sqlite3FileNode | None, cursor: Cursor, object_id: str
+        self,
+        name: str,
+        parent: Sqlite3FileNode | None,
+        cursor: Cursor,
+        object_id: str,
+        read_only: bool = False,
+        pack_iterables: bool = False,
     ):
+        """
+        Args:
+            name (str): name of node, which is also the name of its table
+            parent (Sqlite3FileNode | None): parent node
+            cursor (Cursor): cursor of connection to file
+            object_id (str): id of the object the node represents
+            read_only (bool, optional): if True, the node's table is expected to
+                                        exist and is neither checked nor created.
+                                        Defaults to False.
+            pack_iterables (bool, optional): if True, non empty iterables of int,
+                                             float or bool are written as a
+                                             single BLOB instead of one row per
+                                             element. Defaults to False.
+        """
         super().__init__(name, parent)
         self._cursor = cursor
         self._object_id = object_id
-        self._processed_iterables_and_dictionary_names: list[str] = []
-        self._dict_keys_cache: dict[
-            str, list[float] | list[str] | list[int] | list[bool]
-        ] = dict()
-        self._dict_values_cache: dict[
-            str, list[float] | list[str] | list[int] | list[bool]
-        ] = dict()
+        self._read_only = read_only
+        self._pack_iterables = pack_iterables
+
+        # ids of meta data rows by their meta data and values by their ids. The
+        # caches are shared by all nodes of a file
+        self._meta_data_ids: dict[MetaData, int] = (
+            dict() if parent is None else parent._meta_data_ids
+        )
+        self._meta_data_rows: dict[int, dict[str, str]] = (
+            dict() if parent is None else parent._meta_data_rows
+        )
+        # tables and object ids of the child nodes that have been created
+        self._created_object_ids: set[tuple[str, str]] = (
+            set() if parent is None else parent._created_object_ids
+        )
+        self._processed_iterables_and_dictionary_names: set[str] = set()
+        # meta data ids of the keys and values of dictionaries by name and role
+        self._dictionary_meta_data_ids: dict[str, dict[str, int]] = dict()
 
         # create table for filenode if neccessary
-        self._create_table(self.name, create_saveables_object_table(self.name))
+        if not read_only:
+            self._create_node_table()
+
+    @property
+    def _values_table(self) -> str:
+        """name of table that holds the primitive data of the node"""
+        return self.name
+
+    @property
+    def _nodes_table(self) -> str:
+        """name of table that holds the references to child nodes"""
+        return self.name
+
+    def _create_node_table(self) -> None:
+        """
+        create table of the node if neccessary, along with an index over object
+        id and meta data, so that the rows of an attribute are found without
+        scanning the table
+        """
+        if self._create_table(self.name, create_saveables_object_table(self.name)):
+            self._cursor.execute(create_object_id_index(self.name).command)
+
+    def _create_node(self, name: str, object_id: str) -> Sqlite3FileNode:
+        """
+        create a child node object of the same layout as the node
+
+        Args:
+            name (str): name of child node
+            object_id (str): id of the object the child node represents
+
+        Returns:
+            Sqlite3FileNode: child node
+        """
+        return Sqlite3FileNode(
+            name=name,
+            parent=self,
+            cursor=self._cursor,
+            object_id=object_id,
+            read_only=self._read_only,
+            pack_iterables=self._pack_iterables,
+        )
 
     def create_child_node(self, meta: MetaData) -> Sqlite3FileNode:
         """
@@ -65,31 +146,90 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
                              represent, like the attribute's name and type
                              for example
 
+        Raises:
+            ValueError: if the generated object id is already used by another
+                        node in the table of the child node
+
         Returns:
             Sqlite3FileNode: genereated child node
         """
 
-        # create child node
-        child = Sqlite3FileNode(
-            meta.name, self, self._cursor, object_id=generate_uuid(n_object_id_chars)
-        )
+        # create child node. Rows are assigned to nodes by object id, so nodes
+        # that shared an id would be merged
+        object_id = generate_uuid(n_object_id_chars)
+        key = (self._child_table(meta.name), object_id)
+        if key in self._created_object_ids:
+            raise ValueError(f"object id {object_id} of {meta.name} is not unique")
+        self._created_object_ids.add(key)
+        child = self._create_node(meta.name, object_id)
+        self._write_reference(meta, child._object_id)
+        return child
+
+    def link_saveable(self, meta: MetaData, original: BaseFileNode) -> bool:  # type: ignore[type-arg] # noqa: E501
+        """
+        write a reference to the object id of a node that holds the same data.
+        The data of a node are looked up in the table of its name, so nodes
+        of another name can only be referenced in the consolidated layout
+
+        Args:
+            meta (MetaData): meta data of saveable
+            original (BaseFileNode): node that holds the data
 
+        Returns:
+            bool: True if a reference has been written
+        """
+        if not isinstance(original, Sqlite3FileNode):
+            return False
+        if original._values_table != self._child_table(meta.name):
+            return False
+        self._write_reference(meta, original._object_id)
+        return True
+
+    def content_key(self) -> Hashable:
+        """
+        key that identifies the data of the node. Nodes that reference the same
+        data share their object id. Object ids of the tables layout are only
+        unique within the table of a node, so the key includes the table
+
+        Returns:
+            Hashable: table and object id of node
+        """
+        return self._values_table, self._object_id
+
+    def _child_table(self, name_: str) -> str:
+        """
+        name of the table that holds the data of a child node
+
+        Args:
+            name_ (str): name of child node
+
+        Returns:
+            str: name of table
+        """
+        return name_
+
+    def _write_reference(self, meta: MetaData, object_id: str) -> None:
+        """
+        write reference to a child node into the nodes table
+
+        Args:
+            meta (MetaData): meta data of saveable the child node holds
+            object_id (str): object id of child node
+        """
         # write meta data for child node
         meta_data_id = self._write_meta_data(meta)
 
         # write refrence into table
-        insert_saveable_data_command = insert_saveable_data(self.name)
+        insert_saveable_data_command = insert_saveable_data(self._nodes_table)
         data: dict[str, str | int] = {
             column_name_reference: meta.name,
-            column_name_reference_id: child._object_id,
+            column_name_reference_id: object_id,
             column_name_object_id: self._object_id,
             column_name_meta_data: meta_data_id,
         }
         self._insert_data(data, insert_saveable_data_command)
 
-        return child
-
-    def _create_table(self, table_name: str, create_command: SqlCommand) -> None:
+    def _create_table(self, table_name: str, create_command: SqlCommand) -> bool:
         """
         create a table if it does not exist already and log a message if table
         already exists
@@ -97,6 +237,9 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         Args:
             table_name (str): name of table that is supposed to be created
             create_command (SqlCommand): sql command used to create specified
+
+        Returns:
+            bool: True if table has been created
         """
 
         # check if table already exists
@@ -109,6 +252,7 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
             self._cursor.execute(create_command.command)
         else:
             logger.info(f"table {table_name} already exists.")
+        return not exists
 
     def _write_meta_data(self, meta: MetaData) -> int:
         """
@@ -124,6 +268,10 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         Returns:
             int: row id of meta data table row that holds the meta data
         """
+        try:
+            return self._meta_data_ids[meta]
+        except KeyError:
+            pass
         row = tuple(list_meta_data_attribute_values(meta))
 
         # check if row already exists
@@ -151,6 +299,7 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         if not isinstance(id_, int):
             raise TypeError("meta data id must be an integer")
 
+        self._meta_data_ids[meta] = id_
         return id_
 
     def write_primitive_data(self, data_field: DataField) -> None:
@@ -166,7 +315,7 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
             ValueError: an error occured during cast into sting of data field value
 
         """
-        if not is_supported_primitive(data_field.value):
+        if self.validate and not is_supported_primitive(data_field.value):
             raise TypeError(
                 f"unsupported primitive data type: {type(data_field.value)}"
             )
@@ -178,7 +327,7 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         value = str(data_field.value)
 
         # create sql command
-        insert_command = insert_primitive_data(self.name)
+        insert_command = insert_primitive_data(self._values_table)
 
         # insert data into table using insert sql command
         data: dict[str, str | int] = {
@@ -231,19 +380,210 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
             data_field (DataField): data field whose value is a list / tuple / set
 
         Raises:
-            TypeError: if data field value is not a list/tuple/set whose elements
-                       have all the same data type
+            TypeError: if the type of the elements is not supported
         """
-
-        if not is_simple_iterable(data_field.value):
+        # the elements have been checked when the data field was created
+        if self._pack_iterables and is_packable(
+            data_field.value,  # type: ignore[arg-type]
+            python_type_literal_map_reversed[data_field.meta.element_type],
+        ):
+            self.write_packed(
+                data_field.meta,
+                data_field.value,  # type: ignore[arg-type]
+                len(data_field.value),  # type: ignore[arg-type]
+            )
+            return
+
+        values: Collection[Any] = data_field.value  # type: ignore[assignment]
+        if len(values) == 0:
+            # elements are written as rows, so empty iterables have none
+            return
+        if self.validate and not is_supported_primitive(next(iter(values))):
+            # elements have all the same type, so checking the first is enough
             raise TypeError(
-                f"Attribute {data_field.meta.name} of {self.name} is "
-                "expected to be a simple iterable"
+                f"unsupported primitive data type: {type(next(iter(values)))}"
             )
+        self._insert_elements(self._write_meta_data(data_field.meta), values)
 
-        for item in data_field.value:  # type: ignore[union-attr]
-            data_field_ = DataField(value=item, meta=data_field.meta)
-            self.write_primitive_data(data_field_)
+    def write_stream(self, data_field: DataField) -> None:
+        """
+        write elements of a stream into sql table. Each chunk of elements is
+        inserted with a single executemany call, so that only one chunk is held
+        in memory at once. Streams are not packed, since the size of a BLOB must
+        be known before it is written
+
+        Args:
+            data_field (DataField): data field whose value is a stream
+        """
+        stream = check_stream(data_field)
+        meta_data_id = self._write_meta_data(data_field.meta)
+        for chunk in stream.iter_chunks():
+            self._insert_elements(meta_data_id, chunk)
+
+    def _insert_elements(self, meta_data_id: int, values: Iterable[Any]) -> None:
+        """
+        insert elements of a list/tuple/set as one row each with a single
+        executemany call
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+            values (Iterable[Any]): elements to be inserted
+        """
+        insert_command = insert_primitive_data(self._values_table)
+        data: dict[str, str | int] = {
+            column_name_object_id: self._object_id,
+            column_name_meta_data: meta_data_id,
+            column_name_data: "",
+        }
+        row = [data[col] for col in insert_command.columns]
+        data_index = insert_command.get_column_index(column_name_data)
+
+        def iter_rows() -> Generator[tuple[str | int, ...], None, None]:
+            for value in values:
+                # convert value to a string, since table schema assumes TEXT
+                row[data_index] = str(value)
+                yield tuple(row)
+
+        self._cursor.executemany(insert_command.command, iter_rows())
+
+    def write_packed(
+        self, meta: MetaData, values: Iterable[Any], n_elements: int
+    ) -> None:
+        """
+        write elements of an iterable as a single BLOB. The elements are packed
+        and written chunk by chunk, so that values can be a generator whose
+        elements are never held in memory at once
+
+        Args:
+            meta (MetaData): meta data of the iterable
+            values (Iterable[Any]): elements of type meta.element_type
+            n_elements (int): number of elements
+
+        Raises:
+            ValueError: if the elements cannot be packed or their number does
+                        not match n_elements
+        """
+        size = n_elements * item_size(meta.element_type)
+        meta_data_id = self._write_meta_data(meta)
+        data: dict[str, str | int] = {
+            column_name_object_id: self._object_id,
+            column_name_meta_data: meta_data_id,
+            column_name_data: size,
+        }
+        self._insert_data(data, insert_packed_data(self._values_table))
+        row_id = self._cursor.lastrowid
+        if row_id is None:
+            raise ValueError(f"no row has been inserted for {meta.name}")
+        write_blob(
+            self._cursor.connection,
+            self._values_table,
+            row_id,
+            pack_chunks(values, meta.element_type, blob_chunk_size),
+        )
+
+    def open_packed(self, name: str, role: tRole = attribute) -> PackedBlob:
+        """
+        open an iterable that has been written as a BLOB for incremental reading
+
+        Args:
+            name (str): name of attribute
+            role (tRole, optional): role of the iterable, e.g. dict_values to open
+                                    the values of a dictionary.
+                                    Defaults to attribute.
+
+        Raises:
+            ValueError: if node has no packed iterable with given name and role
+
+        Returns:
+            PackedBlob: packed iterable
+        """
+        for data, meta_data_id in self._select_attribute_rows():
+            if not isinstance(data, bytes):
+                continue
+            meta = get_meta_data(**self._read_meta_data(meta_data_id))  # type: ignore[arg-type] # noqa: E501
+            if meta.name == name and meta.role == role:
+                rows = self._select_elements(meta_data_id)
+                return self._open_blob(rows[0][0], meta.element_type)
+        raise ValueError(f"{self.name} has no packed iterable {name} ({role})")
+
+    def _open_blob(self, row_id: int, element_type_: tPythonTypeLiteral) -> PackedBlob:
+        return PackedBlob(
+            self._cursor.connection, self._values_table, row_id, element_type_
+        )
+
+    def _read_elements(
+        self, meta_data_id: int, element_type_: tPythonTypeLiteral
+    ) -> list[Any]:
+        """
+        read elements of a simple iterable or of dictionary keys / values
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+            element_type_ (tPythonTypeLiteral): literal of element type
+
+        Returns:
+            list[Any]: elements converted to their type
+        """
+        if element_type_ == python_type_literal_map[EmptyIterable]:
+            return []
+        rows = self._select_elements(meta_data_id)
+        return self._convert_elements(rows, element_type_)
+
+    def _convert_elements(
+        self, rows: list[tuple[int, str | bytes]], element_type_: tPythonTypeLiteral
+    ) -> list[Any]:
+        """
+        convert the selected rows of a simple iterable or of dictionary keys /
+        values into their elements
+
+        Args:
+            rows (list[tuple[int, str | bytes]]): row id and data of the elements
+                                                  in the order they have been
+                                                  written
+            element_type_ (tPythonTypeLiteral): literal of element type
+
+        Returns:
+            list[Any]: elements converted to their type
+        """
+        type_ = python_type_literal_map_reversed[element_type_]
+        if type_ == EmptyIterable:
+            return []
+        if len(rows) == 1 and isinstance(rows[0][1], bytes):
+            return list(self._open_blob(rows[0][0], element_type_))
+        return [type_(data) for _, data in rows]
+
+    def _iter_elements(
+        self, meta_data_id: int, element_type_: tPythonTypeLiteral, chunk_size: int
+    ) -> Generator[Any, None, None]:
+        """
+        read elements of a simple iterable chunk by chunk. The elements are
+        selected with a cursor of their own, so that the node's cursor can be
+        used while they are consumed
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+            element_type_ (tPythonTypeLiteral): literal of element type
+            chunk_size (int): number of rows fetched at once
+
+        Yields:
+            Generator[Any, None, None]: elements converted to their type
+        """
+        type_ = python_type_literal_map_reversed[element_type_]
+        command = select_simple_iterable_elements(self._values_table)
+        cursor = self._cursor.connection.cursor()
+        try:
+            cursor.execute(command.command, (meta_data_id, self._object_id))
+            id_index = command.get_column_index(column_name_id)
+            index = command.get_column_index(column_name_data)
+            rows = cursor.fetchmany(chunk_size)
+            if len(rows) == 1 and isinstance(rows[0][index], bytes):
+                yield from self._open_blob(rows[0][id_index], element_type_)
+                return
+            while len(rows):
+                yield from (type_(row[index]) for row in rows)
+                rows = cursor.fetchmany(chunk_size)
+        finally:
+            cursor.close()
 
     def __iter__(self) -> Generator[tuple[SqlLite3FileData, type], None, None]:
         """
@@ -256,83 +596,261 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
                         create a meta data object
         """
 
-        # get all rows that belong to native python attributes of the current object
-        select_attribute_cmd = select_python_attributes_from_table(self.name)
-        self._cursor.execute(select_attribute_cmd.command, (self._object_id,))
-        rows = self._cursor.fetchall()
+        yield from self.iter_attributes()
 
-        # create meta data query
-        select_meta_data_cmd = select_meta_data()
+    def read_python_attributes(
+        self, selection: FieldSelection | None = None, chunk_size: int | None = None
+    ) -> list[DataField]:
+        """
+        read data from file that represents
+        native python data type like str, int, list etc
 
-        # get column indices of relevant information
-        meta_data_column_index = select_attribute_cmd.get_column_index(
-            column_name_meta_data
-        )
-        data_index = select_attribute_cmd.get_column_index(column_name_data)
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+            chunk_size (int | None, optional): if given, lists, tuples and sets are
+                                               read as streams of this chunk size.
+                                               Defaults to None.
+
+        Returns:
+            list: list of DataField objects holds data along with meta data
+        """
+        # call super call method with cleared caches, so that attributes can
+        # be read more than once
+        self._processed_iterables_and_dictionary_names = set()
+        self._dictionary_meta_data_ids = dict()
+        return super().read_python_attributes(selection, chunk_size)
+
+    def iter_attributes(
+        self, selection: FieldSelection | None = None
+    ) -> Generator[tuple[SqlLite3FileData, type], None, None]:
+        """
+        iterates through records that represent native python attributes of
+        the object. If the selected attributes are given by name, only their
+        rows are selected. Otherwise, rows of attributes that are not selected
+        are skipped by their meta data before their elements are read
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+
+        Raises:
+            ValueError: if no meta data entry can be found for considered
+                        attribute or if arguments missing that neccessary to
+                        create a meta data object
+        """
+        names = None if selection is None else selection.names()
+        rows = self._select_attribute_rows(names)
+
+        # look up the keys and values of dictionaries, so that both are read
+        # with one query once either of them is read
+        for _, meta_data_id in rows:
+            meta_data_kwargs = self._read_meta_data(meta_data_id)
+            if meta_data_kwargs[role] in (dict_keys, dict_values):
+                self._dictionary_meta_data_ids.setdefault(meta_data_kwargs[name], {})[
+                    meta_data_kwargs[role]
+                ] = meta_data_id
 
         # iter though rows, extract information and yield sqlite3data object and type
-        for row in rows:
+        for data, meta_data_id in rows:
             # get meta data for row
-            meta_data_id = row[meta_data_column_index]
-            self._cursor.execute(select_meta_data_cmd.command, (meta_data_id,))
-            meta_data_row: tuple[str] = self._cursor.fetchone()
-            if len(meta_data_row) == 0:
-                raise ValueError(f"no meta data entry found for id: {meta_data_id}")
-
-            # extract meta data keyword arguments
-            meta_data_kwargs: dict[str, str] = {}
-            meta_data_attr_names = list_meta_data_attributes()
-            for column_name in select_meta_data_cmd.columns:
-                if column_name in meta_data_attr_names:
-                    index = select_meta_data_cmd.get_column_index(column_name)
-                    meta_data_kwargs[column_name] = meta_data_row[index]
-
-            # check if arguments are missing
-            missing_args = set(meta_data_kwargs.keys()).difference(meta_data_attr_names)
-            if len(missing_args) > 0:
-                missing_args_joined = ", ".join(missing_args)
-                raise ValueError(f"keyword arguments {missing_args_joined} are missng")
+            meta_data_kwargs = self._read_meta_data(meta_data_id)
+            if selection is not None and not selection.selects(
+                meta_data_kwargs[name]
+            ):
+                continue
 
             # create SqlLite3FileData
-            filedata = SqlLite3FileData(row[data_index], meta_data_kwargs, meta_data_id)
+            filedata = SqlLite3FileData(data, dict(meta_data_kwargs), meta_data_id)
 
             # read pytnon type
             type_ = python_type_literal_map_reversed[meta_data_kwargs[python_type]]  # type: ignore[index] # noqa: E501
 
             yield filedata, type_
 
-    def list_children(self) -> list[BaseFileNode[SqlLite3FileData]]:
+    def _select_attribute_rows(
+        self, names: tuple[str, ...] | None = None
+    ) -> list[tuple[str | bytes, int]]:
         """
-        list child nodes of current node
+        select all rows that belong to native python attributes of the object
+
+        Args:
+            names (tuple[str, ...] | None, optional): names of attributes whose
+                                                      rows are selected. None
+                                                      selects the rows of all
+                                                      attributes. Defaults to None.
 
         Returns:
-            list[Sqlite3FileNode]: list of child nodes
+            list[tuple[str | bytes, int]]: data and meta data id of the first row
+                                           of each attribute. The data of packed
+                                           iterables is an empty BLOB
+        """
+        if names is None:
+            select_attribute_cmd = select_python_attributes_from_table(
+                self._values_table
+            )
+        else:
+            select_attribute_cmd = select_python_attributes_by_name(
+                self._values_table, len(names)
+            )
+        self._cursor.execute(
+            select_attribute_cmd.command, (self._object_id, *(names or ()))
+        )
+        rows = self._cursor.fetchall()
+
+        # get column indices of relevant information
+        meta_data_column_index = select_attribute_cmd.get_column_index(
+            column_name_meta_data
+        )
+        data_index = select_attribute_cmd.get_column_index(column_name_data)
+        return [(row[data_index], row[meta_data_column_index]) for row in rows]
 
+    def _select_elements(self, meta_data_id: int) -> list[tuple[int, str | bytes]]:
         """
-        children: list[BaseFileNode[SqlLite3FileData]] = []
-        # select rows from table that represent a saveable attribute
-        command = select_saveable_attributes_from_table(self.name)
+        select elements of a simple iterable or of dictionary keys / values
+
+        Args:
+            meta_data_id (int): id of meta data row of the iterable
+
+        Returns:
+            list[tuple[int, str | bytes]]: row id and data of the elements in the
+                                           order they have been written. A packed
+                                           iterable is a single row whose data is
+                                           an empty BLOB
+        """
+        command = select_simple_iterable_elements(self._values_table)
+        self._cursor.execute(command.command, (meta_data_id, self._object_id))
+        id_index = command.get_column_index(column_name_id)
+        index = command.get_column_index(column_name_data)
+        return [(row[id_index], row[index]) for row in self._cursor.fetchall()]
+
+    def _select_dictionary_elements(
+        self, keys_meta_data_id: int, values_meta_data_id: int
+    ) -> tuple[list[tuple[int, str | bytes]], list[tuple[int, str | bytes]]]:
+        """
+        select the elements of the keys and of the values of a dictionary with
+        one query
+
+        Args:
+            keys_meta_data_id (int): id of meta data row of the keys
+            values_meta_data_id (int): id of meta data row of the values
+
+        Returns:
+            tuple[list[tuple[int, str | bytes]], list[tuple[int, str | bytes]]]:
+                row id and data of the keys and of the values in the order they
+                have been written, see _select_elements
+        """
+        command = select_dictionary_elements(self._values_table)
+        self._cursor.execute(
+            command.command,
+            (self._object_id, keys_meta_data_id, values_meta_data_id),
+        )
+        meta_data_index = command.get_column_index(column_name_meta_data)
+        id_index = command.get_column_index(column_name_id)
+        index = command.get_column_index(column_name_data)
+        keys: list[tuple[int, str | bytes]] = []
+        values: list[tuple[int, str | bytes]] = []
+        for row in self._cursor.fetchall():
+            elements = keys if row[meta_data_index] == keys_meta_data_id else values
+            elements.append((row[id_index], row[index]))
+        return keys, values
+
+    def _select_children(self) -> list[tuple[str, str]]:
+        """
+        select rows that reference child nodes
+
+        Returns:
+            list[tuple[str, str]]: name and object id of each child node
+        """
+        command = select_saveable_attributes_from_table(self._nodes_table)
         self._cursor.execute(command.command, (self._object_id,))
-        rows: list[tuple[str]] = self._cursor.fetchall()
+        rows = self._cursor.fetchall()
 
         # get neccessary indices to extract data
         reference_name_index = command.get_column_index(column_name_reference)
         reference_id_index = command.get_column_index(column_name_reference_id)
+        return [(row[reference_name_index], row[reference_id_index]) for row in rows]
 
-        # iter though rows, extract reference information and create child node
-        for row in rows:
-            reference_id = row[reference_id_index]
-            reference_name = row[reference_name_index]
-            child = Sqlite3FileNode(
-                name=reference_name,
-                parent=self,
-                cursor=self._cursor,
-                object_id=reference_id,
-            )
-            children.append(child)
+    def _read_meta_data(self, meta_data_id: int) -> dict[str, str]:
+        """
+        read meta data row with given id. Rows that have been read before are
+        taken from the cache
+
+        Args:
+            meta_data_id (int): id of meta data row
+
+        Raises:
+            ValueError: if no meta data entry can be found for given id or if
+                        arguments are missing that are neccessary to create a
+                        meta data object
+
+        Returns:
+            dict[str, str]: keyword arguments of meta data object
+        """
+        try:
+            return self._meta_data_rows[meta_data_id]
+        except KeyError:
+            pass
+
+        select_meta_data_cmd = select_meta_data()
+        self._cursor.execute(select_meta_data_cmd.command, (meta_data_id,))
+        meta_data_row: tuple[str] | None = self._cursor.fetchone()
+        if meta_data_row is None or len(meta_data_row) == 0:
+            raise ValueError(f"no meta data entry found for id: {meta_data_id}")
+
+        # extract meta data keyword arguments
+        meta_data_kwargs: dict[str, str] = {}
+        meta_data_attr_names = list_meta_data_attributes()
+        for column_name in select_meta_data_cmd.columns:
+            if column_name in meta_data_attr_names:
+                index = select_meta_data_cmd.get_column_index(column_name)
+                meta_data_kwargs[column_name] = meta_data_row[index]
+
+        # check if arguments are missing
+        missing_args = set(meta_data_attr_names).difference(meta_data_kwargs.keys())
+        if len(missing_args) > 0:
+            missing_args_joined = ", ".join(missing_args)
+            raise ValueError(f"keyword arguments {missing_args_joined} are missng")
+
+        self._meta_data_rows[meta_data_id] = meta_data_kwargs
+        return meta_data_kwargs
+
+    def list_children(self) -> list[BaseFileNode[SqlLite3FileData]]:
+        """
+        list child nodes of current node
+
+        Returns:
+            list[Sqlite3FileNode]: list of child nodes
+
+        """
+        children: list[BaseFileNode[SqlLite3FileData]] = []
+
+        # create child node for each row that references a saveable attribute
+        for reference_name, reference_id in self._select_children():
+            children.append(self._create_node(reference_name, reference_id))
 
         return children
 
+    def remove(self, name_: str) -> None:
+        """
+        delete the rows of an attribute or the reference to the child node of
+        given name. The rows of the child node itself are not deleted, but
+        cannot be reached from the root node anymore
+
+        Args:
+            name_ (str): name of attribute or child node
+        """
+        self._cursor.execute(
+            delete_python_attribute(self._values_table).command,
+            (self._object_id, name_),
+        )
+        self._cursor.execute(
+            delete_saveable_reference(self._nodes_table).command,
+            (self._object_id, name_),
+        )
+
     def read_primitive_data(self, filedata: SqlLite3FileData) -> DataField:
         """
         read file data that represents primitive python data like int, str, float etc.
@@ -344,7 +862,7 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         Returns:
             DataField: _description_
         """
-        meta_data = MetaData(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
+        meta_data = get_meta_data(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
 
         # cast string to correct type
         type_ = python_type_literal_map_reversed[meta_data.python_type]
@@ -368,41 +886,54 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
         """
 
         # create mete data
-        meta = MetaData(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
+        meta = get_meta_data(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
 
         # check if iterable has already been read
         if meta.name in self._processed_iterables_and_dictionary_names:
             return None
 
-        # select element rows in table
-        select_iterable_command = select_simple_iterable_elements(self.name)
-        self._cursor.execute(
-            select_iterable_command.command, (filedata.meta_data_id, self._object_id)
-        )
-        rows = self._cursor.fetchall()
-
-        # iter through rows and read iterable elements
-        index = select_iterable_command.get_column_index(column_name_data)
-        element_python_type_ = python_type_literal_map_reversed[meta.element_type]
+        # read iterable elements
         python_type_ = python_type_literal_map_reversed[meta.python_type]
-        value_raw: list = []  # type: ignore[type-arg]
-        if element_python_type_ != EmptyIterable:
-            for row in rows:
-                value_raw.append(element_python_type_(row[index]))
+        value_raw = self._read_elements(filedata.meta_data_id, meta.element_type)
 
         # cast raw_value into correct iterable type
         value = python_type_(value_raw)
 
         # mark iterable as read
-        self._processed_iterables_and_dictionary_names.append(meta.name)
+        self._processed_iterables_and_dictionary_names.add(meta.name)
 
         return DataField(meta, value)
 
+    def read_stream(
+        self, filedata: SqlLite3FileData, chunk_size: int
+    ) -> DataField | None:
+        """
+        read list, set or tuple as a stream. The elements are fetched chunk by
+        chunk while the stream is consumed
+
+        Args:
+            filedata (SqlLite3FileData): file data object that holds relevat information
+                                         to parse data from file into a DataField object
+            chunk_size (int): number of elements fetched at once
+
+        Returns:
+            DataField | None: meta data of iterable along with a stream of its
+                              elements, None if the iterable has already been read
+        """
+        meta = get_meta_data(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
+        if meta.name in self._processed_iterables_and_dictionary_names:
+            return None
+        self._processed_iterables_and_dictionary_names.add(meta.name)
+        elements = self._iter_elements(
+            filedata.meta_data_id, meta.element_type, chunk_size
+        )
+        return stream_data_field(meta, elements, chunk_size)
+
     def read_simple_dictionary(self, filedata: SqlLite3FileData) -> DataField | None:
         """
-        read list of keys / values of a dictonary and put them into cache. If
-        both lists are read and in the cache, a data field object with the reconstructed
-        dictionary is returned
+        read the keys and the values of a dictionary with one query, once the
+        rows of either of them are iterated. The keys and values are paired by
+        the positions of their rows
 
         Args:
             filedata (SqlLite3FileData): file data object that holds relevat information
@@ -410,66 +941,39 @@ class Sqlite3FileNode(BaseFileNode[SqlLite3FileData]):
 
         Returns:
             DataField | None: Datfield that holds the reconstructed dictionary.
-            If dictionary keys or values are missing, None is returned
+            If dictionary has already been read or if its keys or values are
+            missing, None is returned
         """
 
         # create meta data object
-        meta = MetaData(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
+        meta = get_meta_data(**filedata.meta_data_kwargs)  # type: ignore[arg-type]
 
-        # check if dictionary has already been read completely
-        if meta.name in self._dict_keys_cache and meta.name in self._dict_values_cache:
-            return None
-
-        # check if keys have alread been read
-        if meta.name in self._dict_keys_cache and meta.role == dict_keys:
+        # check if dictionary has already been read
+        if meta.name in self._processed_iterables_and_dictionary_names:
             return None
-
-        # check if values have already been read
-        if meta.name in self._dict_values_cache and meta.role == dict_values:
+        meta_data_ids = self._dictionary_meta_data_ids.get(meta.name, {})
+        if dict_keys not in meta_data_ids or dict_values not in meta_data_ids:
             return None
+        self._processed_iterables_and_dictionary_names.add(meta.name)
 
-        # get all elements from dictionary keys or values
-        select_simple_iterable_elements_command = select_simple_iterable_elements(
-            self.name
+        # read keys and values
+        keys_meta = get_meta_data(**self._read_meta_data(meta_data_ids[dict_keys]))  # type: ignore[arg-type] # noqa: E501
+        values_meta = get_meta_data(
+            **self._read_meta_data(meta_data_ids[dict_values])  # type: ignore[arg-type] # noqa: E501
         )
-        self._cursor.execute(
-            select_simple_iterable_elements_command.command,
-            (
-                filedata.meta_data_id,
-                self._object_id,
-            ),
+        key_rows, value_rows = self._select_dictionary_elements(
+            meta_data_ids[dict_keys], meta_data_ids[dict_values]
         )
-        rows = self._cursor.fetchall()
-        index = select_simple_iterable_elements_command.get_column_index(
-            column_name_data
+        keys = self._convert_elements(key_rows, keys_meta.element_type)
+        values = self._convert_elements(value_rows, values_meta.element_type)
+
+        meta_dict = get_meta_data(
+            python_type=python_type_literal_map[dict],
+            role=attribute,
+            name=meta.name,
+            element_type=python_type_literal_map[type(None)],  # type: ignore[arg-type] # noqa: E501
         )
-        element_type_ = python_type_literal_map_reversed[meta.element_type]
-        if element_type_ == EmptyIterable:
-            elements = []
-        else:
-            elements = [element_type_(row[index]) for row in rows]
-
-        # put elements into cache
-        if meta.role == dict_keys:
-            self._dict_keys_cache[meta.name] = elements
-
-        if meta.role == dict_values:
-            self._dict_values_cache[meta.name] = elements
-
-        # create data field if keys and values have been read
-        if meta.name in self._dict_keys_cache and meta.name in self._dict_values_cache:
-            keys = self._dict_keys_cache[meta.name]
-            values = self._dict_values_cache[meta.name]
-            value_dict = {k: v for k, v in zip(keys, values)}
-            meta_dict = MetaData(
-                python_type=python_type_literal_map[dict],
-                role=attribute,
-                name=meta.name,
-                element_type=python_type_literal_map[type(None)],  # type: ignore[arg-type] # noqa: E501
-            )
-            return DataField(value=value_dict, meta=meta_dict)
-        else:
-            return None
+        return DataField(value=dict(zip(keys, values)), meta=meta_dict)
 
     def write_none(self, data_field: DataField) -> None:
         """
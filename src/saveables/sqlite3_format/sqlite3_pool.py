@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from saveables.sqlite3_format.sqlite3_profile import Sqlite3Profile
+
+# key of a pool entry: resolved path of the file and profile of its connections
+tPoolKey = tuple[Path, "Sqlite3Profile"]
+
+# number of prepared statements each pooled connection keeps in its cache
+n_cached_statements = 256
+
+
+def read_only_uri(path: Path) -> str:
+    """
+    uri that opens a sqlite3 file read only. The file is opened as immutable,
+    so sqlite skips locking and change detection
+
+    Args:
+        path (Path): path of sqlite3 file
+
+    Returns:
+        str: uri of file
+    """
+    return f"{path.resolve().as_uri()}?mode=ro&immutable=1"
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    """
+    signature that changes when a file is rewritten
+
+    Args:
+        path (Path): path of file
+
+    Returns:
+        tuple[int, int, int]: inode, size and modification time of file
+    """
+    stat = path.stat()
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+@dataclass
+class _PoolEntry:
+    """
+    connections to one file that are not in use and the result of the file's
+    validation
+    """
+
+    signature: tuple[int, int, int]
+    root_object_id: str
+    idle: list[sqlite3.Connection] = field(default_factory=list)
+
+
+@dataclass
+class PooledConnection:
+    """
+    connection handed out by a Sqlite3ConnectionPool
+    """
+
+    connection: sqlite3.Connection
+    root_object_id: str  # object id of the file's root node
+    key: tPoolKey
+    entry: _PoolEntry  # entry the connection is returned to
+
+
+class Sqlite3ConnectionPool:
+    """
+    thread safe pool of read only connections keyed by file path and profile.
+    A file is validated once when the first connection to it is opened.
+    Connections that are returned to the pool keep their prepared statements,
+    so that repeated loads of a file skip connecting and validating. Files are
+    opened as immutable, if a file is rewritten its pooled connections are
+    discarded on the next acquire. A file must not be modified while it is
+    loaded
+    """
+
+    def __init__(self, max_idle: int = 8):
+        """
+        Args:
+            max_idle (int, optional): maximum number of unused connections kept
+                                      per file. Defaults to 8.
+        """
+        self.max_idle = max_idle
+        self._entries: dict[tPoolKey, _PoolEntry] = dict()
+        self._lock = Lock()
+
+    def acquire(
+        self,
+        path: Path,
+        profile: Sqlite3Profile,
+        validate: Callable[[sqlite3.Cursor], str],
+    ) -> PooledConnection:
+        """
+        return an unused connection to given file or open a new one
+
+        Args:
+            path (Path): path of sqlite3 file
+            profile (Sqlite3Profile): profile applied to new connections
+            validate (Callable[[sqlite3.Cursor], str]): checks the file and returns
+                                                        the object id of its root
+                                                        node. Only called for files
+                                                        that are not pooled yet
+
+        Returns:
+            PooledConnection: connection and object id of root node
+        """
+        resolved = path.resolve()
+        key: tPoolKey = (resolved, profile)
+        signature = _file_signature(resolved)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature != signature:
+                # file has been rewritten since it has been validated
+                self._close_idle(self._entries.pop(key))
+                entry = None
+            if entry is not None and entry.idle:
+                return PooledConnection(
+                    entry.idle.pop(), entry.root_object_id, key, entry
+                )
+
+        # connect outside of the lock, so that other threads are not blocked
+        conn = sqlite3.connect(
+            read_only_uri(resolved),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=n_cached_statements,
+        )
+        try:
+            profile.apply(conn, read_only=True)
+            if entry is None:
+                root_object_id = validate(conn.cursor())
+                with self._lock:
+                    entry = self._entries.setdefault(
+                        key, _PoolEntry(signature, root_object_id)
+                    )
+            else:
+                root_object_id = entry.root_object_id
+        except BaseException:
+            conn.close()
+            raise
+        return PooledConnection(conn, root_object_id, key, entry)
+
+    def release(self, pooled: PooledConnection) -> None:
+        """
+        return connection to the pool. The connection is closed if its file has
+        been rewritten or the pool already holds max_idle connections to it
+
+        Args:
+            pooled (PooledConnection): connection returned by acquire
+        """
+        with self._lock:
+            entry = self._entries.get(pooled.key)
+            if (
+                entry is not None
+                and entry is pooled.entry
+                and len(entry.idle) < self.max_idle
+            ):
+                entry.idle.append(pooled.connection)
+                return
+        pooled.connection.close()
+
+    def clear(self) -> None:
+        """
+        close all unused connections and forget validated files
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            self._close_idle(entry)
+
+    def _close_idle(self, entry: _PoolEntry) -> None:
+        for conn in entry.idle:
+            conn.close()
+        entry.idle.clear()
+
+
+# pool shared by Sqlite3File objects that are created with pool=connection_pool
+connection_pool = Sqlite3ConnectionPool()
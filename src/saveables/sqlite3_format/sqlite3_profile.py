@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Literal
+
+from saveables.sqlite3_format.sqlite3_commands import SqlCommand, set_pragma
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+tJournalMode = Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+tSynchronous = Literal["OFF", "NORMAL", "FULL", "EXTRA"]
+tTempStore = Literal["DEFAULT", "FILE", "MEMORY"]
+
+# allowed values of the pragmas that take keywords
+_keyword_values: dict[str, tuple[str, ...]] = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+}
+
+# pragmas that only affect the connection and not the database file. Only these
+# are applied to connections that read a file
+_read_pragmas = ("cache_size", "temp_store", "mmap_size")
+
+
+@dataclass(frozen=True)
+class Sqlite3Profile:
+    """
+    performance profile of a sqlite3 connection. Each field corresponds to the
+    sqlite pragma with the same name. Fields that are None keep sqlite's default.
+    The fields are applied in the order of their definition, page_size must
+    come first since it has to be set before any table is created
+    """
+
+    page_size: int | None = None  # bytes per database page, power of two
+    journal_mode: tJournalMode | None = None
+    synchronous: tSynchronous | None = None
+    cache_size: int | None = None  # pages if positive, kibibytes if negative
+    temp_store: tTempStore | None = None
+    mmap_size: int | None = None  # bytes of the file that are memory mapped
+
+    def __post_init__(self) -> None:
+        # pragmas cannot be parameterized, so values are checked before they
+        # are put into a sql command
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is None:
+                continue
+            if field.name in _keyword_values:
+                if value not in _keyword_values[field.name]:
+                    raise ValueError(f"invalid value {value} for {field.name}")
+            elif not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"{field.name} must be an integer but is {value}")
+
+    def pragmas(self, read_only: bool = False) -> list[SqlCommand]:
+        """
+        sql commands that apply the profile
+
+        Args:
+            read_only (bool, optional): if True, only pragmas that do not change
+                                        the database file are returned.
+                                        Defaults to False.
+
+        Returns:
+            list[SqlCommand]: pragma commands in the order they must be executed
+        """
+        commands: list[SqlCommand] = []
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is None or (read_only and field.name not in _read_pragmas):
+                continue
+            commands.append(set_pragma(field.name, value))
+        return commands
+
+    def apply(self, connection: Connection, read_only: bool = False) -> None:
+        """
+        apply profile to given connection
+
+        Args:
+            connection (Connection): sqlite3 connection
+            read_only (bool, optional): if True, only pragmas that do not change
+                                        the database file are applied.
+                                        Defaults to False.
+        """
+        for command in self.pragmas(read_only):
+            connection.execute(command.command)
+
+
+# sqlite's defaults
+default_profile = Sqlite3Profile()
+
+# profile for bulk saves of data that can be regenerated. The rollback journal
+# is kept in memory and nothing is synced to disk, so a crash or power loss
+# during a save can corrupt the file. A save that fails with an exception is
+# still rolled back
+fast_bulk_profile = Sqlite3Profile(
+    page_size=65536,
+    journal_mode="MEMORY",
+    synchronous="OFF",
+    cache_size=-262144,  # 256 MiB
+    temp_store="MEMORY",
+    mmap_size=268435456,  # 256 MiB
+)
@@ -8,7 +8,8 @@ class SqlLite3FileData:
     not represent a saveable object
     """
 
-    data: str  # data of attribute converted as a string
+    data: str | bytes  # data of attribute converted as a string, an empty
+    # BLOB for packed iterables
     meta_data_kwargs: dict[str, str]  # keyword arguments to initialize
     # a MetaData objecst
     meta_data_id: int  # row id in meta data table
@@ -1,13 +1,81 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
 import xml.etree.ElementTree as ET
+from io import BufferedIOBase
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Literal, Optional
 from xml.dom import minidom
 
 from saveables.base.base_file import BaseFile
-from saveables.contracts.constants import read_mode, root, write_mode
+from saveables.contracts.constants import (read_mode, root, update_mode,
+                                           write_mode)
 from saveables.xml_format.xml_filenode import XmlFileNode
 
+if TYPE_CHECKING:
+    from saveables.contracts.data_type import tFileMode
+
+tStreamMode = Literal["rb", "wb"]
+tCodec = Callable[[Path, tStreamMode, Optional[int]], BufferedIOBase]
+
+
+def _open_gzip(path: Path, mode: tStreamMode, level: int | None) -> BufferedIOBase:
+    level_ = 9 if level is None else level  # default level of gzip.open
+    return gzip.GzipFile(path, mode, compresslevel=level_)
+
+
+def _open_bz2(path: Path, mode: tStreamMode, level: int | None) -> BufferedIOBase:
+    level_ = 9 if level is None else level  # default level of bz2.open
+    return bz2.BZ2File(path, mode, compresslevel=level_)
+
+
+def _open_lzma(path: Path, mode: tStreamMode, level: int | None) -> BufferedIOBase:
+    return lzma.LZMAFile(path, mode, preset=level)
+
+
+# file name suffixes of compressed xml files and functions that open
+# a (de)compressing stream for them
+compression_codecs: dict[str, tCodec] = {
+    ".xml.gz": _open_gzip,
+    ".xml.bz2": _open_bz2,
+    ".xml.xz": _open_lzma,
+}
+
 
 class XmlFile(BaseFile):
-    """XML specific implementations to save and load Saveable objects"""
+    """
+    XML specific implementations to save and load Saveable objects. Files whose
+    names end with .xml.gz, .xml.bz2 or .xml.xz are compressed and decompressed
+    transparently while they are written and read
+    """
+
+    supports_bytes = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: tFileMode,
+        compression_level: int | None = None,
+        deduplicate: bool = False,
+    ):
+        """
+        Args:
+            path (str | Path): path of xml file
+            mode (tFileMode): file mode
+            compression_level (int | None, optional): compression level used to
+                                                      write compressed files. If
+                                                      None, the codec's default is
+                                                      used. Defaults to None.
+            deduplicate (bool, optional): if True, saveables that equal data that
+                                          have already been written are saved as
+                                          elements that reference the element of
+                                          the data by its id. Defaults to False.
+        """
+        super().__init__(path, mode)
+        self.compression_level = compression_level
+        self.deduplicate = deduplicate
 
     def open(self) -> None:
         """
@@ -19,18 +87,51 @@ class XmlFile(BaseFile):
         if self.mode == write_mode:
             # initialize root xml element
             self._root_element = ET.Element(root)
-        elif self.mode == read_mode:
-            # parse xml file and get root
-            tree = ET.parse(self.path)
+        elif self.mode in (read_mode, update_mode) and self._image is not None:
+            self._root_element = ET.fromstring(self._image)
+        elif self.mode in (read_mode, update_mode):
+            # parse xml file and get root. Compressed files are decompressed
+            # while they are parsed
+            with self._open_stream("rb") as f:
+                tree = ET.parse(f)
             self._root_element = tree.getroot()
         else:
             raise ValueError(f"unknown file mode {self.mode}")
         self.root = XmlFileNode(root, None, self._root_element)
 
     def close(self) -> None:
-        if self.mode == write_mode:
+        if self.mode == update_mode:
+            # remove indentation of parsed file, which is added again when the
+            # file is written
+            for element in self._root_element.iter():
+                if len(element):
+                    element.text = None
+                element.tail = None
+        if self.mode in (write_mode, update_mode):
             # recursively dump data into file
             rough_string = ET.tostring(self._root_element, "utf-8")
             reparsed = minidom.parseString(rough_string)
-            with open(self.path, "w", encoding="utf-8") as f:
-                f.write(reparsed.toprettyxml(indent="  "))
+            data = reparsed.toprettyxml(indent="  ", encoding="utf-8")
+            if self._image is not None:
+                self._image = data
+                return
+            with self._open_stream("wb") as f:
+                f.write(data)
+
+    def _open_stream(self, mode: tStreamMode) -> BufferedIOBase:
+        """
+        open binary stream to the file. If the file name has the suffix of a
+        compression codec, the stream (de)compresses the data
+
+        Args:
+            mode (tStreamMode): "rb" or "wb"
+
+        Returns:
+            BufferedIOBase: binary stream
+        """
+        codec = compression_codecs.get("".join(self.path.suffixes[-2:]).lower())
+        if codec is not None:
+            return codec(self.path, mode, self.compression_level)
+        if mode == "rb":
+            return open(self.path, "rb")
+        return open(self.path, "wb")
@@ -2,19 +2,22 @@ from __future__ import annotations
 
 import xml.etree.ElementTree as ET
 from dataclasses import asdict
-from typing import TYPE_CHECKING, Generator, Optional
+from typing import TYPE_CHECKING, Generator, Hashable, Optional
 
-from saveables.base.base_file_node import BaseFileNode
+from saveables.base.base_file_node import (BaseFileNode, check_stream,
+                                           empty_stream_meta)
 from saveables.contracts.constants import (dict_keys, dict_values,
                                            element_type, empty_type, name,
                                            none_literal, none_type,
-                                           python_type, role, saveable)
+                                           python_type, role, saveable, xml_id,
+                                           xml_ref)
 from saveables.contracts.data_type import python_type_literal_map_reversed
 from saveables.saveable.data_field import DataField
-from saveables.saveable.meta_data import MetaData
+from saveables.saveable.meta_data import MetaData, get_meta_data
 from saveables.saveable.utils import is_supported_primitive
 
 if TYPE_CHECKING:
+    from saveables.base.field_selection import FieldSelection
     from saveables.contracts.data_type import tPrimitiveDataType
 
 
@@ -30,11 +33,64 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         self._element = element
         self._processed_iterables_and_dictionary_names: list[str] = []
 
+        # referenced elements by id. The dictionary is shared by all nodes of a
+        # file
+        self._ids: dict[str, ET.Element] = (
+            parent._ids
+            if isinstance(parent, XmlFileNode)
+            else {el.attrib[xml_id]: el for el in element.iter() if xml_id in el.attrib}
+        )
+
     def __iter__(self) -> Generator[tuple[ET.Element, type], None, None]:
 
         for elem in self._element:
             yield elem, python_type_literal_map_reversed[elem.attrib[python_type]]  # type: ignore[index] # noqa: E501
 
+    def read_python_attributes(
+        self, selection: FieldSelection | None = None, chunk_size: int | None = None
+    ) -> list[DataField]:
+        """
+        read data from file that represents
+        native python data type like str, int, list etc
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+            chunk_size (int | None, optional): if given, lists, tuples and sets are
+                                               read as streams of this chunk size.
+                                               Defaults to None.
+
+        Returns:
+            list: list of DataField objects holds data along with meta data
+        """
+        # call super call method with cleared caches, so that attributes can
+        # be read more than once
+        self._processed_iterables_and_dictionary_names = []
+        return super().read_python_attributes(selection, chunk_size)
+
+    def iter_attributes(
+        self, selection: FieldSelection | None = None
+    ) -> Generator[tuple[ET.Element, type], None, None]:
+        """
+        iterate over the elements of the node. Elements that are not selected
+        are skipped by their name attribute, so that their text is never parsed
+
+        Args:
+            selection (FieldSelection | None, optional): attributes to be read.
+                                                         None reads all attributes.
+                                                         Defaults to None.
+
+        Yields:
+            Generator[tuple[ET.Element, type], None, None]: element and python type
+        """
+        if selection is None:
+            yield from self
+            return
+        for elem in self._element:
+            if selection.selects(elem.attrib[name]):
+                yield elem, python_type_literal_map_reversed[elem.attrib[python_type]]  # type: ignore[index] # noqa: E501
+
     def list_children(self) -> list[BaseFileNode[ET.Element]]:
         """
         list child nodes of current node
@@ -49,9 +105,49 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         # and create file nodes from these elements
         for elem in [el for el in self._element if el.attrib[python_type] == saveable]:
             name_ = elem.attrib[name]
+            # references are resolved to the element that holds the data
+            if xml_ref in elem.attrib:
+                elem = self._ids[elem.attrib[xml_ref]]
             children.append(XmlFileNode(name_, self, elem))
         return children
 
+    def link_saveable(self, meta: MetaData, original: BaseFileNode) -> bool:  # type: ignore[type-arg] # noqa: E501
+        """
+        write an empty element that references the element of a node that holds
+        the same data. The referenced element is given an id attribute
+
+        Args:
+            meta (MetaData): meta data of saveable
+            original (BaseFileNode): node that holds the data
+
+        Returns:
+            bool: True if a reference has been written
+        """
+        if not isinstance(original, XmlFileNode):
+            return False
+        id_ = original._element.get(xml_id)
+        if id_ is None:
+            n_ids = len(self._ids)
+            while str(n_ids) in self._ids:
+                n_ids += 1
+            id_ = str(n_ids)
+            original._element.set(xml_id, id_)
+            self._ids[id_] = original._element
+        attrib = {key: str(val) for key, val in asdict(meta).items()}
+        attrib[xml_ref] = id_
+        ET.SubElement(self._element, meta.name, attrib=attrib)
+        return True
+
+    def content_key(self) -> Hashable:
+        """
+        key that identifies the element of the node. References to the same
+        element have equal keys
+
+        Returns:
+            Hashable: element of node
+        """
+        return self._element
+
     def create_child_node(self, meta: MetaData) -> XmlFileNode:
         """
         create child node from given meta data
@@ -82,7 +178,7 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         """
 
         # check data type
-        if not is_supported_primitive(data_field.value):
+        if self.validate and not is_supported_primitive(data_field.value):
             raise TypeError(
                 f"field {data_field.meta.name} contains"
                 f"an supported data type: {type(data_field.value)}"
@@ -112,6 +208,38 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         for value in data_field.value:  # type: ignore[union-attr]
             self._write_primitive_data(value, data_field.meta)
 
+    def write_stream(self, data_field: DataField) -> None:
+        """
+        write elements of a stream into node. Each element is written into a
+        separate xml tag of the document. The document is held in memory until
+        the file is closed, so the memory of xml streams is not bounded by
+        their chunk size
+
+        Args:
+            data_field (DataField): object that holds a stream and its meta data
+        """
+        meta = data_field.meta
+        attrib = {key: str(val) for key, val in asdict(meta).items()}
+        n_elements = 0
+        for chunk in check_stream(data_field).iter_chunks():
+            for value in chunk:
+                ET.SubElement(self._element, meta.name, attrib=attrib).text = str(value)
+            n_elements += len(chunk)
+        if n_elements == 0:
+            self._write_primitive_data(data="", meta=empty_stream_meta(meta))
+
+    def remove(self, name_: str) -> None:
+        """
+        remove the xml tags of an attribute or the child node of given name
+
+        Args:
+            name_ (str): name of attribute or child node
+        """
+        for elem in [el for el in self._element if el.attrib[name] == name_]:
+            self._element.remove(elem)
+        if name_ in self._processed_iterables_and_dictionary_names:
+            self._processed_iterables_and_dictionary_names.remove(name_)
+
     def write_none(self, data_field: DataField) -> None:
         """
         special method to write None into file node
@@ -121,7 +249,7 @@ class XmlFileNode(BaseFileNode[ET.Element]):
                                     meta data
         """
 
-        none_meta = MetaData(
+        none_meta = get_meta_data(
             python_type=none_type,
             name=data_field.meta.name,
             role=data_field.meta.role,
@@ -146,7 +274,7 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         name_ = element.attrib[name]
         python_type_ = element.attrib[python_type]
         element_type_ = element.attrib[element_type]
-        meta = MetaData(
+        meta = get_meta_data(
             python_type=python_type_,  # type: ignore[arg-type]
             name=name_,
             element_type=element_type_,  # type: ignore[arg-type]
@@ -177,7 +305,7 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         python_type_ = element.attrib[python_type]
         role_ = element.attrib[role]
         element_type_ = element.attrib[element_type]
-        meta = MetaData(
+        meta = get_meta_data(
             python_type=python_type_,  # type: ignore[arg-type]
             name=name_,
             role=role_,  # type: ignore[arg-type]
@@ -230,7 +358,7 @@ class XmlFileNode(BaseFileNode[ET.Element]):
         python_type_ = element.attrib[python_type]
         role_ = element.attrib[role]
         element_type_ = none_type
-        meta = MetaData(
+        meta = get_meta_data(
             python_type=python_type_,  # type: ignore[arg-type]
             name=name_,
             role=role_,  # type: ignore[arg-type]
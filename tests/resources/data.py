@@ -1,12 +1,14 @@
 from dataclasses import dataclass, field, make_dataclass
 from typing import Any, Optional
 
+from saveables.base.content_index import dedup_min_length
 from saveables.contracts.constants import attribute, saveable
 from saveables.contracts.data_type import (python_type_literal_map,
                                            python_type_literal_map_reversed)
 from saveables.saveable.data_field import DataField
 from saveables.saveable.meta_data import MetaData
 from saveables.saveable.saveable import Saveable
+from saveables.saveable.stream import Stream
 
 
 # create test data for lists
@@ -53,6 +55,42 @@ class HoldsDicts(Saveable):  # type: ignore[misc]
 dicts = HoldsDicts({"foo": "bar", "fizz": "buzz"}, {"one": 1, "two": 2})
 
 
+# create test data for streams, which are loaded as lists
+@dataclass
+class HoldsStreams(Saveable):  # type: ignore[misc]
+    stream_int: Any = field(default_factory=list)
+    stream_float: Any = field(default_factory=list)
+    stream_str: Any = field(default_factory=list)
+    stream_empty: Any = field(default_factory=list)
+
+
+def make_streams(n_elements: int, chunk_size: int) -> HoldsStreams:
+    """
+    create streams of generated elements that span several chunks
+
+    Args:
+        n_elements (int): number of elements of each non empty stream
+        chunk_size (int): number of elements consumed at once
+
+    Returns:
+        HoldsStreams: object that holds the streams
+    """
+    return HoldsStreams(
+        stream_int=Stream((i for i in range(n_elements)), int, chunk_size),
+        stream_float=Stream((i / 4 for i in range(n_elements)), float, chunk_size),
+        stream_str=Stream((str(i) for i in range(n_elements)), str, chunk_size),
+        stream_empty=Stream(iter([]), int, chunk_size),
+    )
+
+
+n_streamed = 250
+streamed = HoldsStreams(
+    stream_int=list(range(n_streamed)),
+    stream_float=[i / 4 for i in range(n_streamed)],
+    stream_str=[str(i) for i in range(n_streamed)],
+)
+
+
 # create test data for primitive data
 @dataclass
 class HoldsPrimitives(Saveable):  # type: ignore[misc]
@@ -94,6 +132,102 @@ nested2 = NestedLevel2(lst_=["2", "2"])
 nested1 = NestedLevel1(lst_=["1", "1"], nested=nested2)
 nested0 = HoldsNestedData(lst_=["0", "0"], nested=nested1)
 
+# attribute paths of nested test data and their values
+attribute_paths: list[tuple[str, Any]] = [
+    ("str_", "0"),
+    ("lst_", ["0", "0"]),
+    ("nested.str_", "1"),
+    ("nested.nested.lst_", ["2", "2"]),
+]
+
+# attribute paths and values that are set in nested test data, and the data that
+# are loaded afterwards
+updates: list[tuple[str, Any]] = [
+    ("str_", "updated"),
+    ("lst_", ["a", "b", "c"]),
+    ("nested.int_", 5),
+    ("nested.lst_", {"one": 1}),
+    ("nested.nested", NestedLevel2(str_="x")),
+]
+updated0 = HoldsNestedData(
+    str_="updated",
+    lst_=["a", "b", "c"],
+    nested=NestedLevel1(int_=5, lst_={"one": 1}, nested=NestedLevel2(str_="x")),  # type: ignore[arg-type] # noqa: E501
+)
+
+# saved data, selected and excluded attribute paths and the data that are loaded
+selections: list[tuple[Saveable, Optional[list[str]], Optional[list[str]], Any]] = [
+    (nested0, ["lst_"], None, HoldsNestedData(lst_=["0", "0"])),
+    (nested0, ["l*"], None, HoldsNestedData(lst_=["0", "0"])),
+    (nested0, ["nested"], None, HoldsNestedData(nested=nested1)),
+    (
+        nested0,
+        ["nested.nested.lst_"],
+        None,
+        HoldsNestedData(nested=NestedLevel1(nested=nested2)),
+    ),
+    (
+        nested0,
+        None,
+        ["nested.lst_"],
+        HoldsNestedData(
+            lst_=["0", "0"], nested=NestedLevel1(nested=NestedLevel2(lst_=["2", "2"]))
+        ),
+    ),
+    (
+        nested0,
+        ["*"],
+        ["lst_", "nested.nested"],
+        HoldsNestedData(nested=NestedLevel1(lst_=["1", "1"])),
+    ),
+    (dicts, ["dct_str_int"], None, HoldsDicts(dct_str_int={"one": 1, "two": 2})),
+    (dicts, None, ["dct_str_*"], HoldsDicts()),
+]
+
+
+# create test data with duplicates
+@dataclass
+class Run(Saveable):  # type: ignore[misc]
+    str_: str = "run"
+    calibration: NestedLevel2 = field(default_factory=NestedLevel2)
+
+
+@dataclass
+class HoldsDuplicates(Saveable):  # type: ignore[misc]
+    first: Run = field(default_factory=Run)
+    second: Run = field(default_factory=Run)
+    third: Run = field(default_factory=Run)
+
+
+# the runs share their calibration and the third run equals the first one
+calibration_table = [str(i) for i in range(dedup_min_length)]
+duplicates = HoldsDuplicates(
+    first=Run("1", NestedLevel2(lst_=calibration_table)),
+    second=Run("2", NestedLevel2(lst_=list(calibration_table))),
+    third=Run("1", NestedLevel2(lst_=list(calibration_table))),
+)
+
+
+# create test data with a shared object and a cycle
+@dataclass
+class Sample(Saveable):  # type: ignore[misc]
+    str_: str = "sample"
+    experiment: Saveable = field(default_factory=Saveable)
+
+
+@dataclass
+class Experiment(Saveable):  # type: ignore[misc]
+    str_: str = "experiment"
+    calibration: NestedLevel2 = field(default_factory=NestedLevel2)
+    reference: NestedLevel2 = field(default_factory=NestedLevel2)
+    sample: Sample = field(default_factory=Sample)
+
+
+# the calibration is referenced twice and the sample references its experiment
+calibration = NestedLevel2(lst_=["a", "b"])
+experiment = Experiment(calibration=calibration, reference=calibration)
+experiment.sample.experiment = experiment
+
 
 # create test data fields
 @dataclass
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Generator
+from dataclasses import dataclass, replace
+from typing import Any, Generator, Hashable
 
 import pytest
 from resources.data import (create_saveable_from_datafields, data_field_int,
@@ -171,3 +171,42 @@ def test_load(data_fields: list[DataField], calls: dict[str, int]) -> None:
 
     # check that expected methods have been called
     assert node._calls == calls
+
+
+def test_load_failed_child_releases_ancestors() -> None:
+    """
+    integration test that a node is removed from the ancestors that the caller
+    passes if loading one of its child nodes fails
+    """
+
+    class FailingNode(MockedBaseNode):  # type: ignore[misc]
+
+        def content_key(self) -> Hashable:
+            return self.name
+
+        def load(self, *args: Any, **kwargs: Any) -> None:
+            if self.parent is None:
+                return super().load(*args, **kwargs)
+            raise RuntimeError("child cannot be loaded")
+
+        def load_as_dict(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            if self.parent is None:
+                return super().load_as_dict(*args, **kwargs)
+            raise RuntimeError("child cannot be loaded")
+
+    @dataclass
+    class Parent(Saveable):  # type: ignore[misc]
+        child: Any = None
+
+    node = FailingNode(name="root", parent=None)
+    child = FailingNode(name="child", parent=node)
+    node._children.append(child)
+    obj = Parent(child=Parent())
+
+    ancestors: dict[Hashable, Any] = {}
+    with pytest.raises(RuntimeError):
+        node.load(obj, None, None, ancestors)
+    assert ancestors == {}
+    with pytest.raises(RuntimeError):
+        node.load_as_dict(None, ancestors)
+    assert ancestors == {}
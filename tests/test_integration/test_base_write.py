@@ -1,13 +1,23 @@
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
 import pytest
-from resources.data import (data_field_dict, data_field_int, data_field_list,
-                            data_field_saveable, data_field_set,
-                            data_field_tuple)
+from resources.data import (HoldsLists, data_field_dict, data_field_int,
+                            data_field_list, data_field_saveable,
+                            data_field_set, data_field_tuple)
 from resources.mocks import MockedBaseNode
 
-from saveables.contracts.constants import dict_keys, dict_values
+import saveables.base.base_file_node
+import saveables.saveable.saveable
+import saveables.saveable.utils
+from saveables.backends import get_backend
+from saveables.contracts.constants import (attribute, dict_keys, dict_values,
+                                           empty_type, write_mode)
 from saveables.contracts.data_type import python_type_literal_map
 from saveables.saveable.data_field import DataField
 from saveables.saveable.meta_data import MetaData
+from saveables.saveable.stream import Stream
 
 
 def test_write_simple_dictionary() -> None:
@@ -102,3 +112,112 @@ def test_write_data_saveable() -> None:
     # check that within each subnode the correct write methods have been called
     assert child._calls == {"write_primitive_data": 1, "write_simple_iterable": 1}
     assert grandchild._calls == {"write_primitive_data": 4, "write_none": 1}
+
+
+@pytest.mark.parametrize(
+    "values, element_type_literal",
+    [([1, 2, 3], python_type_literal_map[int]), ([], empty_type)],
+)
+def test_write_stream(values: list[int], element_type_literal: str) -> None:
+    """
+    integration test for writing streams with the default implementation, which
+    writes the elements as a list
+
+    Args:
+        values (list[int]): elements of the stream
+        element_type_literal (str): expected element type of written list
+    """
+    meta = MetaData(
+        python_type=python_type_literal_map[list],
+        name="my_stream",
+        role=attribute,
+        element_type=python_type_literal_map[int],
+    )
+    written: list[DataField] = []
+
+    class TestStreamNode(MockedBaseNode):  # type: ignore[misc]
+
+        def write_simple_iterable(self, data_field: DataField) -> None:
+            super().write_simple_iterable(data_field)
+            written.append(data_field)
+
+    node = TestStreamNode(name="test", parent=None)
+    node.write_data(DataField(meta=meta, value=Stream(iter(values), int, 2)))
+    assert node._calls == {"write_simple_iterable": 1}
+    assert written[0].value == values
+    assert written[0].meta.element_type == element_type_literal
+
+
+def test_write_data_dispatch() -> None:
+    """
+    integration test that values are written by the methods that file nodes
+    override, and that values whose meta data do not match them are checked
+    """
+    written: list[str] = []
+
+    class TestDispatchNode(MockedBaseNode):  # type: ignore[misc]
+
+        def write_iterable(self, data_field: DataField) -> None:
+            written.append(data_field.meta.name)
+
+    node = TestDispatchNode(name="test", parent=None)
+    node.write_data(data_field_list)
+    assert written == [data_field_list.meta.name]
+    assert node._calls == {}
+
+    # value of another type than declared by meta data
+    node.write_data(DataField(meta=data_field_list.meta, value=0))
+    assert node._calls == {"write_primitive_data": 1}
+    with pytest.raises(ValueError):
+        node.write_data(DataField(meta=data_field_list.meta, value=object()))
+
+
+@pytest.mark.parametrize("value", [{1: "a", "b": "c"}, {1: [1]}, [1, 2]])
+def test_write_simple_dictionary_invalid(value: Any) -> None:
+    """
+    integration test that dictionaries are checked before any of their keys or
+    values is written
+
+    Args:
+        value (Any): value that is not a dictionary with uniformly typed keys and
+                     values of supported types
+    """
+    node = MockedBaseNode(name="test", parent=None)
+    with pytest.raises(TypeError):
+        node.write_simple_dictionary(DataField(meta=data_field_dict.meta, value=value))
+    assert node._calls == {}
+
+
+@pytest.mark.parametrize("format", ["xml", "hdf5", "sqlite3", "binary"])
+def test_write_checks_elements_once(
+    local_tmp: Path, monkeypatch: pytest.MonkeyPatch, format: str
+) -> None:
+    """
+    integration test that the elements of each saved list are checked once,
+    whichever format they are saved in
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        monkeypatch (pytest.MonkeyPatch): fixture to count the checks
+        format (str): name of format
+    """
+    checks: Counter[int] = Counter()
+    is_typed_uniformly = saveables.saveable.utils.is_typed_uniformly
+
+    def counted(data: Any) -> bool:
+        checks[id(data)] += 1
+        return is_typed_uniformly(data)
+
+    for module in (
+        saveables.saveable.utils,
+        saveables.saveable.saveable,
+        saveables.base.base_file_node,
+    ):
+        monkeypatch.setattr(module, "is_typed_uniformly", counted)
+
+    obj = HoldsLists(["1", "2"], [1, 2])
+    path = local_tmp / f"lists{get_backend(format).extensions[0]}"
+    with get_backend(format).load()(path, write_mode) as f:
+        f.save(obj)
+    assert checks[id(obj.lst_str)] == 1
+    assert checks[id(obj.lst_int)] == 1
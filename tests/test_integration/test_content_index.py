@@ -0,0 +1,52 @@
+from dataclasses import replace
+
+from resources.data import Run, duplicates, experiment, make_streams, nested0
+
+from saveables.base.content_index import ContentIndex
+from saveables.saveable.saveable import create_data_field
+
+
+def test_digest() -> None:
+    index = ContentIndex()
+    first = index.digest(duplicates.first)
+    assert first is not None and len(first) == 16
+
+    # equal data have equal digests, no matter whether they are the same object
+    assert index.digest(duplicates.third) == first
+    assert index.digest(duplicates.second) != first
+    assert index.digest(duplicates.second.calibration) == index.digest(
+        duplicates.first.calibration
+    )
+    assert ContentIndex().digest(replace(duplicates.first)) == first
+    assert index.digest(Run("1")) != first
+
+    # streams can only be consumed once and are not deduplicated
+    assert index.digest(make_streams(10, chunk_size=4)) is None
+
+
+def test_digest_iterable() -> None:
+    index = ContentIndex()
+    field = create_data_field("values", {3, 1, 2})
+    assert index.digest_iterable(field.meta, {1, 2, 3}) == index.digest_iterable(
+        field.meta, {3, 2, 1}
+    )
+    other = create_data_field("other", {3, 1, 2})
+    assert index.digest_iterable(field.meta, {1, 2, 3}) != index.digest_iterable(
+        other.meta, {1, 2, 3}
+    )
+
+
+def test_close() -> None:
+    index = ContentIndex()
+    index.nodes[b"digest"] = None  # type: ignore[assignment]
+    assert index.digest(nested0) is not None
+    index.close()
+    assert not index.active
+    assert index.nodes == {} and index._digests == {}
+
+
+def test_digest_cycle() -> None:
+    # objects that are part of a cycle are written as references only
+    index = ContentIndex()
+    assert index.digest(experiment) is None
+    assert index.digest(experiment.calibration) is not None
@@ -0,0 +1,264 @@
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import h5py
+import pytest
+from resources.data import (Experiment, HoldsStreams, dicts, experiment,
+                            lists, make_streams, n_streamed, nested0, sets,
+                            streamed, tuples)
+
+from saveables.__main__ import main
+from saveables.backends import detect_format, get_backend, get_file_class
+from saveables.contracts.constants import read_mode, root, write_mode
+from saveables.convert import convert, convert_many, target_path
+from saveables.hdf5_format.h5_file import H5File
+from saveables.saveable.saveable import Saveable
+from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.xml_format.xml_file import XmlFile
+
+formats = ["xml", "hdf5", "sqlite3", "binary"]
+
+
+def write(path: Path, obj: Saveable, format: str) -> None:
+    """
+    write object into file of given format
+
+    Args:
+        path (Path): path of file
+        obj (Saveable): data to be written
+        format (str): name of format
+    """
+    with get_backend(format).load()(path, write_mode) as f:
+        f.save(obj)
+
+
+@pytest.mark.parametrize("obj", [lists, sets, tuples, dicts, nested0])
+@pytest.mark.parametrize("source_format", formats)
+@pytest.mark.parametrize("target_format", formats)
+def test_convert(
+    local_tmp: Path, obj: Saveable, source_format: str, target_format: str
+) -> None:
+    """
+    test that files are converted between all formats without the classes of
+    the saved objects
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be converted
+        source_format (str): format of source file
+        target_format (str): format of target file
+    """
+    source = local_tmp / f"source{get_backend(source_format).extensions[0]}"
+    target = local_tmp / f"target{get_backend(target_format).extensions[0]}"
+    write(source, obj, source_format)
+
+    assert convert(source, target, chunk_size=1) == target
+    loaded = type(obj)()
+    with get_backend(target_format).load()(target, read_mode) as f:
+        f.load(loaded)
+    assert loaded == obj
+
+
+def test_convert_chunks(local_tmp: Path) -> None:
+    """
+    test that lists are piped chunk by chunk from one file into another
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    source = local_tmp / "source.sqlite3"
+    target = local_tmp / "target.h5"
+    with Sqlite3File(source, write_mode) as f:
+        f.save(make_streams(n_streamed, chunk_size=64))
+
+    convert(source, target, chunk_size=100)
+
+    # datasets written from streams are resizable and chunked
+    with h5py.File(target, "r") as h5:
+        dset = h5["root"]["stream_float"]
+        assert dset.maxshape == (None,) and dset.chunks == (100,)
+    loaded = HoldsStreams()
+    with H5File(target, read_mode) as f:
+        f.load(loaded)
+    assert loaded == streamed
+
+
+@pytest.mark.parametrize("source_format", ["xml", "hdf5", "sqlite3"])
+@pytest.mark.parametrize("target_format", ["xml", "hdf5", "sqlite3"])
+def test_convert_shared_references(
+    local_tmp: Path, source_format: str, target_format: str
+) -> None:
+    """
+    test that objects referenced more than once are converted into references,
+    including cycles
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        source_format (str): format of source file
+        target_format (str): format of target file
+    """
+    source = local_tmp / f"source{get_backend(source_format).extensions[0]}"
+    target = local_tmp / f"target{get_backend(target_format).extensions[0]}"
+    # only the consolidated sqlite3 layout can hold cycles
+    kwargs = {"layout": "consolidated"}
+    source_kwargs = kwargs if source_format == "sqlite3" else {}
+    with get_file_class(source_format)(source, write_mode, **source_kwargs) as f:
+        f.save(experiment)
+
+    convert(source, target, **(kwargs if target_format == "sqlite3" else {}))
+    loaded = Experiment()
+    with get_file_class(target_format)(target, read_mode) as f:
+        f.load(loaded, shared=True)
+    assert loaded.sample.experiment is loaded
+    assert loaded.calibration is loaded.reference
+    assert loaded.calibration == experiment.calibration
+
+    # binary files cannot hold cycles
+    with pytest.raises(ValueError):
+        convert(source, local_tmp / "target.svb")
+
+
+def test_convert_into_itself(local_tmp: Path) -> None:
+    """
+    test that a file cannot be converted into itself
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    write(path, nested0, "xml")
+    with pytest.raises(ValueError):
+        convert(path, path)
+
+
+@pytest.mark.parametrize(
+    "target_name, kwargs",
+    [
+        ("target.xml", {}),
+        ("target.h5", {}),
+        ("target.svb", {}),
+        ("target.xml.gz", {}),
+        ("target.sqlite3", {"layout": "tables"}),
+        ("target.sqlite3", {"layout": "consolidated"}),
+    ],
+)
+def test_convert_failed(
+    local_tmp: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    target_name: str,
+    kwargs: dict[str, Any],
+) -> None:
+    """
+    test that a conversion that fails after some nodes have been written leaves
+    no partial target file and keeps an existing target
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        monkeypatch (pytest.MonkeyPatch): fixture to fail the conversion
+        target_name (str): file name of target
+        kwargs (dict[str, Any]): keyword arguments of target file class
+    """
+    source = local_tmp / "source.xml"
+    target = local_tmp / target_name
+    write(source, nested0, "xml")
+    # the package exports the function convert under the name of the module
+    module = import_module("saveables.convert")
+    convert_node = module.convert_node
+
+    def fail_on_child(source_node: Any, target_node: Any, *args: Any) -> None:
+        if source_node.name != root:
+            raise RuntimeError("conversion failed")
+        convert_node(source_node, target_node, *args)
+
+    monkeypatch.setattr(module, "convert_node", fail_on_child)
+    with pytest.raises(RuntimeError):
+        convert(source, target, **kwargs)
+    assert list(local_tmp.iterdir()) == [source]
+
+    target.write_bytes(b"previous")
+    with pytest.raises(RuntimeError):
+        convert(source, target, **kwargs)
+    assert sorted(local_tmp.iterdir()) == sorted([source, target])
+    assert target.read_bytes() == b"previous"
+
+    monkeypatch.undo()
+    convert(source, target, **kwargs)
+    assert sorted(local_tmp.iterdir()) == sorted([source, target])
+    loaded = type(nested0)()
+    with get_backend(detect_format(target)).load()(target, read_mode) as f:
+        f.load(loaded)
+    assert loaded == nested0
+
+
+@pytest.mark.parametrize(
+    "source, format, directory, expected",
+    [
+        ("data.xml", "hdf5", None, "data.h5"),
+        ("dir/data.xml.gz", "sqlite3", None, "dir/data.sqlite3"),
+        ("data.v1.h5", "xml", "out", "out/data.v1.xml"),
+        ("data.unknown", "binary", None, "data.svb"),
+    ],
+)
+def test_target_path(
+    source: str, format: str, directory: str | None, expected: str
+) -> None:
+    assert target_path(source, format, directory) == Path(expected)
+
+
+def test_convert_many(local_tmp: Path) -> None:
+    """
+    test that files are converted in parallel
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    sources = [local_tmp / f"source{i}.xml" for i in range(3)]
+    for source in sources:
+        write(source, nested0, "xml")
+    targets = [target_path(source, "sqlite3") for source in sources]
+
+    assert convert_many(sources, targets, max_workers=2) == targets
+    for target in targets:
+        loaded = type(nested0)()
+        with Sqlite3File(target, read_mode) as f:
+            f.load(loaded)
+        assert loaded == nested0
+
+    with pytest.raises(ValueError):
+        convert_many(sources, targets[:1])
+
+
+def test_main(local_tmp: Path) -> None:
+    """
+    test command line interface
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    sources = [local_tmp / f"source{i}.sqlite3" for i in range(2)]
+    for source in sources:
+        write(source, nested0, "sqlite3")
+
+    # single file into given output path
+    output = local_tmp / "output.xml"
+    assert main(["convert", str(sources[0]), "--output", str(output)]) == 0
+    loaded = type(nested0)()
+    with XmlFile(output, read_mode) as f:
+        f.load(loaded)
+    assert loaded == nested0
+
+    # many files into a directory
+    directory = local_tmp / "out"
+    directory.mkdir()
+    args = ["convert", *map(str, sources), "-f", "hdf5", "-d", str(directory)]
+    assert main([*args, "-j", "2"]) == 0
+    assert sorted(path.name for path in directory.iterdir()) == [
+        "source0.h5",
+        "source1.h5",
+    ]
+
+    with pytest.raises(SystemExit):
+        main(["convert", *map(str, sources), "--output", str(output)])
+    with pytest.raises(SystemExit):
+        main(["convert", str(sources[0])])
@@ -0,0 +1,54 @@
+import pytest
+
+from saveables.base.field_selection import FieldSelection
+
+
+def test_create() -> None:
+    assert FieldSelection.create() is None
+    assert FieldSelection.create(fields=["a.b"]) == FieldSelection((("a", "b"),))
+    assert FieldSelection.create(exclude=["a"]) == FieldSelection(None, (("a",),))
+    with pytest.raises(ValueError):
+        FieldSelection.create(fields=["a..b"])
+    with pytest.raises(ValueError):
+        FieldSelection.create(exclude=[""])
+
+
+def test_selects() -> None:
+    selection = FieldSelection.create(["name", "address.city", "raw_*"], ["raw_b"])
+    assert selection is not None
+    assert selection.selects("name")
+    assert selection.selects("address")
+    assert selection.selects("raw_a")
+    assert not selection.selects("raw_b")
+    assert not selection.selects("age")
+
+
+def test_child() -> None:
+    selection = FieldSelection.create(
+        ["name", "address.city", "jobs"], ["jobs.salary", "address.city.zip"]
+    )
+    assert selection is not None
+
+    # only the city of the address is selected
+    address = selection.child("address")
+    assert address == FieldSelection((("city",),), (("city", "zip"),))
+    assert address.child("city") == FieldSelection(None, (("zip",),))
+
+    # all attributes of jobs are selected except the salary
+    jobs = selection.child("jobs")
+    assert jobs == FieldSelection(None, (("salary",),))
+    assert jobs.selects("title") and not jobs.selects("salary")
+
+    # everything is selected
+    assert FieldSelection.create(["name"]).child("name") is None  # type: ignore[union-attr] # noqa: E501
+
+
+def test_names() -> None:
+    selection = FieldSelection.create(["name", "address.city", "address.zip"], ["age"])
+    assert selection is not None and selection.names() == ("name", "address")
+    selection = FieldSelection.create(["name"], ["name"])
+    assert selection is not None and selection.names() == ()
+
+    # patterns and exclusions without selection cannot be looked up by name
+    assert FieldSelection.create(["na*"]).names() is None  # type: ignore[union-attr]
+    assert FieldSelection.create(exclude=["a"]).names() is None  # type: ignore[union-attr] # noqa: E501
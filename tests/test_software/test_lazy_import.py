@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+
+def test_lazy_import() -> None:
+    """
+    import saveables and use the xml and sqlite3 backends in a fresh interpreter
+    and check that neither h5py nor numpy have been imported
+    """
+    code = (
+        "import sys\n"
+        "import saveables\n"
+        "saveables.get_file_class('xml')\n"
+        "saveables.get_file_class('sqlite3')\n"
+        "saveables.XmlFile\n"
+        "heavy = [name for name in ('h5py', 'numpy') if name in sys.modules]\n"
+        "assert not heavy, heavy\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,169 @@
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from resources.data import (HoldsDicts, HoldsLists, HoldsNestedData,
+                            HoldsPrimitives, HoldsSets, HoldsStreams,
+                            HoldsTuples, attribute_paths, dicts, experiment,
+                            lists, make_streams, nested0, primitives,
+                            selections, sets, streamed, tuples)
+
+import saveables
+from saveables.binary_format.binary_file import BinaryFile
+from saveables.contracts.constants import read_mode, update_mode, write_mode
+from saveables.saveable.saveable import Saveable
+
+
+@pytest.mark.parametrize(
+    "obj, cls_",
+    [
+        (lists, HoldsLists),
+        (dicts, HoldsDicts),
+        (tuples, HoldsTuples),
+        (primitives, HoldsPrimitives),
+        (sets, HoldsSets),
+        (nested0, HoldsNestedData),
+    ],
+)
+@pytest.mark.parametrize("validate", [True, False])
+def test_write_load_binary(
+    local_tmp: Path, obj: Saveable, cls_: type, validate: bool
+) -> None:
+    """
+    system test to write and read data to and from a given file
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (see cls_): data to be written / read
+        cls_ (Type): class of data
+        validate (bool): check the types of the data while they are written
+                         and read
+    """
+
+    # write binary file
+    filename = "test.svb"
+    binary_path = local_tmp / filename
+    with BinaryFile(binary_path, mode=write_mode) as f:
+        f.save(obj, validate=validate)
+
+    # load data from file
+    loaded = cls_()
+    with BinaryFile(binary_path, mode=read_mode) as f:
+        f.load(loaded, validate=validate)
+
+    # check if loaded data matches written data
+    assert loaded == obj
+
+
+def test_write_load_streams(local_tmp: Path) -> None:
+    """
+    system test to write streams chunk by chunk and to read them as lists
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, mode=write_mode) as f:
+        f.save(make_streams(len(streamed.stream_int), chunk_size=64))
+
+    loaded = HoldsStreams()
+    with BinaryFile(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == streamed
+
+
+@pytest.mark.parametrize("obj, fields, exclude, expected", selections)
+def test_load_selected_fields(
+    local_tmp: Path,
+    obj: Saveable,
+    fields: list[str] | None,
+    exclude: list[str] | None,
+    expected: Saveable,
+) -> None:
+    """
+    system test to load selected attributes of data written to a file
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+        fields (list[str] | None): paths of attributes to be loaded
+        exclude (list[str] | None): paths of attributes not to be loaded
+        expected (Saveable): data that are expected to be loaded
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, mode=write_mode) as f:
+        f.save(obj)
+
+    loaded = type(obj)()
+    with BinaryFile(path, mode=read_mode) as f:
+        f.load(loaded, fields=fields, exclude=exclude)
+    assert loaded == expected
+
+
+def test_get(local_tmp: Path) -> None:
+    """
+    system test to read single attributes by their path
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, mode=write_mode) as f:
+        f.save(nested0)
+
+    with BinaryFile(path, mode=read_mode) as f:
+        for attribute_path, value in attribute_paths:
+            assert f.get(attribute_path) == value
+        assert f.get("nested.nested") == asdict(nested0.nested.nested)
+        with pytest.raises(KeyError):
+            f.get("missing")
+        with pytest.raises(KeyError):
+            f.get("missing.str_")
+
+
+def test_set(local_tmp: Path) -> None:
+    """
+    test that binary files cannot be updated
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, mode=write_mode) as f:
+        f.save(nested0)
+
+    with pytest.raises(ValueError):
+        BinaryFile(path, mode=update_mode).open()
+
+
+@pytest.mark.parametrize("obj", [lists, sets, tuples, dicts, nested0])
+def test_load_as_dict(local_tmp: Path, obj: Saveable) -> None:
+    """
+    system test to load data written to a file into dictionaries
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, mode=write_mode) as f:
+        f.save(obj)
+
+    with BinaryFile(path, mode=read_mode) as f:
+        assert f.load_as_dict() == asdict(obj)
+    assert saveables.load_as_dict(path, exclude=["nested"]) == {
+        key: value for key, value in asdict(obj).items() if key != "nested"
+    }
+
+
+def test_write_cycle(local_tmp: Path) -> None:
+    """
+    system test that cycles cannot be written into binary files
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    with pytest.raises(ValueError):
+        with BinaryFile(local_tmp / "test.svb", mode=write_mode) as f:
+            f.save(experiment)
+    assert not (local_tmp / "test.svb").exists()
@@ -1,13 +1,33 @@
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
-from resources.data import (HoldsDicts, HoldsLists, HoldsNestedData,
-                            HoldsPrimitives, HoldsSets, HoldsTuples, dicts,
-                            lists, nested0, primitives, sets, tuples)
+from resources.data import (Experiment, HoldsDicts, HoldsDuplicates,
+                            HoldsLists, HoldsNestedData, HoldsPrimitives,
+                            HoldsSets, HoldsStreams, HoldsTuples,
+                            attribute_paths, dicts, duplicates, experiment,
+                            lists, make_streams, nested0, primitives,
+                            selections, sets, streamed, tuples, updated0,
+                            updates)
 
-from saveables.contracts.constants import read_mode, write_mode
+import saveables
+import saveables.sqlite3_format.sqlite3_filenode
+from saveables.contracts.constants import read_mode, update_mode, write_mode
+from saveables.contracts.data_type import tSqlite3Layout
 from saveables.saveable.saveable import Saveable
 from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.sqlite3_format.sqlite3_pool import Sqlite3ConnectionPool
+from saveables.sqlite3_format.sqlite3_profile import (Sqlite3Profile,
+                                                      default_profile,
+                                                      fast_bulk_profile)
+
+# packed iterables are written through Connection.blobopen
+requires_blob_io = pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="Connection.blobopen requires python 3.11"
+)
 
 
 @pytest.mark.parametrize(
@@ -21,7 +41,21 @@ from saveables.sqlite3_format.sqlite3_file import Sqlite3File
         (nested0, HoldsNestedData),
     ],
 )
-def test_write_load_sqlite(local_tmp: Path, obj: Saveable, cls_: type) -> None:
+@pytest.mark.parametrize("profile", [default_profile, fast_bulk_profile])
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+@pytest.mark.parametrize(
+    "pack_iterables", [False, pytest.param(True, marks=requires_blob_io)]
+)
+@pytest.mark.parametrize("validate", [True, False])
+def test_write_load_sqlite(
+    local_tmp: Path,
+    obj: Saveable,
+    cls_: type,
+    profile: Sqlite3Profile,
+    layout: tSqlite3Layout,
+    pack_iterables: bool,
+    validate: bool,
+) -> None:
     """
     system test to write and read data to and from a given file
 
@@ -29,17 +63,389 @@ def test_write_load_sqlite(local_tmp: Path, obj: Saveable, cls_: type) -> None:
         local_tmp (Path): temporary directory for test data
         obj (see cls_): data to be written / read
         cls_ (Type): class of data
+        profile (Sqlite3Profile): performance profile of connections
+        layout (tSqlite3Layout): table layout of file
+        pack_iterables (bool): if True, numeric iterables are written as BLOBs
+        validate (bool): check the types of the data while they are written
+                         and read
     """
     filename = "test.sqlite3"
     sqlite3_path = local_tmp / filename
-    with Sqlite3File(sqlite3_path, mode=write_mode) as f:
-        f.save(obj)
+    with Sqlite3File(
+        sqlite3_path,
+        mode=write_mode,
+        profile=profile,
+        layout=layout,
+        pack_iterables=pack_iterables,
+    ) as f:
+        f.save(obj, validate=validate)
 
         # load data from file
     loaded = cls_()
 
-    with Sqlite3File(sqlite3_path, mode=read_mode) as f:
-        f.load(loaded)
+    with Sqlite3File(sqlite3_path, mode=read_mode, profile=profile) as f:
+        f.load(loaded, validate=validate)
 
     # check if loaded data matches written data
     assert loaded == obj
+
+
+@pytest.mark.parametrize(
+    "obj, cls_",
+    [
+        (dicts, HoldsDicts),
+        (nested0, HoldsNestedData),
+    ],
+)
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_load_sqlite_pooled(
+    local_tmp: Path, obj: Saveable, cls_: type, layout: tSqlite3Layout
+) -> None:
+    """
+    system test to load the same file concurrently through a connection pool
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (see cls_): data to be written / read
+        cls_ (Type): class of data
+        layout (tSqlite3Layout): table layout of file
+    """
+    sqlite3_path = local_tmp / "test.sqlite3"
+    with Sqlite3File(
+        sqlite3_path,
+        mode=write_mode,
+        layout=layout,
+        pack_iterables=Sqlite3File.supports_blob_io,
+    ) as f:
+        f.save(obj)
+
+    pool = Sqlite3ConnectionPool(max_idle=4)
+
+    def load() -> Saveable:
+        loaded = cls_()
+        with Sqlite3File(sqlite3_path, mode=read_mode, pool=pool) as f:
+            f.load(loaded)
+        return loaded
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: load(), range(32)))
+    pool.clear()
+
+    assert all(loaded == obj for loaded in results)
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+@pytest.mark.parametrize(
+    "pack_iterables", [False, pytest.param(True, marks=requires_blob_io)]
+)
+def test_write_load_streams(
+    local_tmp: Path, layout: tSqlite3Layout, pack_iterables: bool
+) -> None:
+    """
+    system test to write streams in batches of rows and to read them as lists
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+        pack_iterables (bool): if True, numeric iterables are written as BLOBs
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(
+        path, mode=write_mode, layout=layout, pack_iterables=pack_iterables
+    ) as f:
+        f.save(make_streams(len(streamed.stream_int), chunk_size=64))
+
+    loaded = HoldsStreams()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == streamed
+
+
+@pytest.mark.parametrize("obj, fields, exclude, expected", selections)
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_load_selected_fields(
+    local_tmp: Path,
+    obj: Saveable,
+    fields: list[str] | None,
+    exclude: list[str] | None,
+    expected: Saveable,
+    layout: tSqlite3Layout,
+) -> None:
+    """
+    system test to load selected attributes of data written to a file
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+        fields (list[str] | None): paths of attributes to be loaded
+        exclude (list[str] | None): paths of attributes not to be loaded
+        expected (Saveable): data that are expected to be loaded
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout) as f:
+        f.save(obj)
+
+    loaded = type(obj)()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded, fields=fields, exclude=exclude)
+    assert loaded == expected
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_get(local_tmp: Path, layout: tSqlite3Layout) -> None:
+    """
+    system test to read single attributes by their path
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout) as f:
+        f.save(nested0)
+
+    with Sqlite3File(path, mode=read_mode) as f:
+        for attribute_path, value in attribute_paths:
+            assert f.get(attribute_path) == value
+        assert f.get("nested.nested") == asdict(nested0.nested.nested)
+        with pytest.raises(KeyError):
+            f.get("missing")
+        with pytest.raises(KeyError):
+            f.get("missing.str_")
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_set(local_tmp: Path, layout: tSqlite3Layout) -> None:
+    """
+    system test to update single attributes of an existing file by their path
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout) as f:
+        f.save(nested0)
+
+    with Sqlite3File(path, mode=update_mode) as f:
+        for attribute_path, value in updates:
+            f.set(attribute_path, value)
+        assert f.get("nested.int_") == 5
+        with pytest.raises(KeyError):
+            f.set("missing.str_", "")
+
+    loaded = HoldsNestedData()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == updated0
+    with Sqlite3File(path, mode=read_mode) as f:
+        with pytest.raises(ValueError):
+            f.set("str_", "")
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_set_nested_transaction(local_tmp: Path, layout: tSqlite3Layout) -> None:
+    """
+    system test to update several attributes within one transaction. Failing
+    nested transactions only roll back their own statements
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout) as f:
+        f.save(nested0)
+
+    with Sqlite3File(path, mode=update_mode) as f:
+        with f.transaction():
+            for attribute_path, value in updates:
+                f.set(attribute_path, value)
+            with pytest.raises(RuntimeError):
+                with f.transaction():
+                    f.set("str_", "rolled back")
+                    raise RuntimeError("nested transaction failed")
+
+    loaded = HoldsNestedData()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == updated0
+
+    with Sqlite3File(path, mode=update_mode) as f:
+        with pytest.raises(RuntimeError):
+            with f.transaction():
+                f.set("str_", "rolled back")
+                raise RuntimeError("outer transaction failed")
+    with Sqlite3File(path, mode=read_mode) as f:
+        assert f.get("str_") == updated0.str_
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+@pytest.mark.parametrize(
+    "pack_iterables", [False, pytest.param(True, marks=requires_blob_io)]
+)
+def test_load_dictionaries(
+    local_tmp: Path, layout: tSqlite3Layout, pack_iterables: bool
+) -> None:
+    """
+    system test to load the keys and values of dictionaries in the order they
+    have been written after the file has been vacuumed, and to read both with
+    one query. Files without the index over object ids are read, too
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+        pack_iterables (bool): write numeric iterables as BLOBs
+    """
+    obj = HoldsDicts(
+        {str(i): str(-i) for i in reversed(range(300))},
+        {str(i): i for i in reversed(range(300))},
+    )
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(
+        path, mode=write_mode, layout=layout, pack_iterables=pack_iterables
+    ) as f:
+        f.save(obj)
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM")
+    conn.close()
+
+    loaded = HoldsDicts()
+    statements: list[str] = []
+    with Sqlite3File(path, mode=read_mode) as f:
+        assert f.conn is not None
+        f.conn.set_trace_callback(statements.append)
+        f.load(loaded)
+    assert loaded == obj
+    assert list(loaded.dct_str_int) == list(obj.dct_str_int)
+    if layout == "tables":
+        # one query per dictionary selects its keys and values
+        element_queries = [s for s in statements if "meta_data IN" in s]
+        assert len(element_queries) == 2
+
+        # files written before the index over object ids existed
+        conn = sqlite3.connect(path)
+        conn.execute("DROP INDEX root_object_id")
+        conn.close()
+        loaded = HoldsDicts()
+        with Sqlite3File(path, mode=read_mode) as f:
+            f.load(loaded)
+        assert loaded == obj
+
+
+@pytest.mark.parametrize("obj", [lists, sets, tuples, dicts, nested0])
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_load_as_dict(local_tmp: Path, obj: Saveable, layout: tSqlite3Layout) -> None:
+    """
+    system test to load data written to a file into dictionaries
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout) as f:
+        f.save(obj)
+
+    # empty iterables have no rows and are not part of the file
+    expected = {
+        key: value
+        for key, value in asdict(obj).items()
+        if value not in ([], (), set(), {})
+    }
+    with Sqlite3File(path, mode=read_mode) as f:
+        assert f.load_as_dict() == expected
+    assert saveables.load_as_dict(path, exclude=["nested"]) == {
+        key: value for key, value in expected.items() if key != "nested"
+    }
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_write_load_deduplicated(local_tmp: Path, layout: tSqlite3Layout) -> None:
+    """
+    system test to load data whose duplicates are written as references
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        layout (tSqlite3Layout): table layout of file
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, mode=write_mode, layout=layout, deduplicate=True) as f:
+        f.save(duplicates)
+
+    # duplicates are loaded into independent objects by default
+    loaded = HoldsDuplicates()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == duplicates
+    assert loaded.second.calibration is not loaded.first.calibration
+
+    shared = HoldsDuplicates()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(shared, shared=True)
+    assert shared == duplicates
+    assert shared.second.calibration is shared.first.calibration
+
+    # the tables layout references only saveables of the same name
+    assert (shared.third is shared.first) == (layout == "consolidated")
+
+
+def test_write_load_shared_references(local_tmp: Path) -> None:
+    """
+    system test to load objects that are referenced more than once, including
+    a cycle, which only the consolidated layout can write
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    tables = local_tmp / "tables.sqlite3"
+    with pytest.raises(ValueError):
+        with Sqlite3File(tables, mode=write_mode, layout="tables") as f:
+            f.save(experiment)
+
+    path = local_tmp / "test.sqlite3"
+
+    with Sqlite3File(path, mode=write_mode, layout="consolidated") as f:
+        f.save(experiment)
+
+    # cycles are restored by default, shared objects on request
+    loaded = Experiment()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded.sample.experiment is loaded
+    assert loaded.calibration == loaded.reference == experiment.calibration
+    assert loaded.calibration is not loaded.reference
+
+    shared = Experiment()
+    with Sqlite3File(path, mode=read_mode) as f:
+        f.load(shared, shared=True)
+    assert shared.sample.experiment is shared
+    assert shared.calibration is shared.reference
+
+    data = saveables.load_as_dict(path)
+    assert data["sample"]["experiment"] is data
+
+
+@pytest.mark.parametrize("layout", ["tables", "consolidated"])
+def test_write_equal_object_ids(
+    local_tmp: Path, monkeypatch: pytest.MonkeyPatch, layout: tSqlite3Layout
+) -> None:
+    """
+    system test that nodes whose generated object ids are equal are rejected
+    instead of being merged
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        monkeypatch (pytest.MonkeyPatch): fixture to generate equal ids
+        layout (tSqlite3Layout): table layout of file
+    """
+    monkeypatch.setattr(
+        saveables.sqlite3_format.sqlite3_filenode,
+        "generate_uuid",
+        lambda n_chars: "0" * n_chars,
+    )
+    with pytest.raises(ValueError):
+        with Sqlite3File(local_tmp / "test.sqlite3", write_mode, layout=layout) as f:
+            f.save(nested0)
@@ -1,11 +1,17 @@
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
-from resources.data import (HoldsDicts, HoldsLists, HoldsNestedData,
-                            HoldsPrimitives, HoldsSets, HoldsTuples, dicts,
-                            lists, nested0, primitives, sets, tuples)
+from resources.data import (Experiment, HoldsDicts, HoldsDuplicates,
+                            HoldsLists, HoldsNestedData, HoldsPrimitives,
+                            HoldsSets, HoldsStreams, HoldsTuples,
+                            attribute_paths, dicts, duplicates, experiment,
+                            lists, make_streams, nested0, primitives,
+                            selections, sets, streamed, tuples, updated0,
+                            updates)
 
-from saveables.contracts.constants import read_mode, write_mode
+import saveables
+from saveables.contracts.constants import read_mode, update_mode, write_mode
 from saveables.saveable.saveable import Saveable
 from saveables.xml_format.xml_file import XmlFile
 
@@ -21,7 +27,11 @@ from saveables.xml_format.xml_file import XmlFile
         (nested0, HoldsNestedData),
     ],
 )
-def test_write_load_xml(local_tmp: Path, obj: Saveable, cls_: type) -> None:
+@pytest.mark.parametrize("suffix", ["", ".gz", ".bz2", ".xz"])
+@pytest.mark.parametrize("validate", [True, False])
+def test_write_load_xml(
+    local_tmp: Path, obj: Saveable, cls_: type, suffix: str, validate: bool
+) -> None:
     """
     system test to write and read data to and from a given file
 
@@ -29,18 +39,190 @@ def test_write_load_xml(local_tmp: Path, obj: Saveable, cls_: type) -> None:
         local_tmp (Path): temporary directory for test data
         obj (see cls_): data to be written / read
         cls_ (Type): class of data
+        suffix (str): suffix of compression codec, empty for uncompressed files
+        validate (bool): check the types of the data while they are written
+                         and read
     """
 
     # write file to hdf5
-    filename = "test.xml"
+    filename = f"test.xml{suffix}"
     h5_path = local_tmp / filename
     with XmlFile(h5_path, mode=write_mode) as f:
-        f.save(obj)
+        f.save(obj, validate=validate)
 
     # load data from file
     loaded = cls_()
     with XmlFile(h5_path, mode=read_mode) as f:
-        f.load(loaded)
+        f.load(loaded, validate=validate)
 
     # check if loaded data matches written data
     assert loaded == obj
+
+
+def test_write_load_streams(local_tmp: Path) -> None:
+    """
+    system test to write streams chunk by chunk and to read them as lists
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(make_streams(len(streamed.stream_int), chunk_size=64))
+
+    loaded = HoldsStreams()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == streamed
+
+
+@pytest.mark.parametrize("obj, fields, exclude, expected", selections)
+def test_load_selected_fields(
+    local_tmp: Path,
+    obj: Saveable,
+    fields: list[str] | None,
+    exclude: list[str] | None,
+    expected: Saveable,
+) -> None:
+    """
+    system test to load selected attributes of data written to a file
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+        fields (list[str] | None): paths of attributes to be loaded
+        exclude (list[str] | None): paths of attributes not to be loaded
+        expected (Saveable): data that are expected to be loaded
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(obj)
+
+    loaded = type(obj)()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(loaded, fields=fields, exclude=exclude)
+    assert loaded == expected
+
+
+def test_get(local_tmp: Path) -> None:
+    """
+    system test to read single attributes by their path
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(nested0)
+
+    with XmlFile(path, mode=read_mode) as f:
+        for attribute_path, value in attribute_paths:
+            assert f.get(attribute_path) == value
+        assert f.get("nested.nested") == asdict(nested0.nested.nested)
+        with pytest.raises(KeyError):
+            f.get("missing")
+        with pytest.raises(KeyError):
+            f.get("missing.str_")
+
+
+def test_set(local_tmp: Path) -> None:
+    """
+    system test to update single attributes of an existing file by their path
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(nested0)
+
+    with XmlFile(path, mode=update_mode) as f:
+        for attribute_path, value in updates:
+            f.set(attribute_path, value)
+        assert f.get("nested.int_") == 5
+        with pytest.raises(KeyError):
+            f.set("missing.str_", "")
+
+    loaded = HoldsNestedData()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == updated0
+    with XmlFile(path, mode=read_mode) as f:
+        with pytest.raises(ValueError):
+            f.set("str_", "")
+
+
+@pytest.mark.parametrize("obj", [lists, sets, tuples, dicts, nested0])
+def test_load_as_dict(local_tmp: Path, obj: Saveable) -> None:
+    """
+    system test to load data written to a file into dictionaries
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        obj (Saveable): data to be written
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(obj)
+
+    with XmlFile(path, mode=read_mode) as f:
+        assert f.load_as_dict() == asdict(obj)
+    assert saveables.load_as_dict(path, exclude=["nested"]) == {
+        key: value for key, value in asdict(obj).items() if key != "nested"
+    }
+
+
+def test_write_load_deduplicated(local_tmp: Path) -> None:
+    """
+    system test to load data whose duplicates are written as references
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode, deduplicate=True) as f:
+        f.save(duplicates)
+
+    # duplicates are loaded into independent objects by default
+    loaded = HoldsDuplicates()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == duplicates
+    assert loaded.second.calibration is not loaded.first.calibration
+
+    shared = HoldsDuplicates()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(shared, shared=True)
+    assert shared == duplicates
+    assert shared.second.calibration is shared.first.calibration
+    assert shared.third is shared.first
+
+
+def test_write_load_shared_references(local_tmp: Path) -> None:
+    """
+    system test to load objects that are referenced more than once, including
+    a cycle
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.xml"
+    with XmlFile(path, mode=write_mode) as f:
+        f.save(experiment)
+
+    # cycles are restored by default, shared objects on request
+    loaded = Experiment()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded.sample.experiment is loaded
+    assert loaded.calibration == loaded.reference == experiment.calibration
+    assert loaded.calibration is not loaded.reference
+
+    shared = Experiment()
+    with XmlFile(path, mode=read_mode) as f:
+        f.load(shared, shared=True)
+    assert shared.sample.experiment is shared
+    assert shared.calibration is shared.reference
+
+    data = saveables.load_as_dict(path)
+    assert data["sample"]["experiment"] is data
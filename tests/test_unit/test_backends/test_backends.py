@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import pytest
+from resources.data import (HoldsNestedData, HoldsPrimitives, nested0,
+                            primitives)
+
+import saveables
+from saveables.backends import (Backend, _backends, detect_format,
+                                detect_format_of_bytes, get_file_class,
+                                get_file_class_for_path,
+                                get_format_from_extension, list_formats,
+                                register_backend)
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.xml_format.xml_file import XmlFile
+
+
+@pytest.mark.parametrize(
+    "path, format",
+    [
+        ("data.xml", "xml"),
+        ("data.xml.gz", "xml"),
+        (Path("dir") / "DATA.XML", "xml"),
+        ("data.h5", "hdf5"),
+        ("data.hdf5", "hdf5"),
+        ("data.sqlite3", "sqlite3"),
+        ("data.db", "sqlite3"),
+    ],
+)
+def test_get_format_from_extension(path: str | Path, format: str) -> None:
+    """
+    test that formats are determined from file name extensions
+
+    Args:
+        path (str | Path): file path
+        format (str): expected format name
+    """
+    assert get_format_from_extension(path) == format
+
+
+def test_get_format_from_extension_fails() -> None:
+    """
+    test that an unknown extension raises a ValueError
+    """
+    with pytest.raises(ValueError):
+        get_format_from_extension("data.unknown")
+
+
+def test_get_file_class() -> None:
+    """
+    test that file classes are resolved by format name and by path
+    """
+    assert set(list_formats()) >= {"xml", "hdf5", "sqlite3"}
+    assert get_file_class("xml") is XmlFile
+    assert get_file_class_for_path("data.sqlite3") is Sqlite3File
+    with pytest.raises(ValueError):
+        get_file_class("unknown")
+
+
+@pytest.mark.parametrize("format", ["xml", "hdf5", "sqlite3", "binary"])
+def test_detect_format(local_tmp: Path, format: str) -> None:
+    """
+    test that the format of a file is detected from its first bytes, even if
+    the file name extension is misleading, and that saveables.open returns
+    an object that loads the file
+
+    Args:
+        local_tmp (Path): temporary test directory
+        format (str): format the file is written in
+    """
+    path = local_tmp / "data.bin"
+    with saveables.open(path, write_mode, format=format) as f:
+        f.save(primitives)
+
+    assert detect_format(path) == format
+
+    loaded = HoldsPrimitives(str_=None, int_=None, float_=None, bool_=None)
+    with saveables.open(path, read_mode) as f:
+        assert isinstance(f, get_file_class(format))
+        f.load(loaded)
+    assert loaded == primitives
+
+
+@pytest.mark.parametrize("format", ["xml", "hdf5", "sqlite3", "binary"])
+def test_to_from_bytes(
+    local_tmp: Path, monkeypatch: pytest.MonkeyPatch, format: str
+) -> None:
+    """
+    test that objects are saved into and loaded from bytes without files, and
+    that the format of the bytes is detected
+
+    Args:
+        local_tmp (Path): temporary test directory
+        monkeypatch (pytest.MonkeyPatch): fixture to change working directory
+        format (str): format of bytes
+    """
+    monkeypatch.chdir(local_tmp)
+    data = saveables.to_bytes(nested0, format)
+    assert detect_format_of_bytes(data) == format
+
+    loaded = HoldsNestedData()
+    saveables.from_bytes(data, loaded)
+    assert loaded == nested0
+
+    loaded = HoldsNestedData()
+    get_file_class(format).from_bytes(data, loaded, fields=["nested.lst_"])
+    assert loaded.nested.lst_ == nested0.nested.lst_ and loaded.lst_ == []
+    assert list(local_tmp.iterdir()) == []
+
+    with pytest.raises(ValueError):
+        saveables.from_bytes(b"unknown", loaded)
+
+
+def test_register_backend() -> None:
+    """
+    test that additional backends can be registered and resolved
+    """
+    backend = Backend(
+        "my_format",
+        "saveables.xml_format.xml_file",
+        "XmlFile",
+        (".myformat",),
+        (b"MYFORMAT",),
+    )
+    register_backend(backend)
+    try:
+        assert get_file_class_for_path("data.myformat") is XmlFile
+        assert backend.matches_header(b"MYFORMAT\x00\x01")
+
+        # registering twice without replace fails
+        with pytest.raises(ValueError):
+            register_backend(backend)
+        register_backend(backend, replace=True)
+    finally:
+        del _backends[backend.name]
+
+    # signatures must fit into the bytes read for detection
+    with pytest.raises(ValueError):
+        Backend("too_long", "module", "cls", (), (b"x" * 100,))
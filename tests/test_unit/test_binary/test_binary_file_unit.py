@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import pytest
+
+from saveables.binary_format.binary_file import BinaryFile
+from saveables.binary_format.binary_filenode import (BinaryFileNode,
+                                                     pack_array, pack_count,
+                                                     pack_scalar)
+from saveables.binary_format.binary_layout import (BinaryTables,
+                                                   header_struct, magic)
+from saveables.contracts.constants import attribute, read_mode, root, write_mode
+from saveables.contracts.data_type import python_type_literal_map
+from saveables.saveable.data_field import DataField
+from saveables.saveable.meta_data import MetaData
+
+
+class LongList(list):  # type: ignore[type-arg]
+    """
+    empty list that pretends to have more elements than a count can hold
+    """
+
+    def __len__(self) -> int:
+        return 2**32
+
+
+def test_tables_pack_unpack() -> None:
+    """
+    test that strings and meta data are stored once and restored from bytes
+    """
+    tables = BinaryTables()
+    meta = MetaData(
+        python_type=python_type_literal_map[int],
+        role=attribute,
+        name="my_int",
+        element_type=python_type_literal_map[int],
+    )
+    index = tables.meta_index(meta)
+    assert tables.meta_index(meta) == index
+    assert tables.strings.count("int") == 1
+
+    restored = BinaryTables.unpack(tables.pack(), 0)
+    assert restored.strings == tables.strings
+    assert restored.metas == [meta]
+
+
+def test_pack_out_of_range() -> None:
+    """
+    test that values that do not fit into the packed types raise a ValueError
+    """
+    with pytest.raises(ValueError):
+        pack_scalar(2**70, "int")
+    with pytest.raises(ValueError):
+        pack_array([2**70], "int")
+
+
+def test_pack_count_out_of_range() -> None:
+    """
+    test that numbers of elements that do not fit into a count raise a
+    ValueError
+    """
+    assert pack_count(2**32 - 1) == b"\xff" * 4
+    with pytest.raises(ValueError):
+        pack_count(2**32)
+    with pytest.raises(ValueError):
+        pack_array(LongList(), "int")
+
+
+def test_write_duplicate_name() -> None:
+    """
+    test that a node rejects a second attribute of the same name
+    """
+    node = BinaryFileNode(root, None, BinaryTables())
+    meta = MetaData(
+        python_type=python_type_literal_map[int],
+        role=attribute,
+        name="my_int",
+        element_type=python_type_literal_map[int],
+    )
+    node.write_primitive_data(DataField(meta=meta, value=1))
+    with pytest.raises(ValueError):
+        node.write_primitive_data(DataField(meta=meta, value=2))
+
+
+def test_open_write_read(local_tmp: Path) -> None:
+    """
+    test that a written file starts with the header and that the root node
+    is restored when the file is opened for reading
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    path = local_tmp / "test.svb"
+    with BinaryFile(path, write_mode) as f:
+        assert isinstance(f.root, BinaryFileNode)
+        assert f.root.name == root
+
+    assert path.read_bytes()[:8] == magic
+    assert path.stat().st_size > header_struct.size
+
+    file = BinaryFile(path, read_mode)
+    file.open()
+    assert isinstance(file.root, BinaryFileNode)
+    assert list(file.root) == []
+    file.close()
+
+
+def test_close_after_error(local_tmp: Path) -> None:
+    """
+    test that a file is not written if its with block raises an error
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    path = local_tmp / "test.svb"
+    with pytest.raises(RuntimeError):
+        with BinaryFile(path, write_mode):
+            raise RuntimeError("error while writing")
+    assert not path.exists()
+
+
+def test_open_to_read_fails(local_tmp: Path) -> None:
+    """
+    test that files which are not binary saveables files are rejected
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    path = local_tmp / "test.svb"
+    path.write_bytes(b"<?xml version='1.0'?>" + b" " * 64)
+    with pytest.raises(ValueError):
+        BinaryFile(path, read_mode).open()
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        BinaryFile(path, read_mode).open()
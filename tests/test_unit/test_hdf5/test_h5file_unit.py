@@ -1,8 +1,19 @@
+from io import BytesIO
 from pathlib import Path
+from typing import Any
 
-from saveables.contracts.constants import root, write_mode
+import h5py
+import pytest
+from h5py import h5f
+from resources.data import (HoldsNestedData, HoldsPrimitives, MyMixedSaveable,
+                            duplicates, experiment, lists, mixed, nested0)
+
+from saveables.contracts.constants import (packed_scalars, read_mode, root,
+                                           update_mode, write_mode)
 from saveables.hdf5_format.h5_file import H5File
 from saveables.hdf5_format.h5_filenode import H5FileNode
+from saveables.hdf5_format.h5_profile import (H5Profile, default_profile,
+                                              paged_profile)
 
 
 def test_h5file_open(local_tmp: Path) -> None:
@@ -22,3 +33,270 @@ def test_h5file_open(local_tmp: Path) -> None:
     assert file.root.name == root
     assert file.root.parent is None
     assert file.root._group.name == f"/{root}"
+
+
+def test_h5file_close_releases_members(local_tmp: Path) -> None:
+    """
+    test that the opened members of all nodes are released before a file is
+    closed, so that no h5py objects of the closed file are left to the garbage
+    collector
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test.h5"
+    with H5File(path=tmpfile, mode=write_mode) as f:
+        f.save(nested0)
+
+    file = H5File(path=tmpfile, mode=read_mode)
+    file.open()
+    file.load(HoldsNestedData())
+    node = file.root
+    assert isinstance(node, H5FileNode)
+    child = node.get_child("nested")
+    assert node._members_cache and node._children_cache
+    file.close()
+    assert file.root is None
+    assert node._members_cache is None and not node._children_cache
+    assert child is not None and child._members_cache is None
+
+
+def test_h5file_deduplicate(local_tmp: Path) -> None:
+    """
+    test that duplicate saveables and iterables are written as hard links
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test.h5"
+    with H5File(path=tmpfile, mode=write_mode, deduplicate=True) as f:
+        f.save(duplicates)
+
+    with h5py.File(tmpfile, "r") as h5:
+        group = h5[root]
+        assert group["third"].id == group["first"].id
+        assert group["second"].id != group["first"].id
+        assert group["second/calibration"].id == group["first/calibration"].id
+
+    # without deduplication, each object is written in full
+    with H5File(path=tmpfile, mode=write_mode) as f:
+        f.save(duplicates)
+    with h5py.File(tmpfile, "r") as h5:
+        group = h5[root]
+        assert group["third"].id != group["first"].id
+
+
+def test_h5file_shared_references(local_tmp: Path) -> None:
+    """
+    test that objects referenced more than once are written as hard links,
+    even without deduplication
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test.h5"
+    with H5File(path=tmpfile, mode=write_mode) as f:
+        f.save(experiment)
+
+    with h5py.File(tmpfile, "r") as h5:
+        group = h5[root]
+        assert group["reference"].id == group["calibration"].id
+        assert group["sample/experiment"].id == group.id
+
+
+def test_h5file_swmr(local_tmp: Path) -> None:
+    """
+    test that lists written in single writer multiple reader mode are appended
+    while the file is read, and that readers see the elements once they refresh
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "swmr.h5"
+    writer = H5File(path=tmpfile, mode=write_mode, swmr=True)
+    writer.open()
+    try:
+        writer.save(nested0)
+        writer.start_swmr()
+        with H5File(path=tmpfile, mode=read_mode, swmr=True) as reader:
+            loaded = HoldsNestedData()
+            reader.load(loaded)
+            assert loaded == nested0
+
+            writer.append("nested.nested.lst_", ["3", "4"])
+            writer.append("lst_", ("1",))
+            reader.refresh()
+            reader.load(loaded)
+            assert loaded.nested.nested.lst_ == ["2", "2", "3", "4"]
+            assert reader.get("lst_") == ["0", "0", "1"]
+
+            with pytest.raises(TypeError):
+                writer.append("lst_", [1])
+            with pytest.raises(ValueError):
+                writer.append("str_", ["1"])
+            with pytest.raises(ValueError):
+                reader.append("lst_", ["1"])
+    finally:
+        writer.close()
+
+    with h5py.File(tmpfile, "r") as h5:
+        assert h5[root]["lst_"].maxshape == (None,)
+
+
+def test_h5file_swmr_update(local_tmp: Path) -> None:
+    """
+    test that lists of files that have been written with swmr=True are appended
+    after the file is opened for update, and that attributes are added until
+    single writer multiple reader mode is started
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "swmr_update.h5"
+    with H5File(path=tmpfile, mode=write_mode, swmr=True) as f:
+        f.save(lists)
+        with pytest.raises(ValueError):
+            f.refresh()
+
+    with H5File(path=tmpfile, mode=update_mode, swmr=True) as f:
+        f.set("lst_new", [1.0, 2.0])
+        f.start_swmr()
+        with H5File(path=tmpfile, mode=read_mode, swmr=True) as reader:
+            f.append("lst_int", [3])
+            f.append("lst_new", [3.0])
+            reader.refresh()
+            assert reader.get("lst_new") == [1.0, 2.0, 3.0]
+        # the type of the elements of empty lists is unknown
+        with pytest.raises(ValueError):
+            f.append("lst_empty", [1])
+        with pytest.raises(KeyError):
+            f.append("lst_float", [1.0])
+
+    with H5File(path=tmpfile, mode=read_mode) as f:
+        assert f.get("lst_int") == [1, 2, 3]
+        assert f.get("lst_new") == [1.0, 2.0, 3.0]
+
+    # lists of files written without swmr cannot be resized
+    tmpfile = local_tmp / "no_swmr.h5"
+    with H5File(path=tmpfile, mode=write_mode) as f:
+        f.save(lists)
+    with H5File(path=tmpfile, mode=update_mode) as f:
+        with pytest.raises(ValueError):
+            f.append("lst_int", [3])
+
+
+def test_h5file_in_memory(local_tmp: Path) -> None:
+    """
+    test that files are written into and read from file-like objects, and that
+    files of the core driver are only written to the file system if they have
+    a backing store
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    buffer = BytesIO()
+    with H5File(path=buffer, mode=write_mode) as f:
+        f.save(nested0)
+    assert buffer.getvalue().startswith(b"\x89HDF")
+
+    loaded = HoldsNestedData()
+    with H5File(path=BytesIO(buffer.getvalue()), mode=read_mode) as f:
+        f.load(loaded)
+    assert loaded == nested0
+
+    for backing_store in (False, True):
+        tmpfile = local_tmp / f"core_{backing_store}.h5"
+        with H5File(
+            path=tmpfile, mode=write_mode, driver="core", backing_store=backing_store
+        ) as f:
+            f.save(nested0)
+        assert tmpfile.exists() == backing_store
+
+    # bytes are written by the core driver without a backing store
+    data = H5File.to_bytes(nested0, pack_meta_data=True)
+    loaded = HoldsNestedData()
+    H5File.from_bytes(data, loaded)
+    assert loaded == nested0
+
+
+def test_h5file_profile(local_tmp: Path) -> None:
+    """
+    test that files are written with the file space strategy of a profile and
+    that they are read and updated with any profile
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test_profile.h5"
+    with H5File(path=tmpfile, mode=write_mode, profile=paged_profile) as f:
+        f.save(nested0)
+    with h5py.File(tmpfile, "r") as h5:
+        strategy = h5.id.get_create_plist().get_file_space_strategy()[0]
+        assert strategy == h5f.FSPACE_STRATEGY_PAGE
+
+    # options that are stored in the file are not passed when it is opened
+    assert "fs_strategy" not in paged_profile.options(read_mode)
+    with H5File(path=tmpfile, mode=update_mode, profile=paged_profile) as f:
+        f.set("int_", 42)
+    for profile in (default_profile, paged_profile):
+        with H5File(path=tmpfile, mode=read_mode, profile=profile) as f:
+            assert f.get("int_") == 42
+            assert f.get("nested.str_") == nested0.nested.str_
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"fs_strategy": "pages"},
+        {"libver": "newest"},
+        {"meta_block_size": -1},
+        {"rdcc_w0": 2.0},
+        {"page_buf_size": 65536},
+        {"fs_strategy": "page", "fs_page_size": 65536, "page_buf_size": 4096},
+    ],
+)
+def test_h5file_profile_invalid_values(kwargs: dict[str, Any]) -> None:
+    """
+    test that invalid options of a profile are rejected
+
+    Args:
+        kwargs (dict[str, Any]): invalid profile arguments
+    """
+    with pytest.raises(ValueError):
+        H5Profile(**kwargs)
+
+
+def test_h5file_pack_scalars(local_tmp: Path) -> None:
+    """
+    test that the scalars of each object are written into a single dataset,
+    that they are read like scalars that are written into datasets of their own
+    and that they can be updated
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test_pack_scalars.h5"
+    with H5File(path=tmpfile, mode=write_mode, pack_scalars=True) as f:
+        f.save(mixed)
+    with h5py.File(tmpfile, "r") as h5:
+        group = h5[root]
+        assert packed_scalars in group and "str_" not in group and "lst_" in group
+        assert len(group["saveable_"][packed_scalars]) == 4
+        assert "none_" in group["saveable_"]
+
+    loaded = MyMixedSaveable(saveable_=HoldsPrimitives(str_=None, bool_=False))
+    with H5File(path=tmpfile, mode=read_mode) as f:
+        f.load(loaded)
+        assert f.load_as_dict(fields=["saveable_.*"])["saveable_"]["int_"] == 0
+        assert f.get("saveable_.bool_") is True
+    assert loaded == mixed
+
+    with H5File(path=tmpfile, mode=update_mode, pack_scalars=True) as f:
+        f.set("saveable_.str_", "updated")
+        f.set("str_", [1, 2])
+        with pytest.raises(ValueError):
+            f.set(packed_scalars, 1.5)
+    with H5File(path=tmpfile, mode=read_mode) as f:
+        assert f.get("saveable_.str_") == "updated"
+        assert f.get("str_") == [1, 2]
+        assert f.get("saveable_.float_") == 1.0
@@ -5,10 +5,14 @@ import h5py
 import numpy as np
 import pytest
 
-from saveables.contracts.constants import attribute, none_type, saveable
+from saveables.base.field_selection import FieldSelection
+from saveables.contracts.constants import (attribute, none_type,
+                                           packed_meta_data, saveable)
 from saveables.contracts.data_type import python_type_literal_map
 from saveables.hdf5_format.h5_filenode import H5FileNode
+from saveables.saveable.data_field import DataField
 from saveables.saveable.meta_data import MetaData
+from saveables.saveable.stream import Stream
 from saveables.saveable.utils import get_element_type
 
 
@@ -106,3 +110,131 @@ def test_create_child_node(local_tmp: Path) -> None:
         assert isinstance(child_node, H5FileNode)
         assert child_node.name == "child1"
         assert child_node.parent is root_node
+
+
+@pytest.mark.parametrize("pack_meta_data", [False, True])
+def test_create_dataset_meta_data_layout(local_tmp: Path, pack_meta_data: bool) -> None:
+    """
+    test that meta data are written either as a single packed attribute or as
+    one attribute per meta data field and that both layouts are read correctly
+
+    Args:
+        local_tmp (Path): temporary test directory
+        pack_meta_data (bool): write meta data as a single attribute
+    """
+    tmpfile = local_tmp / "meta_data_layout.h5"
+
+    with h5py.File(tmpfile, "w") as h5f:
+        node = H5FileNode(
+            name="test", parent=None, group=h5f, pack_meta_data=pack_meta_data
+        )
+        meta = MetaData(
+            python_type=python_type_literal_map[int],
+            role=attribute,
+            name="my_int",
+            element_type=python_type_literal_map[int],
+        )
+        node._create_dataset("my_int", 42, dtype=None, meta=meta)
+
+        # check attribute layout
+        dset = h5f["my_int"]
+        if pack_meta_data:
+            assert list(dset.attrs.keys()) == [packed_meta_data]
+        else:
+            assert packed_meta_data not in dset.attrs
+
+        # a fresh node must restore the meta data from either layout
+        reader = H5FileNode(name="test", parent=None, group=h5f)
+        assert reader._read_meta_data(dset) == meta
+        data_field = reader.read_primitive_data(dset)
+        assert data_field.value == 42
+        assert data_field.meta == meta
+
+
+def test_members_are_cached(local_tmp: Path) -> None:
+    """
+    test that the members of a node's group are enumerated once and that
+    subsequently created datasets and groups are added to the cache
+
+    Args:
+        local_tmp (Path): temporary test directory
+    """
+    tmpfile = local_tmp / "members.h5"
+
+    with h5py.File(tmpfile, "w") as h5f:
+        h5f.create_group("group1")
+        h5f.create_dataset("dataset1", data=1)
+        node = H5FileNode(name="test", parent=None, group=h5f)
+
+        # members are opened once and reused
+        members = node._members()
+        assert sorted(members.keys()) == ["dataset1", "group1"]
+        assert isinstance(members["group1"], h5py.Group)
+        assert isinstance(members["dataset1"], h5py.Dataset)
+        assert node._members() is members
+
+        # child nodes are created only once
+        assert node.list_children()[0] is node.list_children()[0]
+
+        # newly written members are visible without enumerating the group again
+        meta = MetaData(
+            name="child2", python_type=saveable, role=attribute, element_type=none_type
+        )
+        node.create_child_node(meta)
+        node._create_dataset("dataset2", 2, dtype=None, meta=meta)
+        assert sorted(members.keys()) == ["child2", "dataset1", "dataset2", "group1"]
+        assert sorted(child.name for child in node.list_children()) == [
+            "child2",
+            "group1",
+        ]
+
+
+def test_write_stream(local_tmp: Path) -> None:
+    """
+    test that streams are written into resizable, chunked datasets
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "dataset.h5"
+    meta = MetaData("list", attribute, "samples", "float")
+    stream = Stream((i / 2 for i in range(1000)), float, chunk_size=128)
+
+    with h5py.File(tmpfile, "w") as h5f:
+        node = H5FileNode(name="test", parent=None, group=h5f)
+        node.write_data(DataField(meta=meta, value=stream))
+
+    with h5py.File(tmpfile, "r") as h5f:
+        dset = h5f["samples"]
+        assert dset.maxshape == (None,)
+        assert dset.chunks == (128,)
+        assert dset.dtype == np.float64
+        assert dset[:].tolist() == [i / 2 for i in range(1000)]
+
+
+def test_iter_selected_attributes(local_tmp: Path) -> None:
+    """
+    test that selected datasets are looked up by name without opening the
+    other members of the group
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "dataset.h5"
+    with h5py.File(tmpfile, "w") as h5f:
+        node = H5FileNode(name="test", parent=None, group=h5f)
+        node.write_data(DataField(MetaData("int", attribute, "a", "int"), 1))
+        node.write_data(DataField(MetaData("int", attribute, "b", "int"), 2))
+        node.write_data(DataField(MetaData("dict", attribute, "c", "none_type"), {}))
+
+    with h5py.File(tmpfile, "r") as h5f:
+        node = H5FileNode(name="test", parent=None, group=h5f)
+        selection = FieldSelection.create(["b", "c", "missing"])
+        names = [dset.name for dset, _ in node.iter_attributes(selection)]
+        assert names == ["/b", "/__c___keys", "/__c___values"]
+        assert node._members_cache is None
+
+        # patterns are matched against the names of the links
+        selection = FieldSelection.create(["*"], exclude=["a"])
+        names = [dset.name for dset, _ in node.iter_attributes(selection)]
+        assert sorted(names) == ["/__c___keys", "/__c___values", "/b"]
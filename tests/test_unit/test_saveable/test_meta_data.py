@@ -0,0 +1,53 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from saveables.contracts.constants import attribute, dict_keys
+from saveables.saveable.data_field import DataField
+from saveables.saveable.meta_data import MetaData, get_meta_data
+from saveables.saveable.saveable import create_data_field
+
+
+def test_get_meta_data() -> None:
+    """
+    test that equal meta data are shared and that their strings are interned
+    """
+    meta = get_meta_data("list", attribute, "values", "int")
+    assert meta == MetaData("list", attribute, "values", "int")
+    # strings read from files are new objects
+    name_ = "".join(["val", "ues"])
+    assert get_meta_data("list", attribute, name_, "int") is meta
+    assert get_meta_data(
+        python_type="list", role=attribute, name=name_, element_type="int"
+    ) is meta
+    assert meta.name is get_meta_data("int", attribute, name_, "int").name
+
+    # data fields of attributes with the same name share their meta data
+    assert create_data_field("values", [1]).meta is meta
+
+    with pytest.raises(ValueError):
+        get_meta_data("dict", attribute, "values", "int")
+    assert get_meta_data("dict", dict_keys, "values", "int").role == dict_keys
+
+
+def test_meta_data_is_immutable() -> None:
+    """
+    test that meta data can neither be changed nor hold other attributes, and
+    that they are hashable and shared when they are copied
+    """
+    meta = get_meta_data("int", attribute, "number", "int")
+    with pytest.raises(FrozenInstanceError):
+        meta.name = "other"
+    assert not hasattr(meta, "__dict__")
+    assert {meta: 1}[MetaData("int", attribute, "number", "int")] == 1
+    assert pickle.loads(pickle.dumps(meta)) is meta
+    assert copy.deepcopy(meta) is meta
+
+
+def test_data_field_has_slots() -> None:
+    data_field = DataField(get_meta_data("int", attribute, "number", "int"), 1)
+    assert not hasattr(data_field, "__dict__")
+    data_field.value = 2
+    assert data_field.value == 2
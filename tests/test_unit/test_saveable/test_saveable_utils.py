@@ -1,11 +1,15 @@
 from typing import Any
 
 import pytest
+from resources.data import (HoldsNestedData, NestedLevel1, dicts, experiment,
+                            nested0)
 
 from saveables.contracts.constants import element_type, name, python_type, role
 from saveables.contracts.data_type import (EmptyIterable,
                                            supported_primitive_data_types,
                                            tIterableDataType)
+from saveables.saveable.saveable import (Saveable, create_data_field,
+                                         validate)
 from saveables.saveable.utils import (get_element_type, is_simple_dictionary,
                                       is_simple_iterable,
                                       is_supported_primitive,
@@ -87,3 +91,56 @@ def test_is_suppported_primitive() -> None:
 def test_list_meta_data_attributes() -> None:
     attr_names = list_meta_data_attributes()
     assert attr_names == [python_type, role, name, element_type]
+
+
+@pytest.mark.parametrize(
+    "value, python_type_, element_type_",
+    [
+        (1, "int", "int"),
+        (None, "none_type", "none_type"),
+        ([1, 2], "list", "int"),
+        ({"1"}, "set", "str"),
+        ((), "tuple", "empty_iterable"),
+        ({1: "a"}, "dict", "none_type"),
+    ],
+)
+def test_create_data_field(value: Any, python_type_: str, element_type_: str) -> None:
+    data_field = create_data_field("value", value)
+    assert data_field.meta.python_type == python_type_
+    assert data_field.meta.element_type == element_type_
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [([1, "2"], ValueError), ([object()], TypeError), (object(), TypeError)],
+)
+def test_create_data_field_unsupported(value: Any, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        create_data_field("value", value)
+
+
+def test_create_data_field_without_validation() -> None:
+    # the elements are trusted to have the type of the first one
+    data_field = create_data_field("value", [1, "2"], validate=False)
+    assert data_field.meta.element_type == "int"
+
+
+@pytest.mark.parametrize("obj", [nested0, dicts, experiment])
+def test_validate(obj: Saveable) -> None:
+    validate(obj)
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        ([1, "2"], ValueError),
+        ([[1]], TypeError),
+        ({1: "a", "b": "c"}, ValueError),
+        ({1: [1]}, TypeError),
+        (object(), TypeError),
+    ],
+)
+def test_validate_invalid(value: Any, error: type[Exception]) -> None:
+    # invalid data of child saveables are found as well
+    with pytest.raises(error):
+        validate(HoldsNestedData(nested=NestedLevel1(lst_=value)))
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from saveables.contracts.constants import attribute
+from saveables.saveable.meta_data import MetaData
+from saveables.saveable.saveable import Saveable
+from saveables.saveable.stream import Stream
+
+
+@dataclass
+class HoldsStream(Saveable):  # type: ignore[misc]
+    samples: Any = field(default_factory=list)
+
+
+def test_iter_chunks() -> None:
+    stream = Stream((i for i in range(10)), int, chunk_size=4)
+    assert list(stream.iter_chunks()) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    # generators are consumed once
+    assert list(stream.iter_chunks()) == []
+
+
+@pytest.mark.parametrize(
+    "source, element_type",
+    [
+        ([1, 2.0], int),
+        ([True, False], int),
+        ([1, 0], bool),
+        (["a", 1], str),
+    ],
+)
+def test_iter_chunks_element_type(source: list[Any], element_type: type) -> None:
+    with pytest.raises(TypeError):
+        list(Stream(source, element_type).iter_chunks())
+
+
+def test_invalid_stream() -> None:
+    with pytest.raises(TypeError):
+        Stream([], list)
+    with pytest.raises(ValueError):
+        Stream([], int, chunk_size=0)
+
+
+def test_iter_fields() -> None:
+    stream = Stream(iter([0.5]), float)
+    (data_field,) = HoldsStream(samples=stream).iter_fields()
+    assert data_field.meta == MetaData("list", attribute, "samples", "float")
+    assert data_field.value is stream
@@ -0,0 +1,240 @@
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from saveables.contracts.constants import dict_values, read_mode, write_mode
+from saveables.saveable.meta_data import MetaData
+from saveables.saveable.saveable import Saveable
+import saveables.sqlite3_format.sqlite3_blob
+from saveables.sqlite3_format.sqlite3_blob import (is_packable, pack_chunks,
+                                                   unpack_chunk, write_blob)
+from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.sqlite3_format.sqlite3_filenode import Sqlite3FileNode
+
+# packed iterables are written through Connection.blobopen
+requires_blob_io = pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="Connection.blobopen requires python 3.11"
+)
+
+
+@dataclass
+class HoldsNumbers(Saveable):  # type: ignore[misc]
+    ints: list[int] = field(default_factory=list)
+    floats: tuple[float, ...] = field(default_factory=tuple)
+    flags: list[bool] = field(default_factory=list)
+    weights: dict[str, float] = field(default_factory=dict)
+
+
+numbers = HoldsNumbers(
+    ints=list(range(-500, 500)),
+    floats=tuple(i * 0.25 for i in range(1000)),
+    flags=[i % 3 == 0 for i in range(1000)],
+    weights={f"w{i}": i * 0.5 for i in range(100)},
+)
+
+
+def write_numbers(path: Path) -> None:
+    """
+    write numbers with packed iterables
+
+    Args:
+        path (Path): path of sqlite3 file
+    """
+    with Sqlite3File(path, write_mode, pack_iterables=True) as f:
+        f.save(numbers)
+
+
+@pytest.mark.parametrize(
+    "values, type_literal",
+    [
+        ([1, -2, 2**62], "int"),
+        ([0.5, -1.25, 1e300], "float"),
+        ([True, False, True], "bool"),
+    ],
+)
+def test_pack_unpack(values: list[Any], type_literal: Any) -> None:
+    chunks = list(pack_chunks(iter(values), type_literal, chunk_size=8))
+    assert all(len(chunk) <= 8 for chunk in chunks)
+    unpacked = [el for chunk in chunks for el in unpack_chunk(chunk, type_literal)]
+    assert unpacked == values
+
+
+def test_pack_invalid() -> None:
+    with pytest.raises(ValueError):
+        list(pack_chunks([2**64], "int", chunk_size=64))
+    with pytest.raises(ValueError):
+        list(pack_chunks(["a"], "str", chunk_size=64))
+
+
+def test_is_packable() -> None:
+    assert is_packable([1, 2], int)
+    assert is_packable((0.5,), float)
+    assert is_packable({True}, bool)
+    assert not is_packable([], int)
+    assert not is_packable(["a"], str)
+    assert not is_packable([2**63], int)
+
+
+@requires_blob_io
+def test_packed_rows(local_tmp: Path) -> None:
+    """
+    test that each packed iterable is stored in a single row as BLOB
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_numbers(path)
+
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT typeof(data), length(data) FROM root").fetchall()
+    conn.close()
+
+    # string keys of the dictionary are not packed
+    blob_sizes = sorted(size for type_, size in rows if type_ == "blob")
+    assert blob_sizes == [100 * 8, 1000, 1000 * 8, 1000 * 8]
+    assert len([type_ for type_, _ in rows if type_ == "text"]) == 100
+
+
+@requires_blob_io
+def test_open_packed(local_tmp: Path) -> None:
+    """
+    test incremental reading of packed iterables
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_numbers(path)
+
+    with Sqlite3File(path, read_mode) as f:
+        assert isinstance(f.root, Sqlite3FileNode)
+        blob = f.root.open_packed("ints")
+        assert len(blob) == len(numbers.ints)
+        assert blob.nbytes == 8 * len(numbers.ints)
+
+        # chunks hold whole elements and never exceed the chunk size
+        chunks = list(blob.iter_chunks(chunk_size=100))
+        assert all(len(chunk) <= 100 and len(chunk) % 8 == 0 for chunk in chunks)
+        assert list(blob) == numbers.ints
+
+        # read into preallocated buffers
+        array = np.empty(len(blob), dtype="<i8")
+        assert blob.readinto(array, chunk_size=64) == blob.nbytes
+        assert array.tolist() == numbers.ints
+        buffer = bytearray(blob.nbytes)
+        blob.readinto(buffer)
+        assert bytes(buffer) == b"".join(chunks)
+        with pytest.raises(ValueError):
+            blob.readinto(bytearray(blob.nbytes - 1))
+
+        flags = np.empty(len(numbers.flags), dtype=bool)
+        f.root.open_packed("flags").readinto(flags)
+        assert flags.tolist() == numbers.flags
+
+        values = f.root.open_packed("weights", role=dict_values)
+        assert list(values) == list(numbers.weights.values())
+
+        with pytest.raises(ValueError):
+            f.root.open_packed("missing")
+
+
+@requires_blob_io
+def test_open_packed_without_blob_io(
+    local_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    test that packed iterables are read at once by python versions that cannot
+    read BLOBs incrementally
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        monkeypatch (pytest.MonkeyPatch): fixture to disable incremental reads
+    """
+    path = local_tmp / "test.sqlite3"
+    write_numbers(path)
+    monkeypatch.setattr(
+        saveables.sqlite3_format.sqlite3_blob, "supports_blob_io", False
+    )
+
+    with Sqlite3File(path, read_mode) as f:
+        assert isinstance(f.root, Sqlite3FileNode)
+        blob = f.root.open_packed("ints")
+        assert blob.nbytes == 8 * len(numbers.ints)
+        chunks = list(blob.iter_chunks(chunk_size=100))
+        assert all(len(chunk) <= 100 and len(chunk) % 8 == 0 for chunk in chunks)
+        assert list(blob) == numbers.ints
+
+    loaded = HoldsNumbers()
+    with Sqlite3File(path, read_mode) as f:
+        f.load(loaded)
+    assert loaded == numbers
+
+
+def test_pack_iterables_without_blob_io(
+    local_tmp: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    test that iterables cannot be packed by python versions that cannot write
+    BLOBs incrementally
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        monkeypatch (pytest.MonkeyPatch): fixture to disable incremental writes
+    """
+    monkeypatch.setattr(Sqlite3File, "supports_blob_io", False)
+    with pytest.raises(ValueError):
+        Sqlite3File(local_tmp / "test.sqlite3", write_mode, pack_iterables=True)
+    Sqlite3File(local_tmp / "test.sqlite3", write_mode)
+
+
+@requires_blob_io
+def test_write_packed_generator(local_tmp: Path) -> None:
+    """
+    test that packed iterables can be written from a generator
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    n_elements = 10_000
+    meta = MetaData("list", "attribute", "ints", "int")
+    with Sqlite3File(path, write_mode) as f:
+        assert isinstance(f.root, Sqlite3FileNode)
+        f.root.write_packed(meta, (i * 2 for i in range(n_elements)), n_elements)
+
+    loaded = HoldsNumbers()
+    with Sqlite3File(path, read_mode) as f:
+        f.load(loaded)
+    assert loaded.ints == [i * 2 for i in range(n_elements)]
+
+    # number of elements must match
+    with Sqlite3File(local_tmp / "mismatch.sqlite3", write_mode) as f:
+        assert isinstance(f.root, Sqlite3FileNode)
+        with pytest.raises(ValueError):
+            f.root.write_packed(meta, iter(range(3)), 4)
+
+
+@requires_blob_io
+def test_write_blob_size(local_tmp: Path) -> None:
+    """
+    test that write_blob checks the size of the payload
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, data TEXT)")
+    conn.execute("INSERT INTO test (data) VALUES (zeroblob(4))")
+    write_blob(conn, "test", 1, [b"ab", b"cd"])
+    assert conn.execute("SELECT data FROM test").fetchone() == (b"abcd",)
+    with pytest.raises(ValueError):
+        write_blob(conn, "test", 1, [b"abcde"])
+    with pytest.raises(ValueError):
+        write_blob(conn, "test", 1, [b"abc"])
+    conn.close()
@@ -1,3 +1,5 @@
+import pytest
+
 from saveables.contracts.constants import (column_name_data, column_name_id,
                                            column_name_meta_data,
                                            column_name_object_id,
@@ -6,8 +8,10 @@ from saveables.contracts.constants import (column_name_data, column_name_id,
                                            meta_data_table_name)
 from saveables.saveable.utils import list_meta_data_attributes
 from saveables.sqlite3_format.sqlite3_commands import (
-    get_first_row_of_table, insert_primitive_data, insert_saveable_data,
-    select_meta_data, select_python_attributes_from_table, select_row_id,
+    SqlCommand, command_cache_size, create_meta_data_index, data_without_blobs,
+    get_first_row_of_table, insert_packed_data, insert_primitive_data,
+    insert_saveable_data, select_dictionary_elements, select_meta_data,
+    select_python_attributes_from_table, select_row_id,
     select_saveable_attributes_from_table, select_simple_iterable_elements)
 
 
@@ -64,9 +68,10 @@ def test_select_meta_data() -> None:
 def test_select_python_attributes_from_table() -> None:
     cmd = select_python_attributes_from_table("test_table")
     assert cmd.command.strip() == (
-        f"SELECT {column_name_data}, {column_name_meta_data} FROM test_table "
+        f"SELECT {data_without_blobs}, {column_name_meta_data} FROM test_table "
         f"WHERE {column_name_object_id} = ? AND {column_name_reference} IS NULL AND "
-        f"{column_name_reference_id} IS NULL"
+        f"{column_name_reference_id} IS NULL GROUP BY {column_name_meta_data} "
+        f"ORDER BY min({column_name_id})"
     )
     assert cmd.columns == [column_name_data, column_name_meta_data]
 
@@ -84,13 +89,61 @@ def test_select_saveable_attributes_from_table() -> None:
 def test_select_simple_iterable_elements() -> None:
     cmd = select_simple_iterable_elements("test_table")
     assert cmd.command.strip() == (
-        f"SELECT {column_name_data} FROM test_table WHERE "
-        f"{column_name_meta_data} = ? AND {column_name_object_id} = ?"
+        f"SELECT {column_name_id}, {data_without_blobs} FROM test_table WHERE "
+        f"{column_name_meta_data} = ? AND {column_name_object_id} = ? "
+        f"ORDER BY {column_name_id}"
+    )
+    assert cmd.columns == [column_name_id, column_name_data]
+
+
+def test_select_dictionary_elements() -> None:
+    cmd = select_dictionary_elements("test_table")
+    assert cmd.command.strip() == (
+        f"SELECT {column_name_meta_data}, {column_name_id}, {data_without_blobs} "
+        f"FROM test_table WHERE {column_name_object_id} = ? AND "
+        f"{column_name_meta_data} IN (?, ?) "
+        f"ORDER BY {column_name_meta_data}, {column_name_id}"
     )
-    assert cmd.columns == ["data"]
+    assert cmd.columns == [column_name_meta_data, column_name_id, column_name_data]
 
 
 def test_get_first_row_of_table() -> None:
     cmd = get_first_row_of_table("test_table", ["column_a", "column_b"])
     assert cmd.command.strip() == ("SELECT column_a, column_b FROM test_table LIMIT 1")
     assert cmd.columns == ["column_a", "column_b"]
+
+
+def test_create_meta_data_index() -> None:
+    cmd = create_meta_data_index()
+    assert cmd.command.strip() == (
+        f"CREATE INDEX IF NOT EXISTS {meta_data_table_name}_values "
+        f"ON {meta_data_table_name} ({', '.join(list_meta_data_attributes())})"
+    )
+
+
+def test_get_column_index() -> None:
+    cmd = SqlCommand("SELECT column_a, column_b FROM test_table", ["a", "b"])
+    assert cmd.get_column_index("a") == 0
+    assert cmd.get_column_index("b") == 1
+    with pytest.raises(ValueError):
+        cmd.get_column_index("c")
+
+
+def test_commands_are_cached() -> None:
+    assert insert_primitive_data("table_a") is insert_primitive_data("table_a")
+    assert insert_primitive_data("table_a") is not insert_primitive_data("table_b")
+    assert select_meta_data() is select_meta_data()
+    assert select_row_id("table_a", ["column_a"]) is select_row_id(
+        "table_a", ["column_a"]
+    )
+    # table names are taken from the data, so commands per table are bounded
+    assert insert_primitive_data.cache_info().maxsize == command_cache_size
+
+
+def test_insert_packed_data() -> None:
+    cmd = insert_packed_data("test_table")
+    columns = [column_name_object_id, column_name_data, column_name_meta_data]
+    assert cmd.command.strip() == (
+        f"INSERT INTO test_table ({', '.join(columns)}) VALUES (?, zeroblob(?), ?)"
+    )
+    assert cmd.columns == columns
@@ -0,0 +1,134 @@
+import sqlite3
+from pathlib import Path
+
+from resources.data import HoldsNestedData, nested0
+
+from saveables.contracts.constants import (column_name_object_id,
+                                           meta_data_table_name, name,
+                                           nodes_table_name, read_mode,
+                                           values_table_name, write_mode)
+from saveables.sqlite3_format.sqlite3_consolidated_filenode import (
+    Sqlite3ConsolidatedFileNode, Sqlite3Tree)
+from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+
+
+def write_nested(path: Path) -> None:
+    """
+    write nested test data into a file with consolidated layout
+
+    Args:
+        path (Path): path of sqlite3 file
+    """
+    with Sqlite3File(path, write_mode, layout="consolidated") as f:
+        f.save(nested0)
+
+
+def test_consolidated_tables(local_tmp: Path) -> None:
+    """
+    test that a file with consolidated layout has a fixed set of tables, no
+    matter how many attribute names are saved
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_nested(path)
+
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = {row[0] for row in rows} - {"sqlite_sequence"}
+    conn.close()
+    assert tables == {meta_data_table_name, nodes_table_name, values_table_name}
+
+
+def test_consolidated_tree(local_tmp: Path) -> None:
+    """
+    test that the tree of a consolidated file holds the rows grouped by node
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_nested(path)
+
+    conn = sqlite3.connect(path)
+    tree = Sqlite3Tree.read(conn.cursor())
+    conn.close()
+
+    # each element list starts with the row that represents the attribute
+    for object_id, rows in tree.attribute_rows.items():
+        for data, meta_data_id in rows:
+            assert tree.elements[(object_id, meta_data_id)][0][1] == data
+            assert meta_data_id in tree.meta_data_rows
+
+    # every child node is a node with values or children itself
+    child_ids = [
+        child_id for children in tree.children.values() for _, child_id in children
+    ]
+    assert len(child_ids) > 0
+    for child_id in child_ids:
+        assert child_id in tree.attribute_rows or child_id in tree.children
+
+
+def test_consolidated_load_queries(local_tmp: Path) -> None:
+    """
+    test that a file with consolidated layout is loaded with one query per
+    table, and that its rows are selected by object id if only some of its
+    attributes are read
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_nested(path)
+
+    statements: list[str] = []
+    loaded = HoldsNestedData()
+    with Sqlite3File(path, read_mode) as f:
+        assert isinstance(f.root, Sqlite3ConsolidatedFileNode)
+        assert f.conn is not None
+        f.conn.set_trace_callback(statements.append)
+        f.load(loaded)
+
+    assert loaded == nested0
+    assert len(statements) == 3
+    assert all("WHERE" not in statement for statement in statements)
+
+    # the whole file is not read for single attributes or selected fields
+    for read in (
+        lambda f: f.get("nested.nested.lst_"),
+        lambda f: f.load(HoldsNestedData(), fields=["nested.str_"]),
+        lambda f: f.load_as_dict(exclude=["nested"]),
+    ):
+        statements.clear()
+        with Sqlite3File(path, read_mode) as f:
+            assert f.conn is not None
+            f.conn.set_trace_callback(statements.append)
+            read(f)
+        assert any(column_name_object_id in statement for statement in statements)
+        assert all("WHERE" in statement for statement in statements)
+
+
+def test_consolidated_iter_elements(local_tmp: Path) -> None:
+    """
+    test that the elements of a simple iterable are streamed from the tree and
+    from the values table alike
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_nested(path)
+
+    with Sqlite3File(path, read_mode) as f:
+        node = f.root
+        assert isinstance(node, Sqlite3ConsolidatedFileNode)
+        meta_data_ids = {
+            filedata.meta_data_kwargs[name]: filedata.meta_data_id
+            for filedata, _ in node
+        }
+        selected = list(node._iter_elements(meta_data_ids["lst_"], "str", 1))
+        node.read_tree()
+        streamed = node._iter_elements(meta_data_ids["lst_"], "str", 1)
+        assert next(streamed) == nested0.lst_[0]
+        assert [selected[0], *streamed] == selected == nested0.lst_
@@ -1,7 +1,9 @@
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
+from resources.data import HoldsNestedData, duplicates, nested0
 
 from saveables.contracts.constants import (attribute, column_name_data,
                                            column_name_meta_data,
@@ -10,10 +12,13 @@ from saveables.contracts.constants import (attribute, column_name_data,
                                            python_type, read_mode, role, root,
                                            write_mode)
 from saveables.contracts.data_type import python_type_literal_map
+from saveables.saveable.saveable import Saveable
 from saveables.sqlite3_format.sqlite3_commands import (
     create_meta_data_table, create_saveables_object_table, insert_meta_data,
     insert_primitive_data, table_exists)
 from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.sqlite3_format.sqlite3_profile import (Sqlite3Profile,
+                                                      fast_bulk_profile)
 
 
 def test_open_to_write(local_tmp: Path) -> None:
@@ -133,3 +138,136 @@ def test_open_to_read_fails(local_tmp: Path) -> None:
     # open the database for reading
     with pytest.raises(ValueError):
         sqlite_file._open_to_read()
+
+
+def test_open_to_read_missing_file(local_tmp: Path) -> None:
+    """
+    test that reading a file that does not exist raises an error and does not
+    create the file
+
+    Args:
+        local_tmp (Path): path for test data base
+    """
+    db_path = local_tmp / "missing.sqlite3"
+    with pytest.raises(sqlite3.OperationalError):
+        with Sqlite3File(db_path, mode=read_mode):
+            pass
+    assert not db_path.exists()
+
+
+def test_profile_pragmas(local_tmp: Path) -> None:
+    """
+    test that the pragmas of a profile are applied when writing and that only
+    connection related pragmas are applied when reading
+
+    Args:
+        local_tmp (Path): path for test data base
+    """
+    db_path = local_tmp / "test_db_profile.sqlite3"
+    sqlite_file = Sqlite3File(db_path, mode=write_mode, profile=fast_bulk_profile)
+    sqlite_file._open_to_write()
+    assert sqlite_file.conn is not None
+    assert sqlite_file.conn.execute("PRAGMA page_size").fetchone()[0] == 65536
+    assert sqlite_file.conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert sqlite_file.conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    sqlite_file.conn.close()
+
+    read_pragmas = [cmd.command for cmd in fast_bulk_profile.pragmas(read_only=True)]
+    assert read_pragmas == [
+        "PRAGMA cache_size = -262144",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA mmap_size = 268435456",
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"journal_mode": "WAL; DROP TABLE root"}, {"page_size": "4096"}],
+)
+def test_profile_invalid_values(kwargs: dict[str, str]) -> None:
+    """
+    test that invalid pragma values are rejected
+
+    Args:
+        kwargs (dict[str, str]): invalid profile arguments
+    """
+    with pytest.raises(ValueError):
+        Sqlite3Profile(**kwargs)  # type: ignore[arg-type]
+
+
+def test_save_rolls_back_on_error(local_tmp: Path) -> None:
+    """
+    test that a failing save leaves no rows in the database
+
+    Args:
+        local_tmp (Path): path for test data base
+    """
+
+    @dataclass
+    class Unsupported(Saveable):  # type: ignore[misc]
+        int_: int = 1
+        obj_: object = None
+
+    db_path = local_tmp / "test_db_rollback.sqlite3"
+    with Sqlite3File(db_path, mode=write_mode) as f:
+        with pytest.raises(TypeError):
+            f.save(Unsupported(obj_=object()))
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute(f"SELECT COUNT(*) FROM {root}").fetchone()[0] == 0
+    cmd = f"SELECT COUNT(*) FROM {meta_data_table_name}"
+    assert conn.execute(cmd).fetchone()[0] == 0
+    conn.close()
+
+
+def test_load_selected_fields_queries(local_tmp: Path) -> None:
+    """
+    test that only the rows of selected attributes are read and that child nodes
+    that are not selected are skipped
+
+    Args:
+        local_tmp (Path): path for test data base
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, write_mode) as f:
+        f.save(nested0)
+
+    statements: list[str] = []
+    loaded = HoldsNestedData()
+    with Sqlite3File(path, read_mode) as f:
+        assert f.conn is not None
+        f.conn.set_trace_callback(statements.append)
+        f.load(loaded, fields=["lst_"])
+
+    assert loaded == HoldsNestedData(lst_=nested0.lst_)
+    assert any(" name IN ('lst_')" in statement for statement in statements)
+    assert not any("nested" in statement for statement in statements)
+
+
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_save_deduplicated(local_tmp: Path, deduplicate: bool) -> None:
+    """
+    test that the rows of duplicate saveables are written once and referenced
+    by their object id
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+        deduplicate (bool): write duplicates as references
+    """
+    path = local_tmp / "test.sqlite3"
+    with Sqlite3File(path, write_mode, deduplicate=deduplicate) as f:
+        f.save(duplicates)
+
+    conn = sqlite3.connect(path)
+    n_objects = conn.execute(
+        "SELECT COUNT(DISTINCT object_id) FROM calibration"
+    ).fetchone()[0]
+    reference_ids = [
+        conn.execute(
+            f"SELECT reference_id FROM {table} WHERE reference = 'calibration'"
+        ).fetchone()[0]
+        for table in ("first", "second", "third")
+    ]
+    conn.close()
+    assert n_objects == (1 if deduplicate else 3)
+    assert (len(set(reference_ids)) == 1) == deduplicate
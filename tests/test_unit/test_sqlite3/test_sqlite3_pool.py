@@ -0,0 +1,152 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from resources.data import HoldsPrimitives, primitives
+
+from saveables.contracts.constants import read_mode, write_mode
+from saveables.sqlite3_format.sqlite3_file import Sqlite3File
+from saveables.sqlite3_format.sqlite3_pool import (Sqlite3ConnectionPool,
+                                                   read_only_uri)
+from saveables.sqlite3_format.sqlite3_profile import default_profile
+
+
+def write_primitives(path: Path) -> None:
+    """
+    write test data into a new sqlite3 file
+
+    Args:
+        path (Path): path of sqlite3 file
+    """
+    if path.exists():
+        path.unlink()
+    with Sqlite3File(path, write_mode) as f:
+        f.save(primitives)
+
+
+def test_read_only_uri(local_tmp: Path) -> None:
+    """
+    test that connections opened with the uri cannot write
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_primitives(path)
+
+    uri = read_only_uri(path)
+    assert uri.startswith("file:") and uri.endswith("?mode=ro&immutable=1")
+
+    conn = sqlite3.connect(uri, uri=True)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("CREATE TABLE test (id INTEGER)")
+    conn.close()
+
+
+def test_pool_reuses_connections(local_tmp: Path) -> None:
+    """
+    test that released connections are reused and that a file is validated only
+    once
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_primitives(path)
+
+    n_validations = 0
+
+    def validate(cursor: sqlite3.Cursor) -> str:
+        nonlocal n_validations
+        n_validations += 1
+        return "root_id"
+
+    pool = Sqlite3ConnectionPool()
+    first = pool.acquire(path, default_profile, validate)
+    second = pool.acquire(path, default_profile, validate)
+    assert first.connection is not second.connection
+    assert first.root_object_id == second.root_object_id == "root_id"
+    pool.release(first)
+    pool.release(second)
+
+    third = pool.acquire(path, default_profile, validate)
+    assert third.connection in (first.connection, second.connection)
+    assert n_validations == 1
+    pool.release(third)
+    pool.clear()
+
+
+def test_pool_discards_rewritten_files(local_tmp: Path) -> None:
+    """
+    test that files are validated again and connections are not reused after a
+    file has been rewritten
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_primitives(path)
+
+    pool = Sqlite3ConnectionPool()
+    with Sqlite3File(path, read_mode, pool=pool) as f:
+        first_root = f.root
+        first_conn = f.conn
+
+    write_primitives(path)
+    with Sqlite3File(path, read_mode, pool=pool) as f:
+        assert f.conn is not first_conn
+        assert f.root is not None and first_root is not None
+        assert f.root._object_id != first_root._object_id  # type: ignore[attr-defined] # noqa: E501
+        loaded = HoldsPrimitives()
+        f.load(loaded)
+    assert loaded == primitives
+    pool.clear()
+
+
+def test_pool_max_idle(local_tmp: Path) -> None:
+    """
+    test that the pool does not keep more than max_idle unused connections
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "test.sqlite3"
+    write_primitives(path)
+
+    pool = Sqlite3ConnectionPool(max_idle=1)
+    files = [Sqlite3File(path, read_mode, pool=pool) for _ in range(3)]
+    for f in files:
+        f.open()
+    for f in files:
+        f.close()
+    assert [len(entry.idle) for entry in pool._entries.values()] == [1]
+    pool.clear()
+    assert pool._entries == dict()
+
+
+def test_pool_invalid_file(local_tmp: Path) -> None:
+    """
+    test that a file that does not hold a saveable object is not pooled
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    path = local_tmp / "empty.sqlite3"
+    sqlite3.connect(path).close()
+
+    pool = Sqlite3ConnectionPool()
+    with pytest.raises(ValueError):
+        Sqlite3File(path, read_mode, pool=pool).open()
+    assert pool._entries == dict()
+
+
+def test_pool_write_mode(local_tmp: Path) -> None:
+    """
+    test that pools cannot be used to write files
+
+    Args:
+        local_tmp (Path): temporary directory for test data
+    """
+    pool = Sqlite3ConnectionPool()
+    with pytest.raises(ValueError):
+        Sqlite3File(local_tmp / "test.sqlite3", write_mode, pool=pool)
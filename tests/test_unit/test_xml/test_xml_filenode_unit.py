@@ -1,4 +1,5 @@
 import xml.etree.ElementTree as ET
+from dataclasses import asdict
 from pathlib import Path
 
 from saveables.contracts.constants import (attribute, name, none_type,
@@ -71,7 +72,7 @@ def test_write_primitive_data() -> None:
     assert el.text == str(data)
 
     # check that meta data is written correctly as attributes
-    for key, val in meta.__dict__.items():
+    for key, val in asdict(meta).items():
         assert el.attrib[key] == str(val)
 
 
@@ -1,6 +1,10 @@
 from pathlib import Path
 
-from saveables.contracts.constants import root, write_mode
+import pytest
+from resources.data import duplicates, experiment
+
+from saveables.contracts.constants import (read_mode, root, write_mode, xml_id,
+                                           xml_ref)
 from saveables.xml_format.xml_file import XmlFile
 from saveables.xml_format.xml_filenode import XmlFileNode
 
@@ -23,3 +27,81 @@ def test_xmlfile_open(local_tmp: Path) -> None:
     assert xmlfile.root.name == root
     assert xmlfile.root.parent is None
     assert xmlfile.root._element.tag == root
+
+
+@pytest.mark.parametrize(
+    "suffix, signature",
+    [
+        (".xml", b"<?xml"),
+        (".xml.gz", b"\x1f\x8b"),
+        (".xml.bz2", b"BZh"),
+        (".xml.xz", b"\xfd7zXZ"),
+        (".XML.GZ", b"\x1f\x8b"),
+        (".gz", b"<?xml"),
+        (".gz.xml", b"<?xml"),
+    ],
+)
+def test_xmlfile_compression(local_tmp: Path, suffix: str, signature: bytes) -> None:
+    """
+    test that xml files are compressed according to their suffix. Files are
+    only compressed if their names end with the full suffix of a codec
+
+    Args:
+        local_tmp (Path): temporary test directory
+        suffix (str): file name suffix
+        signature (bytes): expected first bytes of the file
+    """
+    tmpfile = local_tmp / f"test{suffix}"
+    with XmlFile(path=tmpfile, mode=write_mode, compression_level=1):
+        pass
+    assert tmpfile.read_bytes().startswith(signature)
+
+    with XmlFile(path=tmpfile, mode=read_mode) as xmlfile:
+        assert isinstance(xmlfile.root, XmlFileNode)
+        assert xmlfile.root._element.tag == root
+
+
+def test_xmlfile_deduplicate(local_tmp: Path) -> None:
+    """
+    test that duplicate saveables are written as elements that reference the
+    element of the data by its id
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test.xml"
+    with XmlFile(path=tmpfile, mode=write_mode, deduplicate=True) as f:
+        f.save(duplicates)
+        assert isinstance(f.root, XmlFileNode)
+        element = f.root._element
+
+    first = element.find("first")
+    third = element.find("third")
+    assert first is not None and third is not None
+    assert third.attrib[xml_ref] == first.attrib[xml_id]
+    assert len(third) == 0
+    calibration = element.find("second/calibration")
+    assert calibration is not None and xml_ref in calibration.attrib
+
+
+def test_xmlfile_shared_references(local_tmp: Path) -> None:
+    """
+    test that objects referenced more than once are written as elements that
+    reference the element of the object, even without deduplication
+
+    Args:
+        local_tmp (Path): temporary directory for test
+    """
+    tmpfile = local_tmp / "test.xml"
+    with XmlFile(path=tmpfile, mode=write_mode) as f:
+        f.save(experiment)
+        assert isinstance(f.root, XmlFileNode)
+        element = f.root._element
+
+    calibration = element.find("calibration")
+    reference = element.find("reference")
+    cycle = element.find("sample/experiment")
+    assert calibration is not None and reference is not None and cycle is not None
+    assert reference.attrib[xml_ref] == calibration.attrib[xml_id]
+    assert cycle.attrib[xml_ref] == element.attrib[xml_id]
+    assert len(reference) == 0 and len(cycle) == 0